@@ -0,0 +1,17 @@
+# Generated by Django 6.0.2 on 2026-10-17 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0034_a7_renommer_related_name_versions_enfants'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='page',
+            index=models.Index(condition=models.Q(('parent_page__isnull', True)), fields=['dossier'], name='page_racine_par_dossier_idx'),
+        ),
+    ]
@@ -1,3 +1,5 @@
+import hashlib
+
 from django.db import models
 from django.conf import settings
 from solo.models import SingletonModel
@@ -72,6 +74,37 @@ class Dossier(models.Model):
         ordering = ["name"]
 
 
+# Taille des tranches encodees pour le hash des longs textes (en caracteres)
+# / Slice size encoded when hashing long texts (in characters)
+TAILLE_TRANCHE_HASH_CARACTERES = 65536
+
+
+def calculer_content_hash(texte):
+    """Empreinte `content_hash` d'un texte brut (SHA-256 hex).
+
+    SHA-256 est un choix explicite, pas un defaut : l'extension calcule le meme
+    hash cote navigateur (crypto.subtle, qui ne propose pas BLAKE2b) et le serveur
+    deduplique en comparant les deux. Changer d'algorithme ici casserait la
+    detection de doublons et invaliderait les hash deja stockes.
+    / Explicit SHA-256 choice: the extension computes the same hash in the browser
+    / (crypto.subtle has no BLAKE2b) and the server dedups by comparing both.
+
+    Les longs textes sont encodes par tranches : pas de copie UTF-8 complete
+    en memoire. L'UTF-8 encodant chaque caractere independamment, le resultat
+    est identique a `sha256(texte.encode("utf-8"))`.
+    / Long texts are encoded slice by slice: no full UTF-8 copy in memory.
+    / UTF-8 encodes each character independently, so the digest is identical.
+    """
+    if len(texte) <= TAILLE_TRANCHE_HASH_CARACTERES:
+        return hashlib.sha256(texte.encode("utf-8")).hexdigest()
+
+    hasheur_contenu = hashlib.sha256()
+    for debut_tranche in range(0, len(texte), TAILLE_TRANCHE_HASH_CARACTERES):
+        tranche_texte = texte[debut_tranche:debut_tranche + TAILLE_TRANCHE_HASH_CARACTERES]
+        hasheur_contenu.update(tranche_texte.encode("utf-8"))
+    return hasheur_contenu.hexdigest()
+
+
 class Page(models.Model):
     """Représente une page web capturée par l'extension.
 
@@ -188,6 +221,18 @@ class Page(models.Model):
                 name="unique_url_si_presente",
             ),
         ]
+        indexes = [
+            # Arbre de dossiers : pages racines (hors versions/syntheses) par dossier.
+            # Index partiel qui correspond exactement au prefetch de _render_arbre
+            # (dossier_id IN (...) AND parent_page_id IS NULL).
+            # / Folder tree: root pages (excluding versions/syntheses) per folder.
+            # / Partial index matching the _render_arbre prefetch exactly.
+            models.Index(
+                fields=["dossier"],
+                condition=models.Q(parent_page__isnull=True),
+                name="page_racine_par_dossier_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.title if self.title else (self.url or self.original_filename or "Page sans titre")
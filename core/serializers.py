@@ -1,6 +1,6 @@
 from rest_framework import serializers
 
-from .models import Page, TextBlock
+from .models import Page, TextBlock, calculer_content_hash
 
 
 # --- BLOCS DE TEXTE / TEXT BLOCKS ---
@@ -64,7 +64,6 @@ class PageCreateSerializer(serializers.ModelSerializer):
         ]
 
     def create(self, validated_data):
-        import hashlib
         import logging
 
         from front.utils import extraire_texte_depuis_html
@@ -98,9 +97,7 @@ class PageCreateSerializer(serializers.ModelSerializer):
         # Calculer le hash du contenu pour detecter les modifications futures
         # / Compute content hash to detect future modifications
         texte_pour_hash = validated_data.get("text_readability", "")
-        validated_data["content_hash"] = hashlib.sha256(
-            texte_pour_hash.encode("utf-8")
-        ).hexdigest()
+        validated_data["content_hash"] = calculer_content_hash(texte_pour_hash)
 
         logger.debug(
             "PageCreateSerializer.create: content_hash=%s — creation Page en base",
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class FrontConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "front"
+
+    def ready(self):
+        # Import des signals pour les enregistrer / Import signals to register them
+        from . import signals  # noqa: F401
@@ -32,6 +32,13 @@ from hypostasis_extractor.models import (
 # / Wikipedia texts for the 3 authors (cleaned excerpts)
 # =============================================================================
 
+# Table de normalisation (apostrophe typographique, espace insecable) appliquee en
+# une seule passe par str.translate — caractere pour caractere, les positions sont conservees
+# / Normalization table (typographic apostrophe, non-breaking space) applied in a
+# / single str.translate pass — char for char, positions are preserved
+TABLE_NORMALISATION_RECHERCHE = str.maketrans({"\u2019": "'", "\u00a0": " "})
+
+
 TEXTE_OSTROM = """Elinor Ostrom, née le 7 août 1933 à Los Angeles et morte le 12 juin 2012 à Bloomington, est une politologue et économiste américaine. En octobre 2009, elle est la première femme à recevoir le « prix Nobel d'économie », avec Oliver Williamson, pour son analyse de la gouvernance économique, et en particulier, des biens communs.
 
 Ses travaux portent principalement sur la théorie de l'action collective et la gestion des biens communs ainsi que des biens publics, aussi bien matériels qu'immatériels. Elinor Ostrom a surtout travaillé sur la notion de dilemme social, c'est-à-dire les cas où la quête de l'intérêt personnel conduit à un résultat plus mauvais pour tous que celui résultant d'un autre type de comportement. Elle a surtout étudié la question du dilemme social dans le domaine des ressources communes : ressources hydrauliques, forêts, pêcheries, etc.
@@ -1182,6 +1189,9 @@ class Command(BaseCommand):
         )
 
         texte_page = page.text_readability or ""
+        # Version normalisee calculee une seule fois pour toutes les extractions
+        # / Normalized version computed once for all extractions
+        texte_page_norm = None
         nombre_entites_creees = 0
 
         for extraction_data in liste_extractions:
@@ -1193,13 +1203,13 @@ class Command(BaseCommand):
             # / Try exact, then normalize apostrophes
             start_char = texte_page.find(extraction_text)
             if start_char == -1:
-                texte_page_norm = texte_page.replace("\u2019", "'").replace("\u00a0", " ")
-                texte_norm = extraction_text.replace("\u2019", "'").replace("\u00a0", " ")
+                if texte_page_norm is None:
+                    texte_page_norm = texte_page.translate(TABLE_NORMALISATION_RECHERCHE)
+                texte_norm = extraction_text.translate(TABLE_NORMALISATION_RECHERCHE)
                 start_char = texte_page_norm.find(texte_norm)
             if start_char == -1:
                 # Chercher par prefixe (30 chars) / Search by prefix
-                prefixe = extraction_text[:30].replace("\u2019", "'").replace("\u00a0", " ")
-                texte_page_norm = texte_page.replace("\u2019", "'").replace("\u00a0", " ")
+                prefixe = extraction_text[:30].translate(TABLE_NORMALISATION_RECHERCHE)
                 start_char = texte_page_norm.find(prefixe)
 
             if start_char == -1:
@@ -7,12 +7,11 @@ Usage :
 """
 
 import json
-import hashlib
 import os
 
 from django.core.management.base import BaseCommand
 
-from core.models import Page, Dossier
+from core.models import Page, Dossier, calculer_content_hash
 from front.services.transcription_audio import construire_html_diarise
 
 
@@ -51,7 +50,7 @@ class Command(BaseCommand):
 
         # Calculer le hash du contenu pour la deduplication
         # / Compute content hash for deduplication
-        hash_contenu = hashlib.sha256(texte_brut.encode("utf-8")).hexdigest()
+        hash_contenu = calculer_content_hash(texte_brut)
 
         # Creer ou recuperer le dossier de demonstration
         # / Create or retrieve the demo folder
@@ -0,0 +1,66 @@
+"""
+Memo par requete des lectures de configuration de front/views.py
+(_get_configuration_ia, _get_analyseurs_actifs).
+Le memo est un dict porte par une ContextVar : chaque requete (donc chaque
+thread d'un worker gunicorn gthread) a le sien, cree a l'entree et jete a la
+sortie. Deux requetes concurrentes ne partagent ni ne vident jamais leurs
+valeurs. Hors requete (taches Celery, shell, tests directs), pas de memo :
+chaque appel relit la base.
+/ Per-request memo for front/views.py configuration reads
+/ (_get_configuration_ia, _get_analyseurs_actifs).
+/ The memo is a dict held by a ContextVar: each request (hence each thread of
+/ a gthread gunicorn worker) has its own, created on entry and dropped on
+/ exit. Two concurrent requests never share or clear each other's values.
+/ Outside a request (Celery tasks, shell, direct tests), no memo: every call
+/ reads the database again.
+
+LOCALISATION : front/middleware.py
+"""
+import contextvars
+
+
+# Memo de la requete en cours (None hors requete)
+# / Memo of the current request (None outside a request)
+memo_requete = contextvars.ContextVar("memo_requete_front", default=None)
+
+
+def lire_memo_requete(cle_memo, charger_valeur):
+    """
+    Retourne la valeur memorisee pour cle_memo dans la requete en cours, ou la
+    charge avec charger_valeur() et la memorise. Hors requete, charge a chaque appel.
+    / Returns the value memoized under cle_memo in the current request, or loads
+    / it with charger_valeur() and memoizes it. Outside a request, loads on every call.
+    """
+    memo = memo_requete.get()
+    if memo is None:
+        return charger_valeur()
+    if cle_memo not in memo:
+        memo[cle_memo] = charger_valeur()
+    return memo[cle_memo]
+
+
+def oublier_memo_requete(cle_memo):
+    """
+    Retire cle_memo du memo de la requete en cours (apres une ecriture du modele).
+    / Drops cle_memo from the current request's memo (after a model write).
+    """
+    memo = memo_requete.get()
+    if memo is not None:
+        memo.pop(cle_memo, None)
+
+
+class MemoParRequeteMiddleware:
+    """
+    Ouvre un memo vide pour chaque requete et le referme a la fin.
+    / Opens an empty memo for each request and closes it at the end.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        jeton_memo = memo_requete.set({})
+        try:
+            return self.get_response(request)
+        finally:
+            memo_requete.reset(jeton_memo)
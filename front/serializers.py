@@ -31,6 +31,20 @@ def est_fichier_audio(nom_fichier):
     return extension in EXTENSIONS_AUDIO_AUTORISEES
 
 
+# Documents dont la conversion (parsing PDF/Office) est lente : convertis par Celery
+# / Documents whose conversion (PDF/Office parsing) is slow: converted by Celery
+EXTENSIONS_CONVERSION_ASYNCHRONE = [".pdf", ".docx", ".pptx", ".xlsx"]
+
+
+def est_conversion_asynchrone(nom_fichier):
+    """
+    Verifie si un document doit etre converti en tache de fond d'apres son extension.
+    / Checks if a document must be converted in background based on its extension.
+    """
+    extension = os.path.splitext(nom_fichier)[1].lower()
+    return extension in EXTENSIONS_CONVERSION_ASYNCHRONE
+
+
 def est_fichier_json(nom_fichier):
     """
     Verifie si un fichier est un fichier JSON d'apres son extension.
@@ -11,8 +11,11 @@ Retourne des segments par locuteur avec timestamps.
 Returns per-speaker segments with timestamps.
 """
 
+import functools
 import logging
 import os
+import shutil
+import subprocess
 import time
 from html import escape as html_escape
 
@@ -217,12 +220,23 @@ def transcrire_audio_mock(chemin_fichier_audio, config_transcription, max_locute
     }
 
 
+@functools.lru_cache(maxsize=1)
+def _ffprobe_disponible():
+    """
+    True si ffprobe est dans le PATH (resolu une fois par processus).
+    / True if ffprobe is on the PATH (resolved once per process).
+    """
+    return shutil.which("ffprobe") is not None
+
+
 def calculer_duree_audio(chemin_fichier_audio):
     """
     Calcule la duree d'un fichier audio en secondes.
-    Essaie mutagen d'abord, puis ffprobe en fallback.
+    Essaie ffprobe d'abord (lecture ciblee de format=duration, un seul
+    sous-processus), puis mutagen en fallback si ffprobe est absent ou echoue.
     / Computes the duration of an audio file in seconds.
-    Tries mutagen first, then ffprobe as fallback.
+    Tries ffprobe first (targeted format=duration read, a single subprocess),
+    then mutagen as fallback if ffprobe is missing or fails.
 
     Args:
         chemin_fichier_audio: Chemin absolu vers le fichier audio (str)
@@ -230,39 +244,38 @@ def calculer_duree_audio(chemin_fichier_audio):
     Returns:
         float — duree en secondes (0.0 si impossible a determiner)
     """
+    # Tentative 1 : ffprobe (supporte tous les formats, ne lit que l'en-tete conteneur)
+    # / Attempt 1: ffprobe (supports all formats, only reads the container header)
+    if _ffprobe_disponible():
+        try:
+            resultat_ffprobe = subprocess.run(
+                [
+                    "ffprobe", "-v", "quiet",
+                    "-show_entries", "format=duration",
+                    "-of", "default=noprint_wrappers=1:nokey=1",
+                    chemin_fichier_audio,
+                ],
+                capture_output=True,
+                text=True,
+                timeout=5,
+            )
+            if resultat_ffprobe.returncode == 0 and resultat_ffprobe.stdout.strip():
+                duree_ffprobe = float(resultat_ffprobe.stdout.strip())
+                logger.debug("calculer_duree_audio: ffprobe OK — %.1fs", duree_ffprobe)
+                return duree_ffprobe
+        except (subprocess.TimeoutExpired, OSError, ValueError) as erreur_ffprobe:
+            logger.debug("calculer_duree_audio: ffprobe a echoue — %s", erreur_ffprobe)
+
+    # Tentative 2 : mutagen en fallback (pur Python, sans binaire externe)
+    # / Attempt 2: mutagen as fallback (pure Python, no external binary)
     import mutagen
-
-    # Tentative 1 : mutagen (rapide, supporte la plupart des formats)
-    # / Attempt 1: mutagen (fast, supports most formats)
     try:
         info_audio = mutagen.File(chemin_fichier_audio)
         if info_audio and info_audio.info and info_audio.info.length > 0:
             logger.debug("calculer_duree_audio: mutagen OK — %.1fs", info_audio.info.length)
             return info_audio.info.length
     except Exception as erreur_mutagen:
-        logger.debug("calculer_duree_audio: mutagen a echoue — %s", erreur_mutagen)
-
-    # Tentative 2 : ffprobe en fallback (supporte tous les formats)
-    # / Attempt 2: ffprobe as fallback (supports all formats)
-    import subprocess
-    try:
-        resultat_ffprobe = subprocess.run(
-            [
-                "ffprobe", "-v", "quiet",
-                "-show_entries", "format=duration",
-                "-of", "default=noprint_wrappers=1:nokey=1",
-                chemin_fichier_audio,
-            ],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if resultat_ffprobe.returncode == 0 and resultat_ffprobe.stdout.strip():
-            duree_ffprobe = float(resultat_ffprobe.stdout.strip())
-            logger.debug("calculer_duree_audio: ffprobe OK — %.1fs", duree_ffprobe)
-            return duree_ffprobe
-    except (subprocess.TimeoutExpired, FileNotFoundError, ValueError) as erreur_ffprobe:
-        logger.warning("calculer_duree_audio: ffprobe a echoue — %s", erreur_ffprobe)
+        logger.warning("calculer_duree_audio: mutagen a echoue — %s", erreur_mutagen)
 
     logger.warning("calculer_duree_audio: impossible de determiner la duree de %s", chemin_fichier_audio)
     return 0.0
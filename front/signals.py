@@ -0,0 +1,43 @@
+"""
+Signaux d'oubli des memos par requete de front/views.py (front/middleware.py).
+La Configuration singleton (_get_configuration_ia(), lue par _get_ia_active())
+est oubliee apres save/delete : la suite de la requete qui a fait le toggle
+relit la valeur a jour. Les autres requetes ont leur propre memo, relu a
+chaque requete : rien a vider pour elles.
+
+/ Signals forgetting front/views.py per-request memos (front/middleware.py).
+The Configuration singleton (_get_configuration_ia(), read by _get_ia_active())
+is forgotten after save/delete: the rest of the request that made the toggle
+reads the updated value. Other requests have their own memo, read again on
+every request: nothing to clear for them.
+
+Meme regle pour _get_analyseurs_actifs() avec AnalyseurSyntaxique.
+/ Same rule for _get_analyseurs_actifs() with AnalyseurSyntaxique.
+
+LOCALISATION : front/signals.py
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.models import Configuration
+from hypostasis_extractor.models import AnalyseurSyntaxique
+
+from .middleware import oublier_memo_requete
+
+
+@receiver([post_save, post_delete], sender=Configuration)
+def oublier_memo_configuration_ia(sender, **kwargs):
+    """
+    Oublie la configuration memorisee par _get_configuration_ia().
+    / Forgets the configuration memoized by _get_configuration_ia().
+    """
+    oublier_memo_requete("configuration_ia")
+
+
+@receiver([post_save, post_delete], sender=AnalyseurSyntaxique)
+def oublier_memo_analyseurs_actifs(sender, **kwargs):
+    """
+    Oublie les analyseurs memorises par _get_analyseurs_actifs().
+    / Forgets the analyzers memoized by _get_analyseurs_actifs().
+    """
+    oublier_memo_requete("analyseurs_actifs")
@@ -272,7 +272,9 @@
                         headers: { 'Content-Type': 'application/json', 'X-CSRFToken': extraireTokenCsrf() },
                         body: JSON.stringify({ dossier_id: resultat.value || null }),
                     }).then(function(reponseClassement) {
-                        if (reponseClassement.ok) {
+                        // 204 : page deja dans ce dossier, arbre inchange
+                        // / 204: page already in this folder, tree unchanged
+                        if (reponseClassement.ok && reponseClassement.status !== 204) {
                             reponseClassement.text().then(function(html) {
                                 var arbreEl = document.getElementById('arbre');
                                 arbreEl.innerHTML = html;
@@ -102,7 +102,9 @@ document.addEventListener('click', async function(e) {
         body: JSON.stringify({dossier_id: dossierId || null}),
     });
 
-    if (classerResp.ok) {
+    // 204 : page deja dans ce dossier, l'arbre affiche est inchange
+    // / 204: page already in this folder, the displayed tree is unchanged
+    if (classerResp.ok && classerResp.status !== 204) {
         const arbreEl = document.getElementById('arbre');
         arbreEl.innerHTML = await classerResp.text();
         htmx.process(arbreEl);
@@ -246,10 +248,20 @@ document.getElementById('input-import-fichier').addEventListener('change', funct
                 if (urlACTuelle) {
                     history.pushState({}, '', urlACTuelle);
                 }
-                Swal.fire({
-                    toast: true, position: 'top-end', icon: 'success',
-                    title: 'Fichier import\u00e9', showConfirmButton: false, timer: 2500,
-                });
+                // Le toast vient du header HX-Trigger du serveur : "Fichier importe"
+                // pour un import synchrone, "Conversion lancee..." pour un PDF/Office.
+                // / The toast comes from the server's HX-Trigger header: "Fichier importe"
+                // / for a synchronous import, "Conversion lancee..." for a PDF/Office file.
+                var declencheurHx = requeteUpload.getResponseHeader('HX-Trigger');
+                var detailToast = { message: 'Fichier import\u00e9' };
+                if (declencheurHx) {
+                    try {
+                        detailToast = JSON.parse(declencheurHx).showToast || detailToast;
+                    } catch (erreurJson) {
+                        console.warn('HX-Trigger import illisible', erreurJson);
+                    }
+                }
+                document.body.dispatchEvent(new CustomEvent('showToast', { detail: detailToast }));
             }
         } else {
             zoneLecture.innerHTML = requeteUpload.responseText;
@@ -1581,9 +1593,34 @@ document.addEventListener('click', async function(evenement) {
         console.log('[A.6] WebSocket taches : message recu', donneesMessage);
         if (donneesMessage.type === 'tache_terminee') {
             rafraichirBoutonTaches();
+            if (donneesMessage.tache_type === 'conversion') {
+                signalerFinConversion(donneesMessage);
+            }
         }
     });
 
+    // Fin d'une conversion de document (tache_id = pk de la Page) : toast de
+    // succes ou d'echec, arbre recharge (titre extrait du document) et, si la
+    // page est affichee, relecture immediate sans attendre le prochain polling.
+    // / End of a document conversion (tache_id = Page pk): success or failure
+    // / toast, tree reloaded (title extracted from the document) and, if the
+    // / page is displayed, immediate re-read without waiting for the next poll.
+    function signalerFinConversion(donneesMessage) {
+        var conversionReussie = donneesMessage.status === 'completed';
+        document.body.dispatchEvent(new CustomEvent('showToast', {
+            detail: conversionReussie
+                ? { message: 'Conversion termin\u00e9e' }
+                : { message: '\u00c9chec de la conversion du fichier', icon: 'error' },
+        }));
+        htmx.ajax('GET', '/arbre/', { target: '#arbre', swap: 'innerHTML' });
+        var attenteConversion = document.querySelector(
+            '#conversion-en-cours[data-page-id="' + donneesMessage.tache_id + '"]'
+        );
+        if (attenteConversion) {
+            htmx.trigger(attenteConversion, 'conversionTerminee');
+        }
+    }
+
     // Ecoute l'event HTMX 'tachesChanged' (envoye par le serveur via HX-Trigger
     // dans la reponse a /lire/{pk}/analyser/ et /lire/{pk}/synthetiser/).
     // Permet au bouton de passer immediatement a l'etat 'en_cours' au lancement
@@ -1,9 +1,8 @@
 """
-Taches Celery pour le traitement asynchrone (audio + analyse textuelle).
-/ Celery tasks for asynchronous processing (audio + text analysis).
+Taches Celery pour le traitement asynchrone (audio, conversion de documents, analyse textuelle).
+/ Celery tasks for asynchronous processing (audio, document conversion, text analysis).
 """
 
-import hashlib
 import logging
 import os
 import time
@@ -23,8 +22,8 @@ def notifier_tache_terminee(user_pk, tache_id, tache_type, status):
 
     Args:
         user_pk : pk du proprietaire de la tache
-        tache_id : pk du job (ExtractionJob ou TranscriptionJob)
-        tache_type : "analyse" | "synthese" | "transcription"
+        tache_id : pk du job (ExtractionJob ou TranscriptionJob), ou de la Page (conversion)
+        tache_type : "analyse" | "synthese" | "transcription" | "conversion"
         status : "completed" | "failed"
     """
     from channels.layers import get_channel_layer
@@ -557,7 +556,7 @@ def transcrire_audio_task(self, job_id, chemin_fichier_audio, max_locuteurs=5, l
     5. Met a jour le Job (raw_result, status, processing_time)
     6. Supprime le fichier audio temporaire
     """
-    from core.models import TranscriptionJob, TranscriptionJobStatus, PageStatus
+    from core.models import TranscriptionJob, TranscriptionJobStatus, PageStatus, calculer_content_hash
     from front.services.transcription_audio import (
         transcrire_audio_via_voxtral,
         transcrire_audio_mock,
@@ -611,7 +610,7 @@ def transcrire_audio_task(self, job_id, chemin_fichier_audio, max_locuteurs=5, l
         html_diarise, texte_brut = construire_html_diarise(segments_transcrits)
 
         # Calculer le hash du contenu / Compute content hash
-        hash_contenu = hashlib.sha256(texte_brut.encode("utf-8")).hexdigest()
+        hash_contenu = calculer_content_hash(texte_brut)
 
         # Stocker le dict complet (model + text + segments) dans transcription_raw
         # / Store the full dict (model + text + segments) in transcription_raw
@@ -693,6 +692,109 @@ def transcrire_audio_task(self, job_id, chemin_fichier_audio, max_locuteurs=5, l
                 )
 
 
+@shared_task(bind=True)
+def convertir_document_task(self, page_id, chemin_fichier_document, nom_fichier, garder_titre=False):
+    """
+    Tache Celery : convertit un document (PDF, DOCX, PPTX, XLSX) en HTML + texte
+    et met a jour la Page creee en "processing" par l'import.
+    / Celery task: converts a document (PDF, DOCX, PPTX, XLSX) to HTML + text
+    and updates the Page created as "processing" by the import.
+
+    1. Convertit le fichier temporaire via convertir_fichier_en_html
+    2. Met a jour la Page (html, texte, content_hash, titre si non saisi, status)
+    3. Notifie le navigateur (succes ou erreur)
+    4. Supprime le fichier temporaire
+    """
+    from django.core.files import File
+
+    from core.models import Page, PageStatus, calculer_content_hash
+    from front.services.conversion_fichiers import convertir_fichier_en_html
+
+    # Le fichier temporaire est supprime sur toutes les sorties, y compris
+    # quand la Page a disparu entre l'import et l'execution de la tache.
+    # / The temporary file is deleted on every exit, including when the
+    # / Page vanished between the import and the task run.
+    try:
+        page_importee = Page.objects.filter(pk=page_id).first()
+        if page_importee is None:
+            logger.error("convertir_document_task: page_id=%s introuvable", page_id)
+            return
+
+        logger.info(
+            "convertir_document_task: demarrage page=%s fichier=%s",
+            page_id, chemin_fichier_document,
+        )
+
+        try:
+            with open(chemin_fichier_document, "rb") as fichier_binaire:
+                html_readability, text_readability, titre_extrait = convertir_fichier_en_html(
+                    File(fichier_binaire, name=nom_fichier), nom_fichier,
+                )
+
+            page_importee.html_original = html_readability
+            page_importee.html_readability = html_readability
+            page_importee.text_readability = text_readability
+            page_importee.content_hash = calculer_content_hash(text_readability)
+            page_importee.status = PageStatus.COMPLETED
+            champs_a_mettre_a_jour = [
+                "html_original", "html_readability", "text_readability",
+                "content_hash", "status",
+            ]
+            if not garder_titre:
+                page_importee.title = titre_extrait
+                champs_a_mettre_a_jour.append("title")
+            page_importee.save(update_fields=champs_a_mettre_a_jour)
+
+            logger.info(
+                "convertir_document_task: termine page=%s (%d chars HTML)",
+                page_id, len(html_readability),
+            )
+
+            # Notifier le navigateur que la tache est terminee (succes)
+            # / Notify the browser that the task is complete (success)
+            notifier_tache_terminee(
+                user_pk=page_importee.owner_id,
+                tache_id=page_importee.pk,
+                tache_type="conversion",
+                status="completed",
+            )
+
+        except Exception as erreur_conversion:
+            # En cas d'erreur, marquer la page en erreur
+            # / On error, mark the page as error
+            logger.error(
+                "convertir_document_task: erreur page=%s — %s",
+                page_id, erreur_conversion, exc_info=True,
+            )
+            page_importee.status = PageStatus.ERROR
+            page_importee.error_message = str(erreur_conversion)[:1000]
+            page_importee.html_readability = (
+                '<p class="text-sm text-red-500">Erreur lors de la conversion du fichier.</p>'
+            )
+            page_importee.save(update_fields=["status", "error_message", "html_readability"])
+
+            # Notifier le navigateur que la tache est terminee (erreur)
+            # / Notify the browser that the task is complete (error)
+            notifier_tache_terminee(
+                user_pk=page_importee.owner_id,
+                tache_id=page_importee.pk,
+                tache_type="conversion",
+                status="failed",
+            )
+
+    finally:
+        # Supprimer le fichier temporaire (qu'il y ait eu erreur ou non)
+        # / Delete the temporary file (whether there was an error or not)
+        if os.path.exists(chemin_fichier_document):
+            try:
+                os.unlink(chemin_fichier_document)
+            except OSError as erreur_suppression:
+                logger.warning(
+                    "convertir_document_task: impossible de supprimer %s — %s",
+                    chemin_fichier_document, erreur_suppression,
+                )
+
+
 def _construire_prompt_synthese(page, dernier_job_analyse, analyseur_synthese):
     """
     Construit le prompt utilisateur pour la synthese deliberative.
@@ -704,7 +806,8 @@ def _construire_prompt_synthese(page, dernier_job_analyse, analyseur_synthese):
     Sections depend on the analyzer's bool flags.
     At least one of the two must be active (validation done upstream).
     """
-    from django.db.models import Case, Value, When
+    from django.db.models import Case, Q, StringAgg, TextField, Value, When
+    from django.db.models.functions import Coalesce, Concat
     from hypostasis_extractor.models import ExtractedEntity
 
     sections_du_prompt = []
@@ -721,14 +824,32 @@ def _construire_prompt_synthese(page, dernier_job_analyse, analyseur_synthese):
     # / HYPOSTASES block — extractions + comments if analyzer requests it AND analysis job exists.
     # / If no job, block is omitted silently (preview synthesis case).
     if analyseur_synthese.inclure_extractions and dernier_job_analyse is not None:
-        # Recuperer les entites du dernier job d'analyse, exclure non_pertinent et masquees
-        # / Get entities from latest analysis job, exclude non_pertinent and hidden
+        # Recuperer les entites du dernier job d'analyse, exclure non_pertinent et masquees.
+        # Les lignes de commentaires sont agregees cote base (StringAgg) dans le meme
+        # SELECT : pas de chargement des commentaires et auteurs en objets Python.
+        # / Get entities from latest analysis job, exclude non_pertinent and hidden.
+        # / Comment lines are aggregated DB-side (StringAgg) in the same SELECT:
+        # / comments and authors are not loaded as Python objects.
         entites_du_job = ExtractedEntity.objects.filter(
             job=dernier_job_analyse,
             masquee=False,
         ).exclude(
             statut_debat="non_pertinent",
-        ).prefetch_related("commentaires__user").order_by(
+        ).annotate(
+            lignes_commentaires_agregees=StringAgg(
+                Concat(
+                    Value("  - "),
+                    Coalesce("commentaires__user__username", Value("Anonyme")),
+                    Value(' : "'),
+                    "commentaires__commentaire",
+                    Value('"'),
+                    output_field=TextField(),
+                ),
+                delimiter=Value("\n"),
+                filter=Q(commentaires__isnull=False),
+                order_by="commentaires__created_at",
+            ),
+        ).order_by(
             Case(
                 When(statut_debat="consensuel", then=Value(0)),
                 When(statut_debat="discutable", then=Value(1)),
@@ -758,12 +879,9 @@ def _construire_prompt_synthese(page, dernier_job_analyse, analyseur_synthese):
             # Resume a afficher / Summary to display
             resume_affiche = resume_ia or texte_citation[:80]
 
-            # Commentaires de chaque participant au debat
-            # / Each participant's debate comments
-            lignes_commentaires = []
-            for commentaire in entite.commentaires.all():
-                nom_auteur = commentaire.user.username if commentaire.user else "Anonyme"
-                lignes_commentaires.append(f'  - {nom_auteur} : "{commentaire.commentaire}"')
+            # Commentaires de chaque participant au debat (deja formates par StringAgg)
+            # / Each participant's debate comments (already formatted by StringAgg)
+            lignes_commentaires = entite.lignes_commentaires_agregees or ""
 
             # Assemblage du bloc / Block assembly
             bloc = f'**[{statut_affiche}] {classe_hypostase} — {resume_affiche}**\n'
@@ -771,7 +889,7 @@ def _construire_prompt_synthese(page, dernier_job_analyse, analyseur_synthese):
             if resume_ia:
                 bloc += f'Résumé IA : "{resume_ia}"\n'
             if lignes_commentaires:
-                bloc += "Commentaires :\n" + "\n".join(lignes_commentaires) + "\n"
+                bloc += "Commentaires :\n" + lignes_commentaires + "\n"
 
             blocs_entites.append(bloc)
 
@@ -814,7 +932,7 @@ def synthetiser_page_task(self, job_id):
     Builds a prompt from text + hypostases + comments,
     calls the LLM, and creates a child Page (new version).
     """
-    from core.models import Configuration, Page
+    from core.models import Configuration, Page, calculer_content_hash
     from hypostasis_extractor.models import (
         AnalyseurSyntaxique, ExtractionJob, PromptPiece,
     )
@@ -916,7 +1034,7 @@ def synthetiser_page_task(self, job_id):
         # Creer la Page enfant (nouvelle version) / Create child Page (new version)
         page_racine = page_source.page_racine
         prochain_numero = page_racine.versions_enfants.count() + 2
-        hash_contenu = hashlib.sha256(texte_brut.encode("utf-8")).hexdigest()
+        hash_contenu = calculer_content_hash(texte_brut)
 
         # Le label de version reprend le nom de l'analyseur de synthese utilise.
         # Permet de distinguer V2 — Mathemagique de V3 — Charte (memes types,
@@ -0,0 +1,504 @@
+"""
+Tests de non-regression des optimisations de performance du front.
+/ Non-regression tests for front performance optimisations.
+
+Lancer avec : uv run python manage.py test front.tests.test_optimisations_perf -v2
+/ Run with:    uv run python manage.py test front.tests.test_optimisations_perf -v2
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache, caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.http import QueryDict
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from core.models import Page, TAILLE_TRANCHE_HASH_CARACTERES, TranscriptionJob, calculer_content_hash
+from front.tasks import convertir_document_task
+from front.middleware import memo_requete
+from hypostasis_extractor.models import AnalyseurSyntaxique
+from front.utils import annoter_html_avec_barres
+from front.views import (
+    HX_TRIGGER_CONVERSION_LANCEE, HX_TRIGGER_CONVERSION_NON_LANCEE,
+    SEUIL_CARACTERES_CACHE_HTML_ANNOTE,
+    SEUIL_CARACTERES_COMPTE_TOKENS_EXACT,
+    _annoter_html_memorise, _compter_tokens_par_lot, _get_analyseurs_actifs,
+    _lire_attributs_dynamiques, _trouver_texte_espaces_souples,
+)
+
+
+# =============================================================================
+# Lecture des attributs dynamiques attr_key_N / attr_val_N
+# / Reading dynamic attr_key_N / attr_val_N attributes
+# =============================================================================
+
+
+class LireAttributsDynamiquesTest(SimpleTestCase):
+    """Verifie le parsing en un seul passage des champs attr_key_N / attr_val_N.
+    / Verify single-pass parsing of attr_key_N / attr_val_N fields."""
+
+    def test_paires_completes_dans_l_ordre_des_index(self):
+        """Les paires sont retournees dans l'ordre des index, pas de l'envoi."""
+        donnees_formulaire = QueryDict(mutable=True)
+        donnees_formulaire["attr_key_1"] = "hypostase"
+        donnees_formulaire["attr_val_1"] = "probleme"
+        donnees_formulaire["attr_key_0"] = "résumé"
+        donnees_formulaire["attr_val_0"] = "  un resume  "
+        attributs = _lire_attributs_dynamiques(donnees_formulaire)
+        self.assertEqual(list(attributs.items()), [
+            ("résumé", "un resume"),
+            ("hypostase", "probleme"),
+        ])
+
+    def test_paires_incompletes_ignorees(self):
+        """Une cle sans valeur (ou l'inverse) n'est pas retenue."""
+        attributs = _lire_attributs_dynamiques({
+            "attr_key_0": "résumé",
+            "attr_val_0": "",
+            "attr_val_1": "orpheline",
+            "text": "pas un attribut",
+        })
+        self.assertEqual(attributs, {})
+
+    def test_plus_de_dix_attributs(self):
+        """Aucune borne fixe sur le nombre d'attributs lus."""
+        donnees_formulaire = {}
+        for index_attribut in range(12):
+            donnees_formulaire[f"attr_key_{index_attribut}"] = f"cle{index_attribut}"
+            donnees_formulaire[f"attr_val_{index_attribut}"] = f"valeur{index_attribut}"
+        attributs = _lire_attributs_dynamiques(donnees_formulaire)
+        self.assertEqual(len(attributs), 12)
+        self.assertEqual(attributs["cle11"], "valeur11")
+
+    def test_attr_count_borne_la_lecture(self):
+        """Avec attr_count, seuls les N premiers index sont lus."""
+        attributs = _lire_attributs_dynamiques({
+            "attr_count": "1",
+            "attr_key_0": "résumé",
+            "attr_val_0": "un resume",
+            "attr_key_1": "hypostase",
+            "attr_val_1": "probleme",
+        })
+        self.assertEqual(attributs, {"résumé": "un resume"})
+
+    def test_attr_count_demesure_borne_par_les_champs(self):
+        """Un attr_count enorme ne sonde pas plus d'index que de champs envoyes."""
+        donnees_formulaire = QueryDict(mutable=True)
+        donnees_formulaire["attr_count"] = str(10 ** 12)
+        donnees_formulaire["attr_key_0"] = "résumé"
+        donnees_formulaire["attr_val_0"] = "un resume"
+        attributs = _lire_attributs_dynamiques(donnees_formulaire)
+        self.assertEqual(attributs, {"résumé": "un resume"})
+
+
+# =============================================================================
+# Recherche souple espace / espace insecable
+# / Soft space / non-breaking space search
+# =============================================================================
+
+
+class TrouverTexteEspacesSouplesTest(SimpleTestCase):
+    """Verifie la recherche nbsp == espace sans copie normalisee.
+    / Verify nbsp == space search without a normalized copy."""
+
+    def test_nbsp_dans_le_source(self):
+        """Un espace recherche trouve un espace insecable du source."""
+        position = _trouver_texte_espaces_souples("Il dit\xa0: bonjour.", "dit : bonjour")
+        self.assertEqual(position, 3)
+
+    def test_caracteres_speciaux_regex_echappes(self):
+        """Les caracteres speciaux du texte sont cherches litteralement."""
+        position = _trouver_texte_espaces_souples("a (b) c.* d", "(b) c.*")
+        self.assertEqual(position, 2)
+
+    def test_texte_absent(self):
+        """Retourne -1 quand le texte est introuvable."""
+        self.assertEqual(_trouver_texte_espaces_souples("abc", "x y"), -1)
+
+    def test_correspondance_exacte_prioritaire(self):
+        """Une occurrence exacte est preferee a une occurrence souple anterieure."""
+        self.assertEqual(_trouver_texte_espaces_souples("a\xa0b, a b", "a b"), 5)
+
+    def test_texte_sans_separateur_absent(self):
+        """Sans espace dans le texte cherche, l'absence exacte suffit."""
+        self.assertEqual(_trouver_texte_espaces_souples("a\xa0b", "ab"), -1)
+
+
+# =============================================================================
+# Annotation HTML : court-circuit sans entites
+# / HTML annotation: short-circuit without entities
+# =============================================================================
+
+
+class AnnoterHtmlSansEntitesTest(SimpleTestCase):
+    """Verifie que l'annotation ne parse pas le HTML quand il n'y a rien a annoter.
+    / Verify annotation does not parse HTML when there is nothing to annotate."""
+
+    def test_liste_vide_retourne_le_html_tel_quel(self):
+        """Sans entite, le HTML d'entree est retourne (meme objet, pas de copie)."""
+        html_readability = "<p>Un texte sans extraction.</p>"
+        html_annote = annoter_html_avec_barres(html_readability, "Un texte sans extraction.", [])
+        self.assertIs(html_annote, html_readability)
+
+
+class AnnoterHtmlMemoriseTest(SimpleTestCase):
+    """Verifie que le HTML annote est relu dans le cache tant que rien ne change.
+    / Verify annotated HTML is read back from the cache while nothing changes."""
+
+    def setUp(self):
+        caches["html_annote"].clear()
+        patcher = patch("front.views.annoter_html_avec_barres", return_value="<p>annote</p>")
+        self.annoter_factice = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _entite(self, statut_debat="discutable"):
+        return SimpleNamespace(
+            pk=1, start_char=0, end_char=5, extraction_text="texte", statut_debat=statut_debat,
+        )
+
+    def test_second_rendu_sans_re_annotation(self):
+        """Meme HTML et memes entites : une seule annotation."""
+        for _ in range(2):
+            html_annote = _annoter_html_memorise("<p>texte</p>", [self._entite()], set())
+        self.assertEqual(html_annote, "<p>annote</p>")
+        self.assertEqual(self.annoter_factice.call_count, 1)
+
+    def test_entite_modifiee_re_annote(self):
+        """Un changement de statut ou de commentaire change la cle."""
+        _annoter_html_memorise("<p>texte</p>", [self._entite()], set())
+        _annoter_html_memorise("<p>texte</p>", [self._entite("consensuel")], set())
+        _annoter_html_memorise("<p>texte</p>", [self._entite("consensuel")], {1})
+        self.assertEqual(self.annoter_factice.call_count, 3)
+
+    def test_html_volumineux_non_memorise(self):
+        """Au-dela du seuil, l'annotation est refaite et rien n'est stocke."""
+        html_volumineux = "<p>" + "a" * SEUIL_CARACTERES_CACHE_HTML_ANNOTE + "</p>"
+        for _ in range(2):
+            _annoter_html_memorise(html_volumineux, [self._entite()], set())
+        self.assertEqual(self.annoter_factice.call_count, 2)
+
+
+# =============================================================================
+# Comptage de tokens memorise
+# / Memoized token counting
+# =============================================================================
+
+
+class EncodeurFactice:
+    """Encodeur minimal : un token par mot, compte les appels.
+    / Minimal encoder: one token per word, counts calls."""
+
+    def __init__(self):
+        self.textes_encodes = []
+
+    def encode_ordinary_batch(self, liste_textes):
+        self.textes_encodes.extend(liste_textes)
+        return [texte.split() for texte in liste_textes]
+
+
+class CompterTokensParLotTest(SimpleTestCase):
+    """Verifie que les comptes de tokens sont relus dans le cache Django.
+    / Verify token counts are read back from the Django cache."""
+
+    def setUp(self):
+        cache.clear()
+        self.encodeur_factice = EncodeurFactice()
+        patcher = patch("front.views._encodeur_tokens_cl100k", return_value=self.encodeur_factice)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_comptes_dans_l_ordre_et_texte_vide(self):
+        """Un texte vide compte 0 token sans passer par l'encodeur."""
+        nombres_tokens = _compter_tokens_par_lot(["un deux trois", "", "quatre"])
+        self.assertEqual(nombres_tokens, [3, 0, 1])
+        self.assertEqual(self.encodeur_factice.textes_encodes, ["un deux trois", "quatre"])
+
+    def test_second_appel_sans_re_encodage(self):
+        """Un texte deja compte n'est pas re-encode."""
+        _compter_tokens_par_lot(["prompt statique", "texte A"])
+        nombres_tokens = _compter_tokens_par_lot(["prompt statique", "texte B de page"])
+        self.assertEqual(nombres_tokens, [2, 4])
+        self.assertEqual(
+            self.encodeur_factice.textes_encodes,
+            ["prompt statique", "texte A", "texte B de page"],
+        )
+
+    def test_texte_enorme_estime_sans_encodeur(self):
+        """Au-dela du seuil, le compte est estime a len // 4 sans tokenisation."""
+        texte_enorme = "a" * (SEUIL_CARACTERES_COMPTE_TOKENS_EXACT + 4)
+        nombres_tokens = _compter_tokens_par_lot(["court", texte_enorme])
+        self.assertEqual(nombres_tokens, [1, len(texte_enorme) // 4])
+        self.assertEqual(self.encodeur_factice.textes_encodes, ["court"])
+
+
+# =============================================================================
+# content_hash encode par tranches
+# / content_hash encoded slice by slice
+# =============================================================================
+
+
+class CalculerContentHashTest(SimpleTestCase):
+    """Verifie que le hash par tranches reste le SHA-256 attendu par l'extension.
+    / Verify slice hashing stays the SHA-256 the extension expects."""
+
+    def test_texte_long_multi_octets(self):
+        """Un texte multi-tranches avec accents et emoji donne le meme digest."""
+        texte_long = "é€😀 a" * (TAILLE_TRANCHE_HASH_CARACTERES // 2)
+        self.assertEqual(
+            calculer_content_hash(texte_long),
+            hashlib.sha256(texte_long.encode("utf-8")).hexdigest(),
+        )
+
+    def test_texte_vide(self):
+        """Le texte vide donne le SHA-256 de la chaine vide."""
+        self.assertEqual(calculer_content_hash(""), hashlib.sha256(b"").hexdigest())
+
+
+# =============================================================================
+# Import PDF/Office : conversion Celery
+# / PDF/Office import: Celery conversion
+# =============================================================================
+
+
+class ImportDocumentAsynchroneTest(TestCase):
+    """Verifie l'import d'un PDF converti par convertir_document_task (tache mockee).
+    / Verify the import of a PDF converted by convertir_document_task (mocked task)."""
+
+    def setUp(self):
+        self.dossier_temporaire = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dossier_temporaire.cleanup)
+        chemin_temporaire = Path(self.dossier_temporaire.name)
+        reglages_temporaires = override_settings(
+            MEDIA_ROOT=chemin_temporaire / "media",
+            IMPORT_TEMP_DIR=chemin_temporaire,
+        )
+        reglages_temporaires.enable()
+        self.addCleanup(reglages_temporaires.disable)
+
+        self.utilisateur = User.objects.create_user(username="importeur", password="test1234")
+        self.client.login(username="importeur", password="test1234")
+
+    @patch("front.tasks.convertir_document_task.delay")
+    def test_import_pdf_renvoie_l_attente_de_conversion(self, mock_delay):
+        """La reponse remplit la zone de lecture avec l'attente qui interroge la page."""
+        reponse = self.client.post("/import/fichier/", {
+            "fichier": SimpleUploadedFile("rapport.pdf", b"%PDF-1.4 factice", "application/pdf"),
+        })
+        self.assertEqual(reponse.status_code, 200)
+
+        page_importee = Page.objects.get(original_filename="rapport.pdf")
+        self.assertEqual(page_importee.status, "processing")
+        self.assertEqual(page_importee.owner, self.utilisateur)
+
+        contenu = reponse.content.decode()
+        self.assertIn('data-testid="conversion-en-cours"', contenu)
+        self.assertIn(f'hx-get="/lire/{page_importee.pk}/"', contenu)
+        self.assertIn('hx-swap-oob="innerHTML:#arbre"', contenu)
+        self.assertEqual(reponse["HX-Trigger"], HX_TRIGGER_CONVERSION_LANCEE)
+        self.assertEqual(reponse["X-Hypostasia-Page-Url"], f"/lire/{page_importee.pk}/")
+
+        # La tache recoit la page et un fichier temporaire bien ecrit sur disque
+        # / The task receives the page and a temp file actually written to disk
+        mock_delay.assert_called_once()
+        arguments_tache = mock_delay.call_args.args
+        self.assertEqual(arguments_tache[0], page_importee.pk)
+        self.assertTrue(arguments_tache[1].startswith(self.dossier_temporaire.name))
+        with open(arguments_tache[1], "rb") as fichier_temporaire:
+            self.assertEqual(fichier_temporaire.read(), b"%PDF-1.4 factice")
+        self.assertEqual(mock_delay.call_args.kwargs, {"garder_titre": False})
+
+    @patch("front.tasks.convertir_document_task.delay")
+    def test_titre_saisi_conserve(self, mock_delay):
+        """Un titre saisi est garde comme titre de la page et transmis a la tache."""
+        self.client.post("/import/fichier/", {
+            "fichier": SimpleUploadedFile("notes.docx", b"docx factice"),
+            "titre": "Mon titre",
+        })
+        self.assertEqual(Page.objects.get(original_filename="notes.docx").title, "Mon titre")
+        self.assertEqual(mock_delay.call_args.kwargs, {"garder_titre": True})
+
+    @patch("front.tasks.convertir_document_task.delay", side_effect=ConnectionError("broker injoignable"))
+    def test_broker_indisponible_passe_la_page_en_erreur(self, mock_delay):
+        """Si la tache ne peut pas etre mise en file, la page passe en erreur avec un toast d'erreur."""
+        reponse = self.client.post("/import/fichier/", {
+            "fichier": SimpleUploadedFile("rapport.pdf", b"%PDF-1.4 factice", "application/pdf"),
+        })
+        self.assertEqual(reponse.status_code, 200)
+        self.assertEqual(reponse["HX-Trigger"], HX_TRIGGER_CONVERSION_NON_LANCEE)
+
+        page_importee = Page.objects.get(original_filename="rapport.pdf")
+        self.assertEqual(page_importee.status, "error")
+        self.assertTrue(page_importee.error_message)
+        self.assertIn('data-testid="conversion-erreur"', reponse.content.decode())
+
+        # Le fichier temporaire transmis a delay() a ete supprime
+        # / The temp file passed to delay() was deleted
+        self.assertFalse(os.path.exists(mock_delay.call_args.args[1]))
+
+    def test_lecture_page_en_conversion_continue_l_attente(self):
+        """Tant que la conversion tourne, la lecture renvoie l'attente (polling)."""
+        page_en_conversion = Page.objects.create(
+            source_type="file", original_filename="rapport.pdf", title="rapport",
+            html_readability="", text_readability="", status="processing",
+            owner=self.utilisateur,
+        )
+        reponse = self.client.get(f"/lire/{page_en_conversion.pk}/", HTTP_HX_REQUEST="true")
+        self.assertEqual(reponse.status_code, 200)
+        self.assertIn('data-testid="conversion-en-cours"', reponse.content.decode())
+
+    def test_lecture_page_en_erreur_affiche_l_erreur(self):
+        """Une conversion echouee affiche son message d'erreur, sans polling."""
+        page_en_erreur = Page.objects.create(
+            source_type="file", original_filename="casse.pdf", title="casse",
+            html_readability="", text_readability="", status="error",
+            error_message="PDF illisible", owner=self.utilisateur,
+        )
+        contenu = self.client.get(f"/lire/{page_en_erreur.pk}/", HTTP_HX_REQUEST="true").content.decode()
+        self.assertIn('data-testid="conversion-erreur"', contenu)
+        self.assertIn("PDF illisible", contenu)
+        self.assertNotIn('data-testid="conversion-en-cours"', contenu)
+
+    def test_tache_page_introuvable_supprime_le_fichier(self):
+        """Le fichier temporaire est supprime meme si la page a disparu."""
+        chemin_fichier = os.path.join(self.dossier_temporaire.name, "orphelin.pdf")
+        with open(chemin_fichier, "wb") as fichier_temporaire:
+            fichier_temporaire.write(b"%PDF")
+        convertir_document_task(999999, chemin_fichier, "orphelin.pdf")
+        self.assertFalse(os.path.exists(chemin_fichier))
+
+    def _creer_page_et_fichier_en_conversion(self, titre="rapport"):
+        """Page "processing" et son fichier temporaire, comme apres l'import.
+        / "processing" Page and its temp file, as after the import."""
+        page_en_conversion = Page.objects.create(
+            source_type="file", original_filename="rapport.pdf", title=titre,
+            html_readability="", text_readability="", status="processing",
+            owner=self.utilisateur,
+        )
+        chemin_fichier = os.path.join(self.dossier_temporaire.name, "rapport.pdf")
+        with open(chemin_fichier, "wb") as fichier_temporaire:
+            fichier_temporaire.write(b"%PDF-1.4 factice")
+        return page_en_conversion, chemin_fichier
+
+    @patch("front.tasks.notifier_tache_terminee")
+    @patch("front.services.conversion_fichiers.convertir_fichier_en_html")
+    def test_tache_enregistre_la_conversion(self, mock_convertir, mock_notifier):
+        """La tache remplit la page, passe en completed et supprime le fichier."""
+        mock_convertir.return_value = ("<p>Texte converti</p>", "Texte converti", "Titre extrait")
+        page_en_conversion, chemin_fichier = self._creer_page_et_fichier_en_conversion()
+
+        convertir_document_task(page_en_conversion.pk, chemin_fichier, "rapport.pdf")
+
+        page_en_conversion.refresh_from_db()
+        self.assertEqual(page_en_conversion.html_original, "<p>Texte converti</p>")
+        self.assertEqual(page_en_conversion.html_readability, "<p>Texte converti</p>")
+        self.assertEqual(page_en_conversion.text_readability, "Texte converti")
+        self.assertEqual(page_en_conversion.content_hash, calculer_content_hash("Texte converti"))
+        self.assertEqual(page_en_conversion.status, "completed")
+        self.assertEqual(page_en_conversion.title, "Titre extrait")
+        self.assertFalse(os.path.exists(chemin_fichier))
+        self.assertEqual(mock_notifier.call_args.kwargs["status"], "completed")
+
+    @patch("front.tasks.notifier_tache_terminee")
+    @patch("front.services.conversion_fichiers.convertir_fichier_en_html")
+    def test_tache_garde_le_titre_saisi(self, mock_convertir, mock_notifier):
+        """Avec garder_titre=True, le titre extrait ne remplace pas le titre saisi."""
+        mock_convertir.return_value = ("<p>Texte converti</p>", "Texte converti", "Titre extrait")
+        page_en_conversion, chemin_fichier = self._creer_page_et_fichier_en_conversion("Mon titre")
+
+        convertir_document_task(page_en_conversion.pk, chemin_fichier, "rapport.pdf", garder_titre=True)
+
+        page_en_conversion.refresh_from_db()
+        self.assertEqual(page_en_conversion.title, "Mon titre")
+        self.assertEqual(page_en_conversion.status, "completed")
+
+    @patch("front.tasks.notifier_tache_terminee")
+    @patch("front.services.conversion_fichiers.convertir_fichier_en_html")
+    def test_tache_erreur_de_conversion(self, mock_convertir, mock_notifier):
+        """Une exception de conversion passe la page en erreur et supprime le fichier."""
+        mock_convertir.side_effect = ValueError("PDF illisible")
+        page_en_conversion, chemin_fichier = self._creer_page_et_fichier_en_conversion()
+
+        convertir_document_task(page_en_conversion.pk, chemin_fichier, "rapport.pdf")
+
+        page_en_conversion.refresh_from_db()
+        self.assertEqual(page_en_conversion.status, "error")
+        self.assertEqual(page_en_conversion.error_message, "PDF illisible")
+        self.assertEqual(page_en_conversion.title, "rapport")
+        self.assertFalse(os.path.exists(chemin_fichier))
+        self.assertEqual(mock_notifier.call_args.kwargs["status"], "failed")
+
+
+# =============================================================================
+# Analyseurs actifs memorises : analyseur par defaut
+# / Memoized active analyzers: default analyzer
+# =============================================================================
+
+
+class AnalyseursActifsOrdreTest(TestCase):
+    """Verifie que l'analyseur par defaut [0] reste le dernier modifie (ancien .first()).
+    / Verify the default analyzer [0] stays the most recently updated (former .first())."""
+
+    def setUp(self):
+        self.analyseur_ancien = AnalyseurSyntaxique.objects.create(name="Ancien", type_analyseur="analyser")
+        self.analyseur_recent = AnalyseurSyntaxique.objects.create(name="Recent", type_analyseur="analyser")
+
+    def test_dernier_modifie_en_premier(self):
+        """Le plus recemment modifie est l'analyseur par defaut."""
+        self.assertEqual(_get_analyseurs_actifs()[0], self.analyseur_recent)
+
+    def test_modification_change_l_analyseur_par_defaut(self):
+        """Modifier l'ancien analyseur le repasse en tete (memo oublie par le signal)."""
+        jeton_memo = memo_requete.set({})
+        self.addCleanup(memo_requete.reset, jeton_memo)
+        _get_analyseurs_actifs()
+        self.analyseur_ancien.description = "Mis a jour"
+        self.analyseur_ancien.save()
+        self.assertEqual(
+            list(_get_analyseurs_actifs()), [self.analyseur_ancien, self.analyseur_recent],
+        )
+
+
+# =============================================================================
+# Import audio : identifiant Celery genere avant l'INSERT du job
+# / Audio import: Celery id generated before the job INSERT
+# =============================================================================
+
+
+class ImportAudioIdentifiantCeleryTest(TestCase):
+    """Verifie que le job enregistre l'identifiant passe a apply_async (tache mockee).
+    / Verify the job stores the id passed to apply_async (mocked task)."""
+
+    def setUp(self):
+        self.dossier_temporaire = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dossier_temporaire.cleanup)
+        chemin_temporaire = Path(self.dossier_temporaire.name)
+        reglages_temporaires = override_settings(
+            MEDIA_ROOT=chemin_temporaire / "media",
+            AUDIO_TEMP_DIR=chemin_temporaire,
+        )
+        reglages_temporaires.enable()
+        self.addCleanup(reglages_temporaires.disable)
+
+        User.objects.create_user(username="importeur_audio", password="test1234")
+        self.client.login(username="importeur_audio", password="test1234")
+
+    @patch("front.tasks.transcrire_audio_task.apply_async")
+    def test_job_cree_avec_l_identifiant_envoye_a_celery(self, mock_apply_async):
+        """Le celery_task_id du job est celui envoye a Celery, sans UPDATE apres coup."""
+        reponse = self.client.post("/import/fichier/", {
+            "fichier": SimpleUploadedFile("entretien.mp3", b"ID3 factice", "audio/mpeg"),
+        })
+        self.assertEqual(reponse.status_code, 200)
+
+        job_transcription = TranscriptionJob.objects.get(page__original_filename="entretien.mp3")
+        mock_apply_async.assert_called_once()
+        identifiant_envoye = mock_apply_async.call_args.kwargs["task_id"]
+        self.assertTrue(identifiant_envoye)
+        self.assertEqual(job_transcription.celery_task_id, identifiant_envoye)
+        self.assertEqual(mock_apply_async.call_args.kwargs["args"][0], job_transcription.pk)
@@ -283,10 +283,12 @@ class SynthetiserActionTest(TestCase):
     @patch("front.tasks.synthetiser_page_task.delay")
     def test_synthetiser_cree_job(self, mock_delay):
         """L'action cree un ExtractionJob en status pending avec est_synthese=True."""
-        reponse = self.client.post(
-            f"/lire/{self.fixtures['page_source'].pk}/synthetiser/",
-            HTTP_HX_REQUEST="true",
-        )
+        # La tache est mise en file au commit / The task is queued on commit
+        with self.captureOnCommitCallbacks(execute=True):
+            reponse = self.client.post(
+                f"/lire/{self.fixtures['page_source'].pk}/synthetiser/",
+                HTTP_HX_REQUEST="true",
+            )
         self.assertEqual(reponse.status_code, 200)
 
         job_cree = ExtractionJob.objects.filter(
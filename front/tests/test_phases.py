@@ -3825,7 +3825,7 @@ class Phase18bArbreTemplateTest(TestCase):
 
     def test_bouton_aligner_conditionne_par_count(self):
         """Le bouton aligner n'apparait que si >= 2 pages."""
-        self.assertIn("dossier.pages.count >= 2", self.contenu_template)
+        self.assertIn("dossier.nb_pages >= 2", self.contenu_template)
 
     def test_bouton_aligner_a_data_dossier_id(self):
         """Le bouton aligner porte le data-dossier-id."""
@@ -1,30 +1,50 @@
 import difflib
+import functools
 import hashlib
 import itertools
 import json
 import logging
 import os
+import re
+import secrets
+import shutil
 from datetime import datetime, timedelta
 
+from celery.utils import uuid as generer_identifiant_tache_celery
 from django.conf import settings
-from django.db.models import Case, Count, Prefetch, Value, When
+from django.core.cache import cache, caches
+from django.db.models import Case, Count, Exists, IntegerField, OuterRef, Prefetch, Subquery, Value, When, prefetch_related_objects
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.utils.html import escape, strip_tags
+from django.db import transaction
 from django.db.models import Q
 from django.http import FileResponse, HttpResponse, JsonResponse
 from django.shortcuts import redirect, render, get_object_or_404
-from django.template.loader import render_to_string
+from django.template.loader import get_template
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.vary import vary_on_headers
 from rest_framework import permissions, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from core.models import AIModel, Configuration, Dossier, DossierPartage, GroupeUtilisateurs, Invitation, Page, PageEdit, Question, ReponseQuestion, TranscriptionConfig, VisibiliteDossier
+from core.models import AIModel, Configuration, Dossier, DossierPartage, GroupeUtilisateurs, Invitation, Page, PageEdit, Question, ReponseQuestion, TranscriptionConfig, VisibiliteDossier, calculer_content_hash
+# Taches Celery importees une fois au chargement du module (front.tasks n'importe
+# pas front.views : pas d'import circulaire) / Celery tasks imported once at module
+# load (front.tasks does not import front.views: no circular import)
+from front.tasks import (
+    _construire_prompt_synthese, analyser_page_task, convertir_document_task,
+    synthetiser_page_task, transcrire_audio_task,
+)
 from hypostasis_extractor.models import (
     AnalyseurSyntaxique, AnalyseurExample, CommentaireExtraction,
     ExampleExtraction, ExtractionAttribute,
     ExtractedEntity, ExtractionJob, PromptPiece,
 )
 from django.contrib.auth.models import User as AuthUser
+from .middleware import lire_memo_requete
 from .serializers import (
     ChangerVisibiliteSerializer,
     CommentaireExtractionSerializer, DossierCreateSerializer,
@@ -39,7 +59,7 @@ from .serializers import (
     RunAnalyseSerializer,
     SelectModelSerializer,
     SupprimerBlocSerializer, SynthetiserSerializer,
-    est_fichier_audio, est_fichier_json,
+    est_conversion_asynchrone, est_fichier_audio, est_fichier_json,
 )
 from .utils import annoter_html_avec_barres
 
@@ -50,6 +70,204 @@ logger = logging.getLogger(__name__)
 SEUIL_CONSENSUS_DEFAUT = 80
 
 
+@functools.lru_cache(maxsize=None)
+def _template_partial_compile(nom_template):
+    """
+    Resout et compile un template partial une seule fois par processus.
+    / Resolves and compiles a partial template once per process.
+    """
+    return get_template(nom_template)
+
+
+def _rendre_partial(nom_template, contexte, request):
+    """
+    Equivalent de render_to_string pour les partials re-rendus a chaque action HTMX :
+    le Template compile est garde en memoire, on saute le parcours des loaders.
+    En DEBUG on repasse par get_template pour voir les modifications des fichiers.
+    / render_to_string equivalent for partials re-rendered on every HTMX action:
+    / the compiled Template is kept in memory, skipping the loader chain.
+    / In DEBUG we go through get_template again to pick up file edits.
+
+    LOCALISATION : front/views.py
+    """
+    if settings.DEBUG:
+        return get_template(nom_template).render(contexte, request)
+    return _template_partial_compile(nom_template).render(contexte, request)
+
+
+@functools.lru_cache(maxsize=1)
+def _encodeur_tokens_cl100k():
+    """
+    Encodeur tiktoken cl100k_base, construit une seule fois par processus.
+    Import et chargement differes au premier appel (le vocabulaire BPE peut
+    etre telecharge : on ne le fait pas a l'import du module).
+    / tiktoken cl100k_base encoder, built once per process.
+    / Import and loading deferred to the first call (the BPE vocabulary may
+    / be downloaded: we do not do it at module import).
+
+    LOCALISATION : front/views.py
+    """
+    import tiktoken
+    return tiktoken.get_encoding("cl100k_base")
+
+
+# Duree de vie des comptes de tokens memorises (le texte est dans la cle, jamais perime)
+# / Lifetime of memoized token counts (the text is in the key, never stale)
+DUREE_CACHE_COMPTE_TOKENS_SECONDES = 3600
+
+
+# Au-dela de cette taille, le compte exact (tiktoken) bloquerait le worker
+# plusieurs centaines de ms : on estime a len // 4 (meme ratio generique que
+# le suivi de tokens de front/tasks.py). Le cout affiche est deja une estimation.
+# / Beyond this size, exact counting (tiktoken) would block the worker for
+# / hundreds of ms: estimate with len // 4 (same generic ratio as the token
+# / tracking in front/tasks.py). The displayed cost is already an estimate.
+SEUIL_CARACTERES_COMPTE_TOKENS_EXACT = 200_000
+CARACTERES_PAR_TOKEN_ESTIMATION = 4
+
+
+def _cle_cache_compte_tokens(texte):
+    """
+    Cle de cache d'un compte de tokens : empreinte BLAKE2b du texte.
+    / Cache key for a token count: BLAKE2b digest of the text.
+    """
+    empreinte_texte = hashlib.blake2b(texte.encode("utf-8"), digest_size=16).hexdigest()
+    return f"tokens_cl100k:{empreinte_texte}"
+
+
+def _compter_tokens(texte):
+    """
+    Nombre de tokens cl100k_base d'un texte (estimation de cout).
+    / cl100k_base token count of a text (cost estimation).
+    """
+    return _compter_tokens_par_lot([texte])[0]
+
+
+def _compter_tokens_par_lot(liste_textes):
+    """
+    Compte les tokens de plusieurs textes independants.
+    Les comptes deja calcules sont relus dans le cache Django (cle = empreinte
+    du texte) : re-ouvrir une previsualisation ne re-tokenise pas le prompt.
+    Les textes manquants sont encodes en un seul appel encode_ordinary_batch
+    (tiktoken repartit les textes sur des threads ; encode_ordinary saute le
+    controle des tokens speciaux, un texte contenant "<|endoftext|>" ne leve pas).
+    / Counts tokens of several independent texts.
+    / Already computed counts are read from the Django cache (key = text
+    / digest): reopening a preview does not re-tokenize the prompt.
+    / Missing texts are encoded in a single encode_ordinary_batch call
+    / (tiktoken spreads texts over threads; encode_ordinary skips the
+    / special-token check, a text containing "<|endoftext|>" does not raise).
+    Les textes de plus de SEUIL_CARACTERES_COMPTE_TOKENS_EXACT caracteres sont
+    estimes sans tokenisation. / Texts above the threshold are estimated.
+
+    LOCALISATION : front/views.py
+
+    :return: liste des nombres de tokens, dans l'ordre de liste_textes
+    """
+    cles_par_texte = {}
+    for texte in liste_textes:
+        if texte and len(texte) <= SEUIL_CARACTERES_COMPTE_TOKENS_EXACT:
+            cles_par_texte[texte] = _cle_cache_compte_tokens(texte)
+    comptes_en_cache = cache.get_many(list(cles_par_texte.values()))
+
+    textes_a_encoder = []
+    for texte, cle_cache in cles_par_texte.items():
+        if cle_cache not in comptes_en_cache:
+            textes_a_encoder.append(texte)
+
+    if textes_a_encoder:
+        listes_tokens = _encodeur_tokens_cl100k().encode_ordinary_batch(textes_a_encoder)
+        nouveaux_comptes = {}
+        for texte, tokens_du_texte in zip(textes_a_encoder, listes_tokens):
+            nouveaux_comptes[cles_par_texte[texte]] = len(tokens_du_texte)
+        cache.set_many(nouveaux_comptes, DUREE_CACHE_COMPTE_TOKENS_SECONDES)
+        comptes_en_cache.update(nouveaux_comptes)
+
+    nombres_tokens = []
+    for texte in liste_textes:
+        if not texte:
+            nombres_tokens.append(0)
+        elif texte not in cles_par_texte:
+            nombres_tokens.append(len(texte) // CARACTERES_PAR_TOKEN_ESTIMATION)
+        else:
+            nombres_tokens.append(comptes_en_cache[cles_par_texte[texte]])
+    return nombres_tokens
+
+
+# Payloads HX-Trigger constants, encodes une seule fois au chargement du module
+# / Constant HX-Trigger payloads, encoded once at module load
+HX_TRIGGER_AUTH_REQUISE = json.dumps({
+    "authRequise": {
+        "titre": "Connexion requise",
+        "message": "Connectez-vous pour effectuer cette action.",
+        "url_login": "/auth/login/",
+    }
+})
+HX_TRIGGER_ACCES_REFUSE = json.dumps({
+    "showToast": {
+        "message": "Acc\u00e8s r\u00e9serv\u00e9 au propri\u00e9taire du dossier.",
+        "icon": "warning",
+    }
+})
+HX_TRIGGER_EXTRACTION_CREEE = json.dumps({
+    "ouvrirPanneauDroit": True,
+    "showToast": {"message": "Extraction cr\u00e9\u00e9e"},
+})
+HX_TRIGGER_EXTRACTIONS_IA_SUPPRIMEES = json.dumps({
+    "ouvrirPanneauDroit": True,
+    "showToast": {"message": "Extractions IA supprim\u00e9es"},
+})
+HX_TRIGGER_TEXTE_INVALIDE = json.dumps({
+    "showToast": {"message": "Texte invalide.", "icon": "error"},
+})
+HX_TRIGGER_PAGE_INTROUVABLE = json.dumps({
+    "showToast": {"message": "Page introuvable.", "icon": "error"},
+})
+HX_TRIGGER_AUCUN_ANALYSEUR_ACTIF = json.dumps({
+    "showToast": {"message": "Aucun analyseur actif.", "icon": "error"},
+})
+HX_TRIGGER_TITRE_MODIFIE = json.dumps({
+    "showToast": {"message": "Titre modifi\u00e9"},
+})
+HX_TRIGGER_TRANSCRIPTION_LANCEE = json.dumps({
+    "showToast": {"message": "Transcription lanc\u00e9e..."},
+})
+HX_TRIGGER_CONVERSION_LANCEE = json.dumps({
+    "showToast": {"message": "Conversion lanc\u00e9e..."},
+})
+HX_TRIGGER_CONVERSION_NON_LANCEE = json.dumps({
+    "showToast": {"message": "Conversion non lanc\u00e9e : file de t\u00e2ches indisponible.", "icon": "error"},
+})
+HX_TRIGGER_QUESTION_AJOUTEE = json.dumps({
+    "showToast": {"message": "Question ajout\u00e9e"},
+})
+HX_TRIGGER_REPONSE_AJOUTEE = json.dumps({
+    "showToast": {"message": "R\u00e9ponse ajout\u00e9e"},
+})
+HX_TRIGGER_FICHIER_IMPORTE = json.dumps({
+    "showToast": {"message": "Fichier import\u00e9"},
+})
+HX_TRIGGER_TRANSCRIPTION_JSON_IMPORTEE = json.dumps({
+    "showToast": {"message": "Transcription JSON import\u00e9e"},
+})
+HX_TRIGGER_ANALYSE_DEJA_EN_COURS = json.dumps({
+    "showToast": {
+        "message": "Une analyse est deja en cours pour cette page.",
+        "icon": "info",
+    },
+    "fermerDrawer": {},
+    "tachesChanged": {},
+})
+HX_TRIGGER_SYNTHESE_DEJA_EN_COURS = json.dumps({
+    "showToast": {
+        "message": "Une synthese est deja en cours pour cette page.",
+        "icon": "info",
+    },
+    "fermerDrawer": {},
+    "tachesChanged": {},
+})
+
+
 def _exiger_authentification(request):
     """
     Verifie que l'utilisateur est authentifie pour les operations d'ecriture.
@@ -64,13 +282,7 @@ def _exiger_authentification(request):
         return None
     if request.headers.get("HX-Request"):
         reponse = HttpResponse(status=403)
-        reponse["HX-Trigger"] = json.dumps({
-            "authRequise": {
-                "titre": "Connexion requise",
-                "message": "Connectez-vous pour effectuer cette action.",
-                "url_login": "/auth/login/",
-            }
-        })
+        reponse["HX-Trigger"] = HX_TRIGGER_AUTH_REQUISE
         return reponse
     return redirect("/auth/login/")
 
@@ -214,7 +426,12 @@ def _peut_supprimer_extraction(utilisateur, entite):
         return False
     if entite.statut_debat != "nouveau":
         return False
-    if CommentaireExtraction.objects.filter(entity=entite).exists():
+    # Reutilise l'annotation Exists posee par la vue si presente (une requete en moins)
+    # / Reuse the Exists annotation set by the view when present (one query less)
+    possede_commentaires = getattr(entite, "possede_commentaires", None)
+    if possede_commentaires is None:
+        possede_commentaires = CommentaireExtraction.objects.filter(entity=entite).exists()
+    if possede_commentaires:
         return False
     # Owner du dossier → peut supprimer toute extraction
     # / Folder owner → can delete any extraction
@@ -238,12 +455,7 @@ def _reponse_acces_refuse(request):
     # / HTMX request → SweetAlert toast via HX-Trigger
     if request.headers.get("HX-Request"):
         reponse = HttpResponse(status=403)
-        reponse["HX-Trigger"] = json.dumps({
-            "showToast": {
-                "message": "Acc\u00e8s r\u00e9serv\u00e9 au propri\u00e9taire du dossier.",
-                "icon": "warning",
-            }
-        })
+        reponse["HX-Trigger"] = HX_TRIGGER_ACCES_REFUSE
         return reponse
     # Acces direct (F5 ou URL) → template complet avec navigation
     # / Direct access (F5 or URL) → full template with navigation
@@ -296,30 +508,81 @@ def _obtenir_ou_creer_dossier_imports(utilisateur):
     return dossier_imports
 
 
-def _render_arbre(request):
+# Tampon de copie des fichiers uploades (1 Mio au lieu des morceaux de 64 Kio)
+# / Copy buffer for uploaded files (1 MiB instead of 64 KiB chunks)
+TAILLE_TAMPON_COPIE_UPLOAD = 1024 * 1024
+
+
+def _ecrire_fichier_uploade_sur_disque(fichier_uploade, chemin_destination, deplacer=False):
     """
-    Helper interne — renvoie le partial HTML de l'arbre de dossiers.
+    Copie un fichier uploade vers chemin_destination sans boucle Python par morceau.
+    Si Django l'a deja ecrit dans un fichier temporaire, copie noyau (copyfile
+    utilise sendfile / copy_file_range sous Linux). Sinon copyfileobj avec 1 Mio.
+    Avec deplacer=True, le fichier temporaire est deplace (simple rename sur le
+    meme systeme de fichiers) : a reserver aux appelants qui ne relisent pas
+    l'upload ensuite. Sans deplacer, l'upload reste lisible (ex : source_file).
+    / Copy an uploaded file to chemin_destination without a per-chunk Python loop.
+    If Django already spooled it to a temp file, kernel copy (copyfile uses
+    sendfile / copy_file_range on Linux). Otherwise copyfileobj with 1 MiB.
+    With deplacer=True, the temp file is moved (plain rename on the same
+    filesystem): only for callers that do not read the upload afterwards.
+    Without deplacer, the upload stays readable (e.g. source_file).
+
+    LOCALISATION : front/views.py
+    """
+    if hasattr(fichier_uploade, "temporary_file_path"):
+        if deplacer:
+            # shutil.move : rename, ou copie si IMPORT/AUDIO_TEMP_DIR est sur un
+            # autre disque que FILE_UPLOAD_TEMP_DIR. TemporaryUploadedFile.close()
+            # tolere que son fichier ait disparu.
+            # / shutil.move: rename, or copy if the target dir is on another disk.
+            # / TemporaryUploadedFile.close() tolerates its file being gone.
+            shutil.move(fichier_uploade.temporary_file_path(), chemin_destination)
+        else:
+            shutil.copyfile(fichier_uploade.temporary_file_path(), chemin_destination)
+        return
+    fichier_uploade.seek(0)
+    with open(chemin_destination, "wb") as destination:
+        shutil.copyfileobj(fichier_uploade, destination, TAILLE_TAMPON_COPIE_UPLOAD)
+
+
+def _contexte_arbre(request):
+    """
+    Helper interne — contexte du partial de l'arbre de dossiers.
     3 sections : Mes dossiers, Partages avec moi, Dossiers publics.
     Anonyme : uniquement les dossiers publics.
-    / Internal helper — returns the folder tree HTML partial.
+    / Internal helper — folder tree partial context.
     3 sections: My folders, Shared with me, Public folders.
     Anonymous: only public folders.
     """
-    # Exclure les restitutions de l'arbre (ne montrer que les pages racines)
-    # / Exclude restitutions from tree (only show root pages)
+    # Exclure les restitutions de l'arbre (ne montrer que les pages racines).
+    # Le noeud n'affiche que titre, domaine et type de source : on ne charge pas
+    # les gros TextField (html_original, html_readability, text_readability...)
+    # de chaque page de la bibliotheque a chaque rendu de l'arbre.
+    # Page n'a pas d'ordre par defaut : sans order_by, l'ordre des pages d'un
+    # dossier dependait du plan Postgres. Les plus recentes d'abord.
+    # / Exclude restitutions from tree (only show root pages).
+    # / The node only shows title, domain and source type: we do not load the
+    # / large TextFields of every library page on each tree render.
+    # / Page has no default ordering: without order_by, the order of a folder's
+    # / pages depended on the Postgres plan. Most recent first.
     pages_racines_seulement = Prefetch(
         "pages",
-        queryset=Page.objects.filter(parent_page__isnull=True),
+        queryset=Page.objects.filter(parent_page__isnull=True).only(
+            "title", "url", "source_type", "dossier",
+        ).order_by("-created_at"),
     )
 
+    # Aucun filtre ne traverse une relation multi-valuee (uniquement des colonnes
+    # de Dossier et des sous-requetes pk__in) : pas de doublon possible, donc pas
+    # de DISTINCT. / No filter crosses a multi-valued relation (only Dossier
+    # columns and pk__in subqueries): no duplicates possible, hence no DISTINCT.
     if request.user.is_authenticated:
         # Mes dossiers : owner=moi ou legacy (owner=null)
         # / My folders: owner=me or legacy (owner=null)
-        mes_dossiers = Dossier.objects.prefetch_related(
-            pages_racines_seulement,
-        ).filter(
+        mes_dossiers = list(Dossier.objects.filter(
             Q(owner=request.user) | Q(owner__isnull=True)
-        ).distinct()
+        ))
 
         # Dossiers partages avec moi (direct ou via groupe), excluant mes propres dossiers
         # / Folders shared with me (direct or via group), excluding my own folders
@@ -330,19 +593,15 @@ def _render_arbre(request):
             groupe__membres=request.user,
         ).values_list("dossier_id", flat=True)
 
-        dossiers_partages = Dossier.objects.prefetch_related(
-            pages_racines_seulement,
-        ).select_related("owner").filter(
+        dossiers_partages = list(Dossier.objects.select_related("owner").filter(
             Q(pk__in=ids_dossiers_partages_directs) | Q(pk__in=ids_dossiers_partages_groupe)
         ).exclude(
             Q(owner=request.user) | Q(owner__isnull=True)
-        ).distinct()
+        ))
 
         # Dossiers publics (tous, avec owner affiche) — exclut les partages
         # / Public folders (all, with owner displayed) — excludes shared
-        dossiers_publics = Dossier.objects.prefetch_related(
-            pages_racines_seulement,
-        ).select_related("owner").filter(
+        dossiers_publics = list(Dossier.objects.select_related("owner").filter(
             visibilite=VisibiliteDossier.PUBLIC,
         ).exclude(
             Q(owner=request.user) | Q(owner__isnull=True)
@@ -350,62 +609,327 @@ def _render_arbre(request):
             pk__in=ids_dossiers_partages_directs,
         ).exclude(
             pk__in=ids_dossiers_partages_groupe,
-        ).distinct()
+        ))
     else:
         # Anonyme : uniquement les dossiers publics
         # / Anonymous: only public folders
-        mes_dossiers = Dossier.objects.none()
-        dossiers_partages = Dossier.objects.none()
-        dossiers_publics = Dossier.objects.prefetch_related(
-            pages_racines_seulement,
-        ).select_related("owner").filter(
+        mes_dossiers = []
+        dossiers_partages = []
+        dossiers_publics = list(Dossier.objects.select_related("owner").filter(
             visibilite=VisibiliteDossier.PUBLIC,
-        )
+        ))
+
+    # Les pages des trois sections sont chargees en une seule requete
+    # (pages.dossier_id IN (...) sur l'union des dossiers) au lieu d'un
+    # prefetch par section. / Pages of the three sections are loaded in a
+    # single query (pages.dossier_id IN (...) over the union of folders)
+    # instead of one prefetch per section.
+    prefetch_related_objects(
+        mes_dossiers + dossiers_partages + dossiers_publics,
+        pages_racines_seulement,
+    )
+
+    # Nombre de pages de chaque dossier, compte une fois sur la liste prechargee
+    # (pas de COUNT SQL ni d'annotate : les pages sont deja en memoire). Le
+    # template lit dossier.nb_pages au lieu de rappeler dossier.pages.count.
+    # / Page count of each folder, counted once on the prefetched list (no SQL
+    # / COUNT nor annotate: pages are already in memory). The template reads
+    # / dossier.nb_pages instead of calling dossier.pages.count again.
+    for dossier_comptage in itertools.chain(mes_dossiers, dossiers_partages, dossiers_publics):
+        dossier_comptage.nb_pages = len(dossier_comptage.pages.all())
 
     # Calculer le total de pages par section pour affichage dans les headers
     # / Calculate total pages per section for display in headers
-    total_pages_mes_dossiers = 0
-    for dossier_comptage in mes_dossiers:
-        total_pages_mes_dossiers += dossier_comptage.pages.count()
-    total_pages_partages = 0
-    for dossier_comptage in dossiers_partages:
-        total_pages_partages += dossier_comptage.pages.count()
-    total_pages_publics = 0
-    for dossier_comptage in dossiers_publics:
-        total_pages_publics += dossier_comptage.pages.count()
-
-    return render(request, "front/includes/arbre_dossiers.html", {
+    total_pages_mes_dossiers = sum(dossier.nb_pages for dossier in mes_dossiers)
+    total_pages_partages = sum(dossier.nb_pages for dossier in dossiers_partages)
+    total_pages_publics = sum(dossier.nb_pages for dossier in dossiers_publics)
+
+    return {
         "mes_dossiers": mes_dossiers,
         "dossiers_partages": dossiers_partages,
         "dossiers_publics": dossiers_publics,
         "total_pages_mes_dossiers": total_pages_mes_dossiers,
         "total_pages_partages": total_pages_partages,
         "total_pages_publics": total_pages_publics,
-    })
+    }
+
+
+def _render_arbre(request):
+    """
+    Helper interne — renvoie le partial HTML de l'arbre de dossiers.
+    / Internal helper — returns the folder tree HTML partial.
+    """
+    return render(request, "front/includes/arbre_dossiers.html", _contexte_arbre(request))
 
 
-def _annoter_entites_avec_commentaires(queryset_entites):
+def _etag_arbre(request, contexte_arbre):
+    """
+    ETag fort de l'arbre : empreinte de l'utilisateur et de tout ce que le
+    partial affiche (dossiers, visibilite, proprietaires, pages). Calcule sur
+    les donnees deja chargees, avant le rendu du template.
+    / Strong ETag of the tree: digest of the user and of everything the partial
+    / shows (folders, visibility, owners, pages). Computed on the already
+    / loaded data, before rendering the template.
+    """
+    empreinte_arbre = hashlib.blake2b(digest_size=16)
+    empreinte_arbre.update(repr(request.user.pk).encode("ascii"))
+    for nom_section in ("mes_dossiers", "dossiers_partages", "dossiers_publics"):
+        empreinte_arbre.update(nom_section.encode("ascii"))
+        for dossier in contexte_arbre[nom_section]:
+            nom_proprietaire = (
+                dossier.owner.username
+                if nom_section != "mes_dossiers" and dossier.owner_id else None
+            )
+            empreinte_arbre.update(repr((
+                dossier.pk, dossier.name, dossier.visibilite, dossier.owner_id, nom_proprietaire,
+                [
+                    (page.pk, page.title, page.url, page.source_type)
+                    for page in dossier.pages.all()
+                ],
+            )).encode("utf-8"))
+    return f'"arbre-{empreinte_arbre.hexdigest()}"'
+
+
+def _html_arbre_oob(request):
+    """
+    Arbre de dossiers enveloppe pour un swap OOB HTMX (innerHTML de #arbre).
+    / Folder tree wrapped for an HTMX OOB swap (innerHTML of #arbre).
+
+    LOCALISATION : front/views.py
+    """
+    return "".join((
+        '<div id="arbre" hx-swap-oob="innerHTML:#arbre">',
+        _render_arbre(request).content.decode(),
+        '</div>',
+    ))
+
+
+def _reponse_lecture_page_importee(request, page_importee, hx_trigger_toast):
+    """
+    Reponse d'un import termine : zone de lecture de la nouvelle page + arbre
+    (OOB) + panneau d'analyse vierge (OOB) + toast. Les trois partials sont
+    assembles en un seul join.
+    / Response for a completed import: reading zone of the new page + tree
+    / (OOB) + blank analysis panel (OOB) + toast. The three partials are
+    / assembled in a single join. hx_trigger_toast : constante HX_TRIGGER_*.
+
+    LOCALISATION : front/views.py
+    """
+    contexte_partage = {
+        "page": page_importee,
+        "html_annote": None,
+        "analyseurs_actifs": _get_analyseurs_actifs(),
+        "job": None,
+        "entities": None,
+        "ia_active": _get_ia_active(),
+    }
+    html_complet = "".join((
+        _rendre_partial("front/includes/lecture_principale.html", contexte_partage, request=request),
+        _html_arbre_oob(request),
+        '<div id="panneau-extractions" hx-swap-oob="innerHTML:#panneau-extractions">',
+        _rendre_partial("front/includes/panneau_analyse.html", contexte_partage, request=request),
+        '</div>',
+    ))
+    reponse = HttpResponse(html_complet)
+    reponse["HX-Trigger"] = hx_trigger_toast
+    return reponse
+
+
+# Colonnes volumineuses d'ExtractionJob (resultat brut du LLM, prompt complet)
+# jamais lues par les panneaux qui n'affichent que cout, tokens et version.
+# / Large ExtractionJob columns (raw LLM result, full prompt) never read by
+# / the panels, which only show cost, tokens and version.
+CHAMPS_LOURDS_EXTRACTION_JOB = ("raw_result", "prompt_description")
+
+
+# Colonnes de Page lues seulement par telecharger_source : le HTML brut capture
+# peut peser plusieurs Mo, les actions de lecture, d'analyse et d'edition le
+# laissent en base. / Page columns only read by telecharger_source: the raw
+# captured HTML can weigh several MB, reading, analysis and edit actions
+# leave it in the database.
+CHAMPS_LOURDS_PAGE = ("html_original",)
+
+
+# Nombre de commentaires d'une entite (OuterRef sur l'entite annotee)
+# / Comment count of one entity (OuterRef on the annotated entity)
+_SOUS_REQUETE_NOMBRE_COMMENTAIRES = CommentaireExtraction.objects.filter(
+    entity=OuterRef("pk"),
+).order_by().values("entity").annotate(total=Count("pk")).values("total")
+
+
+def _annoter_entites_avec_commentaires(queryset_entites, avec_fils_commentaires=False):
     """
     Annote un queryset d'entites avec le nombre de commentaires.
     Retourne (queryset_annote, set_ids_commentees).
+    Le queryset est evalue ici (un seul SELECT) et les ids commentes sont lus
+    dans son cache : les appelants le reparcourent sans nouvelle requete.
+    Le compte est une sous-requete correlee (index sur entity_id) plutot qu'un
+    JOIN + GROUP BY : le job joint n'entre pas dans l'agregation et les
+    entites ne sont pas multipliees par leurs commentaires avant regroupement.
+    Le nombre (pas seulement un booleen) est affiche sur les cartes.
     / Annotate entity queryset with comment count.
     Returns (annotated_queryset, set_of_commented_ids).
+    / The queryset is evaluated here (a single SELECT) and commented ids are
+    / read from its cache: callers iterate it again without a new query.
+    / The count is a correlated subquery (entity_id index) rather than a
+    / JOIN + GROUP BY: the joined job stays out of the aggregation and entities
+    / are not multiplied by their comments before grouping.
+    / The number (not just a boolean) is displayed on the cards.
+
+    Le job est joint (sans ses colonnes lourdes) : les cartes lisent
+    entity.job.page_id, qui coutait sinon un SELECT par entite.
+    / The job is joined (without its heavy columns): cards read
+    / entity.job.page_id, which otherwise cost one SELECT per entity.
+
+    avec_fils_commentaires=True pour les rendus du panneau : _card_body.html
+    parcourt entity.commentaires.all et commentaire.user, charges ici en une
+    requete (auteurs joints) au lieu d'un SELECT par carte et par commentaire.
+    / avec_fils_commentaires=True for panel renders: _card_body.html iterates
+    / entity.commentaires.all and commentaire.user, loaded here in one query
+    / (authors joined) instead of one SELECT per card and per comment.
     """
-    entites_annotees = queryset_entites.annotate(
-        nombre_commentaires=Count("commentaires"),
-    )
-    ids_commentees = set(
-        entites_annotees.filter(nombre_commentaires__gt=0).values_list("pk", flat=True)
+    entites_annotees = queryset_entites.select_related("job").defer(
+        *(f"job__{champ_lourd}" for champ_lourd in CHAMPS_LOURDS_EXTRACTION_JOB),
+    ).annotate(
+        nombre_commentaires=Coalesce(
+            Subquery(_SOUS_REQUETE_NOMBRE_COMMENTAIRES, output_field=IntegerField()),
+            0,
+        ),
     )
+    if avec_fils_commentaires:
+        entites_annotees = entites_annotees.prefetch_related(
+            Prefetch(
+                "commentaires",
+                queryset=CommentaireExtraction.objects.select_related("user"),
+            ),
+        )
+    ids_commentees = set()
+    for entite_annotee in entites_annotees:
+        if entite_annotee.nombre_commentaires > 0:
+            ids_commentees.add(entite_annotee.pk)
     return entites_annotees, ids_commentees
 
 
+# Taille maximale (en caracteres) d'un HTML dont l'annotation est memorisee.
+# Au-dela, l'annotation est recalculee a chaque lecture : le cache dedie
+# "html_annote" (32 entrees par processus) ne garde que des pages de taille
+# raisonnable, et le HTML n'est pas rehache en entier a chaque lecture.
+# / Maximum size (in characters) of an HTML whose annotation is memoized.
+# / Above it, the annotation is recomputed on every read: the dedicated
+# / "html_annote" cache (32 entries per process) only keeps reasonably sized
+# / pages, and the HTML is not fully rehashed on every read.
+SEUIL_CARACTERES_CACHE_HTML_ANNOTE = 512 * 1024
+
+
+def _annoter_html_memorise(html_brut, entites, ids_entites_commentees=None):
+    """
+    annoter_html_avec_barres avec memorisation dans le cache dedie "html_annote".
+    La cle couvre tout ce qui change le resultat : l'empreinte du HTML et, pour
+    chaque entite, ses positions, son texte, son statut et la presence de
+    commentaires. Relire une page non modifiee ne refait pas le parcours du HTML ;
+    une creation, un masquage ou un commentaire change la cle. Les HTML plus
+    longs que SEUIL_CARACTERES_CACHE_HTML_ANNOTE ne sont pas memorises.
+    / annoter_html_avec_barres memoized in the dedicated "html_annote" cache.
+    / The key covers everything that changes the result: the HTML digest and,
+    / for each entity, its positions, text, status and whether it has comments.
+    / Re-reading an unchanged page skips the HTML walk; a creation, a hide or
+    / a comment changes the key. HTML longer than
+    / SEUIL_CARACTERES_CACHE_HTML_ANNOTE is not memoized.
+
+    LOCALISATION : front/views.py
+    """
+    if not html_brut or not entites:
+        return html_brut
+
+    ids_commentees = ids_entites_commentees or set()
+    # annoter_html_avec_barres ne lit pas text_readability : positions
+    # recalculees depuis le HTML. / annoter_html_avec_barres does not read
+    # / text_readability: positions are recomputed from the HTML.
+    if len(html_brut) > SEUIL_CARACTERES_CACHE_HTML_ANNOTE:
+        return annoter_html_avec_barres(html_brut, None, entites, ids_commentees)
+
+    empreinte_annotation = hashlib.blake2b(
+        calculer_content_hash(html_brut).encode("ascii"), digest_size=16,
+    )
+    for entite in entites:
+        empreinte_annotation.update(repr((
+            entite.pk, entite.start_char, entite.end_char, entite.extraction_text,
+            entite.statut_debat, entite.pk in ids_commentees,
+        )).encode("utf-8"))
+    cle_cache = f"html_annote:{empreinte_annotation.hexdigest()}"
+
+    cache_html_annote = caches["html_annote"]
+    html_annote = cache_html_annote.get(cle_cache)
+    if html_annote is None:
+        html_annote = annoter_html_avec_barres(html_brut, None, entites, ids_commentees)
+        cache_html_annote.set(cle_cache, html_annote)
+    return html_annote
+
+
+def _get_configuration_ia():
+    """
+    Helper — Configuration singleton en lecture, memorisee pour la requete en
+    cours (front/middleware.py). Un seul SELECT par requete, meme si plusieurs
+    helpers la lisent ; chaque requete relit la base, donc un toggle fait dans
+    un autre worker ou un autre thread est vu des la requete suivante.
+    front/signals.py l'oublie apres une sauvegarde/suppression de Configuration.
+    Les actions qui modifient la configuration passent par Configuration.get_solo().
+    / Helper — read-only Configuration singleton, memoized for the current
+    / request (front/middleware.py). A single SELECT per request, even if
+    / several helpers read it; every request reads the database again, so a
+    / toggle made in another worker or thread is seen from the next request.
+    / front/signals.py forgets it after a Configuration save/delete.
+    / Actions that modify the configuration go through Configuration.get_solo().
+
+    Le modele IA est joint (select_related) : les lectures de
+    configuration.ai_model (bouton IA, analyse, synthese) ne coutent pas un
+    second SELECT. get_solo() ne sert qu'a creer la ligne si elle manque.
+    / The AI model is joined (select_related): reads of configuration.ai_model
+    / (AI button, analysis, synthesis) do not cost a second SELECT.
+    / get_solo() is only used to create the row when it is missing.
+    """
+    return lire_memo_requete("configuration_ia", _charger_configuration_ia)
+
+
+def _charger_configuration_ia():
+    """
+    Lecture de la Configuration singleton (modele IA joint) pour _get_configuration_ia().
+    / Reads the Configuration singleton (AI model joined) for _get_configuration_ia().
+    """
+    configuration = Configuration.objects.select_related("ai_model").filter(
+        pk=Configuration.singleton_instance_id,
+    ).first()
+    return configuration or Configuration.get_solo()
+
+
 def _get_ia_active():
     """
     Helper — retourne True si l'IA est activee dans la configuration singleton.
     Helper — returns True if AI is enabled in singleton configuration.
     """
-    return Configuration.get_solo().ai_active
+    return _get_configuration_ia().ai_active
+
+
+def _get_analyseurs_actifs():
+    """
+    Helper — analyseurs actifs de type "analyser", dans l'ordre du modele
+    (-updated_at : l'analyseur par defaut [0] est le dernier modifie, comme
+    l'ancien .first()), memorises pour la requete en cours comme
+    _get_configuration_ia(). front/signals.py les oublie apres une
+    sauvegarde/suppression d'AnalyseurSyntaxique. Un seul SELECT par requete
+    pour le selecteur du panneau, l'analyseur par defaut et les rendus OOB.
+    / Helper — active analyzers of type "analyser", in model order
+    / (-updated_at: the default analyzer [0] is the most recently updated one,
+    / like the former .first()), memoized for the current request like
+    / _get_configuration_ia(). front/signals.py forgets them after an
+    / AnalyseurSyntaxique save/delete. A single SELECT per request for the
+    / panel selector, the default analyzer and OOB renders.
+    """
+    return lire_memo_requete("analyseurs_actifs", lambda: tuple(
+        AnalyseurSyntaxique.objects.filter(
+            is_active=True, type_analyseur="analyser",
+        ),
+    ))
 
 
 def _diff_inline_mots(texte_ancien, texte_nouveau):
@@ -579,20 +1103,67 @@ def _verifier_et_nettoyer_job_bloque(job_en_cours):
         return True
 
     inactivite_du_job = timezone.now() - job_en_cours.updated_at
-    if inactivite_du_job > DELAI_MAX_INACTIVITE_JOB:
-        logger.warning(
-            "_verifier_et_nettoyer_job_bloque: job pk=%s inactif depuis %s — timeout",
-            job_en_cours.pk, inactivite_du_job,
-        )
-        job_en_cours.status = "error"
-        job_en_cours.error_message = (
-            f"Timeout : l'analyse est bloquée depuis {DELAI_MAX_INACTIVITE_JOB.total_seconds() // 60:.0f} "
-            "minutes sans progression. Vérifiez que le worker Celery tourne."
-        )
-        job_en_cours.save(update_fields=["status", "error_message"])
-        return True
+    if inactivite_du_job <= DELAI_MAX_INACTIVITE_JOB:
+        return False
 
-    return False
+    # UPDATE conditionnel unique : la condition d'inactivite est re-verifiee en base.
+    # Si le worker Celery a progresse entre la lecture et l'ecriture (updated_at plus
+    # recent) ou a deja termine le job, aucune ligne n'est modifiee.
+    # / Single conditional UPDATE: the inactivity condition is re-checked in DB.
+    # / If the Celery worker progressed between read and write (newer updated_at)
+    # / or already finished the job, no row is modified.
+    message_timeout = (
+        f"Timeout : l'analyse est bloquée depuis {DELAI_MAX_INACTIVITE_JOB.total_seconds() // 60:.0f} "
+        "minutes sans progression. Vérifiez que le worker Celery tourne."
+    )
+    nombre_jobs_marques = ExtractionJob.objects.filter(
+        pk=job_en_cours.pk,
+        status__in=["pending", "processing"],
+        updated_at__lt=timezone.now() - DELAI_MAX_INACTIVITE_JOB,
+    ).update(status="error", error_message=message_timeout)
+    if not nombre_jobs_marques:
+        return False
+
+    logger.warning(
+        "_verifier_et_nettoyer_job_bloque: job pk=%s inactif depuis %s — timeout",
+        job_en_cours.pk, inactivite_du_job,
+    )
+    job_en_cours.status = "error"
+    job_en_cours.error_message = message_timeout
+    return True
+
+
+def _creer_job_et_lancer_tache(page, tache_celery, filtre_jobs_en_cours, **champs_job):
+    """
+    Cree un ExtractionJob PENDING et lance sa tache Celery, sauf si un job en
+    cours correspondant a filtre_jobs_en_cours existe deja pour la page.
+    La ligne Page est verrouillee (select_for_update) le temps du controle et
+    de la creation : deux clics simultanes ne creent pas deux jobs payants.
+    La tache n'est mise en file qu'au commit (on_commit) : le worker ne peut
+    pas demarrer avant que le job soit visible en base.
+    / Creates a PENDING ExtractionJob and launches its Celery task, unless an
+    / in-progress job matching filtre_jobs_en_cours already exists for the page.
+    / The Page row is locked (select_for_update) during check + creation: two
+    / simultaneous clicks do not create two paid jobs. The task is only queued
+    / on commit (on_commit): the worker cannot start before the job is visible.
+
+    LOCALISATION : front/views.py
+
+    :return: (job_cree, None) ou (None, job_en_cours_existant)
+    """
+    with transaction.atomic():
+        Page.objects.select_for_update().only("pk").get(pk=page.pk)
+        job_en_cours = ExtractionJob.objects.filter(
+            page=page,
+            status__in=["pending", "processing"],
+            **filtre_jobs_en_cours,
+        ).order_by("-created_at").first()
+        if job_en_cours:
+            return None, job_en_cours
+
+        job_cree = ExtractionJob.objects.create(page=page, status="pending", **champs_job)
+        transaction.on_commit(functools.partial(tache_celery.delay, job_cree.pk))
+    return job_cree, None
 
 
 def _entites_deja_creees_pour_job(job):
@@ -636,6 +1207,31 @@ def _calculer_consensus(page):
     }
 
 
+def _etag_config_ia_toggle(configuration, modeles_actifs, config_transcription):
+    """
+    ETag fort du partial config_ia_toggle : empreinte des seules valeurs affichees
+    (etat IA, modele choisi, modeles actifs et leurs tarifs, config de transcription).
+    / Strong ETag of the config_ia_toggle partial: fingerprint of the displayed
+    values only (AI state, chosen model, active models and their pricing,
+    transcription config).
+    """
+    valeurs_affichees = (
+        configuration.ai_active,
+        configuration.ai_model_id,
+        [
+            (modele.pk, modele.get_display_name(), modele.provider, modele.cout_par_million_tokens())
+            for modele in modeles_actifs
+        ],
+        (
+            config_transcription.pk,
+            config_transcription.get_display_name(),
+            config_transcription.cout_par_minute_usd(),
+        ) if config_transcription else None,
+    )
+    empreinte = hashlib.md5(repr(valeurs_affichees).encode("utf-8"), usedforsecurity=False)
+    return f'"config-ia-{empreinte.hexdigest()}"'
+
+
 class ConfigurationIAViewSet(viewsets.ViewSet):
     """
     ViewSet pour la configuration IA (toggle on/off, selection du modele).
@@ -648,14 +1244,25 @@ class ConfigurationIAViewSet(viewsets.ViewSet):
         Retourne le partial HTML du bouton IA + audio (pour HTMX).
         / Returns the AI + audio button HTML partial (for HTMX).
         """
-        configuration = Configuration.get_solo()
-        modeles_actifs = AIModel.objects.filter(is_active=True)
+        configuration = _get_configuration_ia()
+        modeles_actifs = list(AIModel.objects.filter(is_active=True))
         config_transcription_active = TranscriptionConfig.objects.filter(is_active=True).first()
-        return render(request, "front/includes/config_ia_toggle.html", {
+
+        # Meme ETag que le dernier rendu (If-None-Match) → 304 sans rendre le template
+        # / Same ETag as the last render (If-None-Match) → 304 without rendering the template
+        etag_toggle = _etag_config_ia_toggle(configuration, modeles_actifs, config_transcription_active)
+        reponse_non_modifiee = get_conditional_response(request, etag=etag_toggle)
+        if reponse_non_modifiee is not None:
+            return reponse_non_modifiee
+
+        reponse = render(request, "front/includes/config_ia_toggle.html", {
             "configuration": configuration,
             "modeles_actifs": modeles_actifs,
             "config_transcription": config_transcription_active,
         })
+        reponse["ETag"] = etag_toggle
+        patch_cache_control(reponse, private=True, no_cache=True)
+        return reponse
 
     @action(detail=False, methods=["POST"])
     def toggle(self, request):
@@ -667,7 +1274,11 @@ class ConfigurationIAViewSet(viewsets.ViewSet):
         if refus:
             return refus
         configuration = Configuration.get_solo()
-        modeles_actifs = AIModel.objects.filter(is_active=True)
+        # Une seule requete : la liste sert au choix de branche, a l'activation
+        # directe et au select du template (qui ne relance pas de SELECT).
+        # / A single query: the list drives the branch, the direct activation
+        # / and the template select (which does not run another SELECT).
+        modeles_actifs = list(AIModel.objects.filter(is_active=True))
 
         if configuration.ai_active:
             # Desactivation / Deactivate
@@ -676,13 +1287,13 @@ class ConfigurationIAViewSet(viewsets.ViewSet):
             configuration.save()
         else:
             # Activation / Activate
-            if modeles_actifs.count() == 1:
+            if len(modeles_actifs) == 1:
                 # Un seul modele actif → activation directe
                 # Single active model → direct activation
                 configuration.ai_active = True
-                configuration.ai_model = modeles_actifs.first()
+                configuration.ai_model = modeles_actifs[0]
                 configuration.save()
-            elif modeles_actifs.count() > 1:
+            elif len(modeles_actifs) > 1:
                 # Plusieurs modeles → on ne fait rien, le partial affiche le select
                 # Multiple models → do nothing, partial shows the select
                 pass
@@ -691,8 +1302,8 @@ class ConfigurationIAViewSet(viewsets.ViewSet):
                 # No active model → cannot activate
                 pass
 
-        # Re-fetch apres modification / Re-fetch after modification
-        configuration = Configuration.get_solo()
+        # configuration est deja a jour en memoire (save ci-dessus), pas de re-fetch
+        # / configuration is already up to date in memory (saved above), no re-fetch
         return render(request, "front/includes/config_ia_toggle.html", {
             "configuration": configuration,
             "modeles_actifs": modeles_actifs,
@@ -718,7 +1329,7 @@ class ConfigurationIAViewSet(viewsets.ViewSet):
         configuration.ai_model = modele_choisi
         configuration.save()
 
-        modeles_actifs = AIModel.objects.filter(is_active=True)
+        modeles_actifs = list(AIModel.objects.filter(is_active=True))
         return render(request, "front/includes/config_ia_toggle.html", {
             "configuration": configuration,
             "modeles_actifs": modeles_actifs,
@@ -751,7 +1362,20 @@ class ArbreViewSet(viewsets.ViewSet):
     """
 
     def list(self, request):
-        return _render_arbre(request)
+        """
+        Arbre identique au dernier envoye (If-None-Match) → 304 sans rendre le template.
+        / Tree identical to the last one sent (If-None-Match) → 304 without rendering.
+        """
+        contexte_arbre = _contexte_arbre(request)
+        etag_arbre = _etag_arbre(request, contexte_arbre)
+        reponse_non_modifiee = get_conditional_response(request, etag=etag_arbre)
+        if reponse_non_modifiee is not None:
+            return reponse_non_modifiee
+
+        reponse = render(request, "front/includes/arbre_dossiers.html", contexte_arbre)
+        reponse["ETag"] = etag_arbre
+        patch_cache_control(reponse, private=True, no_cache=True)
+        return reponse
 
 
 class LectureViewSet(viewsets.ViewSet):
@@ -761,6 +1385,12 @@ class LectureViewSet(viewsets.ViewSet):
     """
     permission_classes = [permissions.AllowAny]
 
+    # Meme URL pour le partial HTMX et la page complete : le cache du navigateur
+    # (retour arriere, bfcache) doit distinguer les deux variantes et revalider.
+    # / Same URL for the HTMX partial and the full page: the browser cache
+    # / (back button, bfcache) must tell both variants apart and revalidate.
+    @method_decorator(vary_on_headers("HX-Request"))
+    @method_decorator(cache_control(private=True, no_cache=True))
     def retrieve(self, request, pk=None):
         """
         Lecture d'une page.
@@ -772,7 +1402,14 @@ class LectureViewSet(viewsets.ViewSet):
         2. Le panneau d'analyse en OOB swap (qui remplace #panneau-extractions)
         Ca permet de mettre a jour le panneau droit sans JS.
         """
-        page = get_object_or_404(Page, pk=pk)
+        # Dossier et proprietaire joints (controle d'acces, est_proprietaire) ;
+        # html_original n'est lu ni par la lecture ni par le panneau.
+        # / Folder and owner joined (access check, est_proprietaire);
+        # / html_original is read by neither the reading zone nor the panel.
+        page = get_object_or_404(
+            Page.objects.select_related("dossier__owner").defer(*CHAMPS_LOURDS_PAGE),
+            pk=pk,
+        )
 
         # Verifier l'acces en lecture a la page via son dossier
         # / Check read access to the page via its folder
@@ -804,16 +1441,28 @@ class LectureViewSet(viewsets.ViewSet):
                 # / marquer_lue is not a valid integer, ignore silently
                 pass
 
-        analyseurs_actifs = AnalyseurSyntaxique.objects.filter(is_active=True, type_analyseur="analyser")
+        analyseurs_actifs = _get_analyseurs_actifs()
 
         # Verifier si un job est en cours pour cette page
         # Si oui, renvoyer le panneau d'analyse en cours avec les entites deja trouvees
         # / Check if a job is currently running for this page
         # / If so, return the in-progress analysis panel with already found entities
-        job_en_cours = ExtractionJob.objects.filter(
+        # Jobs en cours et termines lus en une requete, du plus recent au plus ancien :
+        # le job en cours, le dernier job termine et les ids des jobs termines en
+        # sont deduits sans autre SELECT sur extraction_job.
+        # / Running and completed jobs read in one query, newest first: the running
+        # / job, the latest completed job and the completed job ids are derived
+        # / from it with no other SELECT on extraction_job.
+        jobs_de_la_page = list(ExtractionJob.objects.filter(
             page=page,
-            status__in=["pending", "processing"],
-        ).order_by("-created_at").first()
+            status__in=["pending", "processing", "completed"],
+        ).select_related("analyseur_version").defer(
+            *CHAMPS_LOURDS_EXTRACTION_JOB,
+        ).order_by("-created_at"))
+        job_en_cours = next(
+            (job for job in jobs_de_la_page if job.status in ("pending", "processing")), None,
+        )
+        jobs_termines = [job for job in jobs_de_la_page if job.status == "completed"]
 
         if job_en_cours:
             job_est_bloque = _verifier_et_nettoyer_job_bloque(job_en_cours)
@@ -822,12 +1471,9 @@ class LectureViewSet(viewsets.ViewSet):
                 # / Active job → use the in-progress panel instead of the standard one
                 return self._retrieve_avec_job_en_cours(request, page, job_en_cours, analyseurs_actifs)
 
-        # Recupere le dernier job d'extraction termine pour cette page
+        # Dernier job d'extraction termine pour cette page
         # pour afficher les resultats existants dans le panneau droit
-        dernier_job_termine = ExtractionJob.objects.filter(
-            page=page,
-            status="completed",
-        ).select_related("analyseur_version").order_by("-created_at").first()
+        dernier_job_termine = jobs_termines[0] if jobs_termines else None
 
         # Pour les pages audio avec transcription_raw, regenerer le HTML diarise
         # afin de garantir les data attributes PHASE-15 (fonds pales, data-speaker, etc.)
@@ -838,7 +1484,15 @@ class LectureViewSet(viewsets.ViewSet):
             html_diarise_regenere, texte_brut_regenere = construire_html_diarise(
                 page.transcription_raw,
             )
-            if html_diarise_regenere:
+            # On ne reecrit en base que si le rendu a change : sinon chaque
+            # lecture renverrait deux gros TextField identiques a PostgreSQL.
+            # / Only write back when the render changed: otherwise every read
+            # / would send two identical large TextFields to PostgreSQL.
+            contenu_diarise_a_change = (
+                html_diarise_regenere != page.html_readability
+                or texte_brut_regenere != page.text_readability
+            )
+            if html_diarise_regenere and contenu_diarise_a_change:
                 page.html_readability = html_diarise_regenere
                 page.text_readability = texte_brut_regenere
                 page.save(update_fields=["html_readability", "text_readability"])
@@ -851,20 +1505,16 @@ class LectureViewSet(viewsets.ViewSet):
         html_annote = None
         ids_entites_commentees = set()
         if dernier_job_termine:
-            tous_les_jobs_de_la_page = ExtractionJob.objects.filter(
-                page=page, status="completed",
-            )
             toutes_entites_non_masquees = ExtractedEntity.objects.filter(
-                job__in=tous_les_jobs_de_la_page, masquee=False,
+                job_id__in=[job.pk for job in jobs_termines], masquee=False,
             )
             entites_existantes, ids_entites_commentees = _annoter_entites_avec_commentaires(
-                toutes_entites_non_masquees
+                toutes_entites_non_masquees, avec_fils_commentaires=True,
             )
             # Annoter le HTML avec des ancres pour le scroll-to-extraction
             # / Annotate HTML with anchors for scroll-to-extraction
-            html_annote = annoter_html_avec_barres(
-                page.html_readability, page.text_readability,
-                entites_existantes, ids_entites_commentees,
+            html_annote = _annoter_html_memorise(
+                page.html_readability, entites_existantes, ids_entites_commentees,
             )
 
         # Recupere toutes les versions de cette page (racine + restitutions)
@@ -906,9 +1556,12 @@ class LectureViewSet(viewsets.ViewSet):
             "est_proprietaire": est_proprietaire,
         }
 
-        if request.headers.get('HX-Request'):
+        # L'en-tete HX-Request est lu une seule fois (est_requete_htmx) pour
+        # choisir la branche. / The HX-Request header is read once
+        # / (est_requete_htmx) to pick the branch.
+        if est_requete_htmx:
             # 1. Partial principal : contenu de lecture
-            html_lecture = render_to_string(
+            html_lecture = _rendre_partial(
                 "front/includes/lecture_principale.html",
                 contexte_partage,
                 request=request,
@@ -917,27 +1570,26 @@ class LectureViewSet(viewsets.ViewSet):
             # 2. Partial OOB : panneau d'analyse injecte dans le sidebar droit
             # Le hx-swap-oob="innerHTML:#panneau-extractions" dit a HTMX :
             # "remplace le contenu de #panneau-extractions avec ce HTML"
-            html_panneau_analyse = render_to_string(
+            html_panneau_analyse = _rendre_partial(
                 "front/includes/panneau_analyse.html",
                 contexte_partage,
                 request=request,
             )
-            html_panneau_oob = (
-                '<div id="panneau-extractions" hx-swap-oob="innerHTML:#panneau-extractions">'
-                + html_panneau_analyse
-                + '</div>'
-            )
-
-            # On concatene les deux morceaux : HTMX traite l'OOB automatiquement
-            html_complet = html_lecture + html_panneau_oob
+            # Lecture + panneau OOB assembles en un seul join (une allocation)
+            # / Reading + OOB panel built in a single join (one allocation)
+            html_complet = "".join((
+                html_lecture,
+                '<div id="panneau-extractions" hx-swap-oob="innerHTML:#panneau-extractions">',
+                html_panneau_analyse,
+                '</div>',
+            ))
             return HttpResponse(html_complet)
 
         # Acces direct (F5) → page complete avec le panneau pre-charge
-        # On passe aussi le job, les entites et le HTML annote
-        # Determiner si l'utilisateur est proprietaire du dossier pour les controles UI
-        # / Determine if user is the folder owner for UI controls
-        est_proprietaire = _est_proprietaire_dossier(request.user, page)
-
+        # On passe aussi le job, les entites et le HTML annote ; est_proprietaire
+        # est celui deja calcule pour le contexte commun.
+        # / Direct access (F5) → full page with the preloaded panel; est_proprietaire
+        # / is the one already computed for the common context.
         return render(request, "front/base.html", {
             "page_preloaded": page,
             "html_annote": html_annote,
@@ -969,10 +1621,8 @@ class LectureViewSet(viewsets.ViewSet):
         # / Annotate text with already found entities (partial annotations)
         html_annote = None
         if entites_deja_creees.exists():
-            html_annote = annoter_html_avec_barres(
-                page.html_readability or '',
-                page.text_readability or '',
-                list(entites_deja_creees),
+            html_annote = _annoter_html_memorise(
+                page.html_readability or '', list(entites_deja_creees),
             )
 
         # Versions de la page / Page versions
@@ -1015,7 +1665,7 @@ class LectureViewSet(viewsets.ViewSet):
             # / the reading partial with partial annotations already applied,
             # / and an HX-Trigger toast informs the user. The "tasks" button
             # / in the toolbar will notify them when analysis completes.
-            html_lecture = render_to_string(
+            html_lecture = _rendre_partial(
                 "front/includes/lecture_principale.html",
                 contexte_lecture,
                 request=request,
@@ -1059,7 +1709,7 @@ class LectureViewSet(viewsets.ViewSet):
         refus = _exiger_authentification(request)
         if refus:
             return refus
-        page = get_object_or_404(Page, pk=pk)
+        page = get_object_or_404(Page.objects.defer(*CHAMPS_LOURDS_PAGE), pk=pk)
 
         # Validation via serializer DRF
         # / Validation via DRF serializer
@@ -1091,10 +1741,12 @@ class LectureViewSet(viewsets.ViewSet):
 
         # Rendu du partial de lecture (meme logique que retrieve)
         # / Render reading partial (same logic as retrieve)
-        analyseurs_actifs = AnalyseurSyntaxique.objects.filter(is_active=True, type_analyseur="analyser")
+        analyseurs_actifs = _get_analyseurs_actifs()
         dernier_job_termine = ExtractionJob.objects.filter(
             page=page, status="completed",
-        ).select_related("analyseur_version").order_by("-created_at").first()
+        ).select_related("analyseur_version").defer(
+            *CHAMPS_LOURDS_EXTRACTION_JOB,
+        ).order_by("-created_at").first()
 
         entites_existantes = None
         html_annote = None
@@ -1107,9 +1759,8 @@ class LectureViewSet(viewsets.ViewSet):
             entites_existantes, ids_entites_commentees = _annoter_entites_avec_commentaires(
                 toutes_entites
             )
-            html_annote = annoter_html_avec_barres(
-                page.html_readability, page.text_readability,
-                entites_existantes, ids_entites_commentees,
+            html_annote = _annoter_html_memorise(
+                page.html_readability, entites_existantes, ids_entites_commentees,
             )
 
         toutes_les_versions = page.toutes_les_versions
@@ -1124,7 +1775,7 @@ class LectureViewSet(viewsets.ViewSet):
             "page_racine": page.page_racine,
         }
 
-        html_lecture = render_to_string(
+        html_lecture = _rendre_partial(
             "front/includes/lecture_principale.html",
             contexte_partage,
             request=request,
@@ -1132,17 +1783,10 @@ class LectureViewSet(viewsets.ViewSet):
 
         # OOB swap : arbre mis a jour via _render_arbre
         # / OOB swap: updated tree via _render_arbre
-        reponse_arbre = _render_arbre(request)
-        html_arbre_oob = (
-            '<div id="arbre" hx-swap-oob="innerHTML:#arbre">'
-            + reponse_arbre.content.decode()
-            + '</div>'
-        )
+        html_arbre_oob = _html_arbre_oob(request)
 
         reponse = HttpResponse(html_lecture + html_arbre_oob)
-        reponse["HX-Trigger"] = json.dumps({
-            "showToast": {"message": "Titre modifi\u00e9"},
-        })
+        reponse["HX-Trigger"] = HX_TRIGGER_TITRE_MODIFIE
         return reponse
 
     @action(detail=True, methods=["GET"], url_path="historique")
@@ -1155,7 +1799,7 @@ class LectureViewSet(viewsets.ViewSet):
         - HTMX request → historique_page.html partial
         - Direct access (F5) → full base.html page with preloaded history
         """
-        page = get_object_or_404(Page, pk=pk)
+        page = get_object_or_404(Page.objects.defer(*CHAMPS_LOURDS_PAGE), pk=pk)
 
         # Verifier l'acces en lecture a la page via son dossier
         # / Check read access to the page via its folder
@@ -1594,7 +2238,7 @@ class LectureViewSet(viewsets.ViewSet):
         / If a job is already running → returns the polling template directly.
         / If the last job errored → shows the error with option to re-launch.
         """
-        page = get_object_or_404(Page, pk=pk)
+        page = get_object_or_404(Page.objects.defer(*CHAMPS_LOURDS_PAGE), pk=pk)
 
         # Acces direct (F5) → rediriger vers la page de lecture
         # Cette vue ne sert que comme partial HTMX, pas en acces direct
@@ -1638,9 +2282,8 @@ class LectureViewSet(viewsets.ViewSet):
         if analyseur_id:
             analyseur = get_object_or_404(AnalyseurSyntaxique, pk=analyseur_id)
         else:
-            analyseur = AnalyseurSyntaxique.objects.filter(
-                is_active=True, type_analyseur="analyser",
-            ).first()
+            analyseurs_actifs = _get_analyseurs_actifs()
+            analyseur = analyseurs_actifs[0] if analyseurs_actifs else None
             if not analyseur:
                 reponse = HttpResponse(status=400)
                 reponse["HX-Trigger"] = json.dumps({
@@ -1650,13 +2293,13 @@ class LectureViewSet(viewsets.ViewSet):
 
         # Tous les analyseurs actifs de type "analyser" pour le selecteur
         # / All active analyzers of type "analyser" for the selector
-        tous_les_analyseurs_actifs = AnalyseurSyntaxique.objects.filter(
-            is_active=True, type_analyseur="analyser",
-        ).order_by("name")
+        tous_les_analyseurs_actifs = sorted(
+            _get_analyseurs_actifs(), key=lambda analyseur_actif: analyseur_actif.name,
+        )
 
         # Recupere le modele IA actif depuis la configuration singleton
         # / Get active AI model from singleton configuration
-        configuration_ia = Configuration.get_solo()
+        configuration_ia = _get_configuration_ia()
         modele_ia_actif = configuration_ia.ai_model
         if not modele_ia_actif:
             reponse = HttpResponse(status=400)
@@ -1674,7 +2317,6 @@ class LectureViewSet(viewsets.ViewSet):
         # / Builds the full prompt using the same pipeline as tasks.py.
         # / We instantiate LangExtract's QAPromptGenerator to get the exact overhead
         # / (description + JSON-formatted examples) sent with each chunk.
-        import tiktoken
         import math
         import langextract.prompting as prompting_lx
         from langextract.core import data as data_lx, format_handler as fh_lx
@@ -1682,9 +2324,11 @@ class LectureViewSet(viewsets.ViewSet):
 
         # Pieces de prompt concatenees (description envoyee au LLM)
         # / Prompt pieces concatenated (description sent to the LLM)
-        pieces_ordonnees = PromptPiece.objects.filter(
+        # Liste materialisee une fois : sert au texte ET au compteur (pas de COUNT en plus)
+        # / List materialized once: used for the text AND the counter (no extra COUNT)
+        pieces_ordonnees = list(PromptPiece.objects.filter(
             analyseur=analyseur,
-        ).order_by("order")
+        ).only("content").order_by("order"))
         segments_contenu_prompt = []
         for piece in pieces_ordonnees:
             segments_contenu_prompt.append(piece.content)
@@ -1741,10 +2385,9 @@ class LectureViewSet(viewsets.ViewSet):
         # / So: total_input_tokens = N_chunks × tokens(overhead) + tokens(total_text).
         # / We use tiktoken (cl100k_base) as approximation — the real tokenizer
         # / varies by model (Gemini, GPT, etc.) but the gap is < 10%.
-        encodeur_tokens = tiktoken.get_encoding("cl100k_base")
-
-        tokens_overhead_par_chunk = len(encodeur_tokens.encode(prompt_overhead_reel))
-        tokens_texte_source = len(encodeur_tokens.encode(texte_source_page))
+        tokens_overhead_par_chunk, tokens_texte_source = _compter_tokens_par_lot(
+            [prompt_overhead_reel, texte_source_page],
+        )
 
         # Nombre de chunks estimes (langextract coupe aux frontieres de phrases,
         # mais on approxime avec un decoupage brut par taille de buffer)
@@ -1809,7 +2452,7 @@ class LectureViewSet(viewsets.ViewSet):
             "cout_estime_euros": cout_estime_euros,
             "prompt_complet": prompt_complet,
             "nombre_exemples": tous_les_exemples.count(),
-            "nombre_pieces": pieces_ordonnees.count(),
+            "nombre_pieces": len(pieces_ordonnees),
             "nombre_chunks_estime": nombre_chunks_estime,
             "tokens_overhead_par_chunk": tokens_overhead_par_chunk,
             "nombre_entites_ia_sans_commentaires": entites_ia_sans_commentaires,
@@ -1839,7 +2482,7 @@ class LectureViewSet(viewsets.ViewSet):
             })
             return reponse
 
-        page = get_object_or_404(Page, pk=pk)
+        page = get_object_or_404(Page.objects.defer(*CHAMPS_LOURDS_PAGE), pk=pk)
 
         # Verifier les droits d'ecriture sur le dossier de la page
         # / Check write permissions on the page's folder
@@ -1860,23 +2503,15 @@ class LectureViewSet(viewsets.ViewSet):
             # / The user will be notified via the "tasks" button in the toolbar.
             logger.info("analyser: job deja en cours pk=%s pour page=%s", job_en_cours.pk, pk)
             reponse = HttpResponse(status=200)
-            reponse["HX-Trigger"] = json.dumps({
-                "showToast": {
-                    "message": "Une analyse est deja en cours pour cette page.",
-                    "icon": "info",
-                },
-                "fermerDrawer": {},
-                "tachesChanged": {},
-            })
+            reponse["HX-Trigger"] = HX_TRIGGER_ANALYSE_DEJA_EN_COURS
             return reponse
 
         # Si analyseur_id n'est pas fourni, utiliser le premier analyseur actif de type "analyser"
         # / If analyseur_id is not provided, use the first active analyzer of type "analyser"
         donnees_requete = request.data.copy() if hasattr(request.data, 'copy') else dict(request.data)
         if not donnees_requete.get("analyseur_id"):
-            analyseur_par_defaut = AnalyseurSyntaxique.objects.filter(
-                is_active=True, type_analyseur="analyser",
-            ).first()
+            analyseurs_actifs = _get_analyseurs_actifs()
+            analyseur_par_defaut = analyseurs_actifs[0] if analyseurs_actifs else None
             if not analyseur_par_defaut:
                 return render(request, "front/includes/extraction_results.html", {
                     "error_message": "Aucun analyseur actif trouvé. Configurez un analyseur via /api/analyseurs/.",
@@ -1898,7 +2533,7 @@ class LectureViewSet(viewsets.ViewSet):
 
         # Utiliser le modele selectionne dans la configuration singleton (sidebar)
         # / Use the model selected in the singleton configuration (sidebar)
-        configuration_ia = Configuration.get_solo()
+        configuration_ia = _get_configuration_ia()
         ai_model_actif = configuration_ia.ai_model
         if not ai_model_actif:
             return render(request, "front/includes/extraction_results.html", {
@@ -1937,24 +2572,25 @@ class LectureViewSet(viewsets.ViewSet):
         prompt_snapshot = "\n".join(piece.content for piece in pieces_ordonnees)
 
         # Creer le job d'extraction en status PENDING (l'analyseur_id suffit,
-        # la tache Celery reconstruira les exemples depuis la DB)
+        # la tache Celery reconstruira les exemples depuis la DB) et lancer la
+        # tache Celery en arriere-plan, sous verrou de la page (anti-doublon).
         # / Create extraction job in PENDING status (analyseur_id is enough,
-        # the Celery task will rebuild examples from DB)
-        job_extraction = ExtractionJob.objects.create(
-            page=page,
+        # the Celery task will rebuild examples from DB) and launch the Celery
+        # task in background, under the page lock (anti-duplicate).
+        job_extraction, job_concurrent = _creer_job_et_lancer_tache(
+            page, analyser_page_task, {},
             ai_model=ai_model_actif,
             name=f"Analyseur: {analyseur.name}",
             prompt_description=prompt_snapshot,
-            status="pending",
             raw_result={
                 "analyseur_id": analyseur.pk,
             },
         )
-
-        # Lancer la tache Celery en arriere-plan
-        # / Launch the Celery task in background
-        from front.tasks import analyser_page_task
-        analyser_page_task.delay(job_extraction.pk)
+        if job_concurrent:
+            logger.info("analyser: job concurrent pk=%s pour page=%s", job_concurrent.pk, pk)
+            reponse = HttpResponse(status=200)
+            reponse["HX-Trigger"] = HX_TRIGGER_ANALYSE_DEJA_EN_COURS
+            return reponse
 
         logger.info(
             "analyser: job pk=%s cree pour page=%s analyseur=%s — tache Celery lancee",
@@ -1988,7 +2624,7 @@ class LectureViewSet(viewsets.ViewSet):
         / and returns confirmation_synthese.html in #drawer-contenu.
         / If a synthesis job is running \u2192 returns the polling partial.
         """
-        page = get_object_or_404(Page, pk=pk)
+        page = get_object_or_404(Page.objects.defer(*CHAMPS_LOURDS_PAGE), pk=pk)
 
         # Acces direct (F5) \u2192 rediriger vers la lecture / Direct access (F5) \u2192 redirect
         if not request.headers.get("HX-Request"):
@@ -2046,7 +2682,7 @@ class LectureViewSet(viewsets.ViewSet):
         ).order_by("-est_par_defaut", "name")
 
         # Modele IA actif / Active AI model
-        configuration_ia = Configuration.get_solo()
+        configuration_ia = _get_configuration_ia()
         modele_ia_actif = configuration_ia.ai_model
         if not modele_ia_actif:
             reponse_erreur = HttpResponse(status=400)
@@ -2080,22 +2716,26 @@ class LectureViewSet(viewsets.ViewSet):
 
         # Construire le prompt complet pour l'estimation et l'affichage
         # / Build the full prompt for estimation and display
-        from front.tasks import _construire_prompt_synthese
-        pieces_ordonnees = PromptPiece.objects.filter(
+        pieces_ordonnees = list(PromptPiece.objects.filter(
             analyseur=analyseur_synthese,
-        ).order_by("order")
+        ).only("content").order_by("order"))
         prompt_systeme = "\n".join(piece.content for piece in pieces_ordonnees)
         prompt_utilisateur = _construire_prompt_synthese(
             page, dernier_job_analyse, analyseur_synthese,
         )
         prompt_complet = prompt_systeme + "\n\n" + prompt_utilisateur
 
-        # Estimation tokens (pas de chunking pour la synthese, 1 seul appel)
-        # / Token estimation (no chunking for synthesis, single call)
-        import tiktoken
+        # Estimation tokens (pas de chunking pour la synthese, 1 seul appel).
+        # Prompt systeme et prompt utilisateur sont encodes en lot plutot que
+        # de re-tokeniser la concatenation ; le separateur compte pour 1 token.
+        # / Token estimation (no chunking for synthesis, single call).
+        # / System and user prompts are encoded as a batch instead of
+        # / re-tokenizing the concatenation; the separator counts as 1 token.
         import math
-        encodeur_tokens = tiktoken.get_encoding("cl100k_base")
-        nombre_tokens_input = len(encodeur_tokens.encode(prompt_complet))
+        tokens_prompt_systeme, tokens_prompt_utilisateur = _compter_tokens_par_lot(
+            [prompt_systeme, prompt_utilisateur],
+        )
+        nombre_tokens_input = tokens_prompt_systeme + 1 + tokens_prompt_utilisateur
         nombre_tokens_output_visible = int(nombre_tokens_input * 0.5)
         multiplicateur_thinking = modele_ia_actif.multiplicateur_thinking()
         nombre_tokens_thinking = nombre_tokens_output_visible * (multiplicateur_thinking - 1)
@@ -2132,7 +2772,7 @@ class LectureViewSet(viewsets.ViewSet):
             "analyseur": analyseur_synthese,
             "analyseurs_actifs": tous_les_analyseurs_synthese,
             "modele_ia": modele_ia_actif,
-            "nombre_pieces": pieces_ordonnees.count(),
+            "nombre_pieces": len(pieces_ordonnees),
             "nombre_tokens_input": nombre_tokens_input,
             "nombre_tokens_output_visible": nombre_tokens_output_visible,
             "nombre_tokens_thinking": nombre_tokens_thinking,
@@ -2182,7 +2822,7 @@ class LectureViewSet(viewsets.ViewSet):
             })
             return reponse
 
-        page = get_object_or_404(Page, pk=pk)
+        page = get_object_or_404(Page.objects.defer(*CHAMPS_LOURDS_PAGE), pk=pk)
 
         # Verifier les droits d'ecriture sur le dossier de la page
         # / Check write permissions on the page's folder
@@ -2204,14 +2844,7 @@ class LectureViewSet(viewsets.ViewSet):
             # / The user will be notified via the "tasks" button in the toolbar.
             logger.info("synthetiser: job deja en cours pk=%s pour page=%s", job_synthese_en_cours.pk, pk)
             reponse = HttpResponse(status=200)
-            reponse["HX-Trigger"] = json.dumps({
-                "showToast": {
-                    "message": "Une synthese est deja en cours pour cette page.",
-                    "icon": "info",
-                },
-                "fermerDrawer": {},
-                "tachesChanged": {},
-            })
+            reponse["HX-Trigger"] = HX_TRIGGER_SYNTHESE_DEJA_EN_COURS
             return reponse
 
         # Trouver l'analyseur de synthese : depuis le formulaire ou le default.
@@ -2264,7 +2897,7 @@ class LectureViewSet(viewsets.ViewSet):
 
         # Utiliser le modele selectionne dans la configuration singleton
         # / Use the model selected in the singleton configuration
-        configuration_ia = Configuration.get_solo()
+        configuration_ia = _get_configuration_ia()
         modele_ia_actif = configuration_ia.ai_model
         if not modele_ia_actif:
             reponse_erreur = HttpResponse(status=400)
@@ -2283,24 +2916,25 @@ class LectureViewSet(viewsets.ViewSet):
         ).order_by("order")
         prompt_snapshot = "\n".join(piece.content for piece in pieces_ordonnees)
 
-        # Creer le job d'extraction en status PENDING
-        # / Create extraction job in PENDING status
-        job_synthese = ExtractionJob.objects.create(
-            page=page,
+        # Creer le job d'extraction en status PENDING et lancer la tache Celery
+        # en arriere-plan, sous verrou de la page (anti-doublon)
+        # / Create extraction job in PENDING status and launch the Celery task
+        # / in background, under the page lock (anti-duplicate)
+        job_synthese, job_concurrent = _creer_job_et_lancer_tache(
+            page, synthetiser_page_task, {"raw_result__est_synthese": True},
             ai_model=modele_ia_actif,
             name="Synthèse délibérative",
             prompt_description=prompt_snapshot,
-            status="pending",
             raw_result={
                 "analyseur_id": analyseur_synthese.pk,
                 "est_synthese": True,
             },
         )
-
-        # Lancer la tache Celery en arriere-plan
-        # / Launch the Celery task in background
-        from front.tasks import synthetiser_page_task
-        synthetiser_page_task.delay(job_synthese.pk)
+        if job_concurrent:
+            logger.info("synthetiser: job concurrent pk=%s pour page=%s", job_concurrent.pk, pk)
+            reponse = HttpResponse(status=200)
+            reponse["HX-Trigger"] = HX_TRIGGER_SYNTHESE_DEJA_EN_COURS
+            return reponse
 
         logger.info(
             "synthetiser: job pk=%s cree pour page=%s — tache Celery lancee",
@@ -2330,7 +2964,7 @@ class LectureViewSet(viewsets.ViewSet):
         Retourne le partial modal pour renommer un locuteur.
         / Returns the modal partial for renaming a speaker.
         """
-        page = get_object_or_404(Page, pk=pk)
+        page = get_object_or_404(Page.objects.defer(*CHAMPS_LOURDS_PAGE), pk=pk)
         ancien_nom = request.query_params.get("speaker", "")
         index_bloc = request.query_params.get("block_index", "0")
 
@@ -2351,7 +2985,7 @@ class LectureViewSet(viewsets.ViewSet):
             return refus
         from .services.transcription_audio import construire_html_diarise
 
-        page = get_object_or_404(Page, pk=pk)
+        page = get_object_or_404(Page.objects.defer(*CHAMPS_LOURDS_PAGE), pk=pk)
 
         # Valider les donnees du formulaire / Validate form data
         serializer_renommage = RenommerLocuteurSerializer(data=request.data)
@@ -2436,7 +3070,11 @@ class LectureViewSet(viewsets.ViewSet):
         html_reconstruit, texte_reconstruit = construire_html_diarise(segments_existants)
         page.html_readability = html_reconstruit
         page.text_readability = texte_reconstruit
-        page.save()
+        # Seules les colonnes de transcription changent : on n'ecrit pas html_original
+        # / Only the transcription columns change: html_original is not rewritten
+        page.save(update_fields=[
+            "transcription_raw", "html_readability", "text_readability", "updated_at",
+        ])
 
         # Enregistrer l'edition dans l'historique (PHASE-27a)
         # / Record the edit in history (PHASE-27a)
@@ -2455,11 +3093,11 @@ class LectureViewSet(viewsets.ViewSet):
         toutes_les_versions = page.toutes_les_versions
         page_racine = page.page_racine
 
-        reponse_renommage = render(request, "front/includes/lecture_principale.html", {
+        reponse_renommage = HttpResponse(_rendre_partial("front/includes/lecture_principale.html", {
             "page": page,
             "versions": toutes_les_versions,
             "page_racine": page_racine,
-        })
+        }, request))
         # Fermer la modale de renommage via un event HTMX
         # / Close the rename modal via an HTMX event
         reponse_renommage["HX-Trigger"] = json.dumps({
@@ -2478,7 +3116,7 @@ class LectureViewSet(viewsets.ViewSet):
         """
         from .services.transcription_audio import COULEURS_LOCUTEURS, _formater_timestamp
 
-        page = get_object_or_404(Page, pk=pk)
+        page = get_object_or_404(Page.objects.defer(*CHAMPS_LOURDS_PAGE), pk=pk)
         index_bloc = int(request.query_params.get("block_index", "0"))
 
         # Extraire le texte et les metadonnees du bloc cible depuis transcription_raw
@@ -2553,7 +3191,7 @@ class LectureViewSet(viewsets.ViewSet):
             return refus
         from .services.transcription_audio import construire_html_diarise
 
-        page = get_object_or_404(Page, pk=pk)
+        page = get_object_or_404(Page.objects.defer(*CHAMPS_LOURDS_PAGE), pk=pk)
 
         # Valider les donnees du formulaire / Validate form data
         serializer_edition = EditerBlocSerializer(data=request.data)
@@ -2644,7 +3282,9 @@ class LectureViewSet(viewsets.ViewSet):
         html_reconstruit, texte_reconstruit = construire_html_diarise(segments_existants)
         page.html_readability = html_reconstruit
         page.text_readability = texte_reconstruit
-        page.save()
+        page.save(update_fields=[
+            "transcription_raw", "html_readability", "text_readability", "updated_at",
+        ])
 
         # Enregistrer l'edition dans l'historique (PHASE-27a)
         # / Record the edit in history (PHASE-27a)
@@ -2663,7 +3303,9 @@ class LectureViewSet(viewsets.ViewSet):
         html_annote = None
         dernier_job_termine = ExtractionJob.objects.filter(
             page=page, status="completed",
-        ).select_related("analyseur_version").order_by("-created_at").first()
+        ).select_related("analyseur_version").defer(
+            *CHAMPS_LOURDS_EXTRACTION_JOB,
+        ).order_by("-created_at").first()
         if dernier_job_termine:
             # Entites de TOUS les jobs termines (coherent avec le drawer E)
             # / Entities from ALL completed jobs (consistent with the E drawer)
@@ -2671,20 +3313,19 @@ class LectureViewSet(viewsets.ViewSet):
             entites_existantes, ids_entites_commentees = _annoter_entites_avec_commentaires(
                 ExtractedEntity.objects.filter(job__in=tous_les_jobs_page, masquee=False)
             )
-            html_annote = annoter_html_avec_barres(
-                page.html_readability, page.text_readability,
-                entites_existantes, ids_entites_commentees,
+            html_annote = _annoter_html_memorise(
+                page.html_readability, entites_existantes, ids_entites_commentees,
             )
 
         toutes_les_versions = page.toutes_les_versions
         page_racine = page.page_racine
 
-        return render(request, "front/includes/lecture_principale.html", {
+        return HttpResponse(_rendre_partial("front/includes/lecture_principale.html", {
             "page": page,
             "html_annote": html_annote,
             "versions": toutes_les_versions,
             "page_racine": page_racine,
-        })
+        }, request))
 
     @action(detail=True, methods=["POST"], url_path="supprimer_bloc")
     def supprimer_bloc(self, request, pk=None):
@@ -2697,7 +3338,7 @@ class LectureViewSet(viewsets.ViewSet):
             return refus
         from .services.transcription_audio import construire_html_diarise
 
-        page = get_object_or_404(Page, pk=pk)
+        page = get_object_or_404(Page.objects.defer(*CHAMPS_LOURDS_PAGE), pk=pk)
 
         # Valider les donnees / Validate data
         serializer_suppression = SupprimerBlocSerializer(data=request.data)
@@ -2743,14 +3384,18 @@ class LectureViewSet(viewsets.ViewSet):
         html_reconstruit, texte_reconstruit = construire_html_diarise(segments_existants)
         page.html_readability = html_reconstruit
         page.text_readability = texte_reconstruit
-        page.save()
+        page.save(update_fields=[
+            "transcription_raw", "html_readability", "text_readability", "updated_at",
+        ])
 
         # Re-annoter le HTML avec les barres d'extraction si un job existe
         # / Re-annotate HTML with extraction bars if a job exists
         html_annote = None
         dernier_job_termine = ExtractionJob.objects.filter(
             page=page, status="completed",
-        ).select_related("analyseur_version").order_by("-created_at").first()
+        ).select_related("analyseur_version").defer(
+            *CHAMPS_LOURDS_EXTRACTION_JOB,
+        ).order_by("-created_at").first()
         if dernier_job_termine:
             # Entites de TOUS les jobs termines (coherent avec le drawer E)
             # / Entities from ALL completed jobs (consistent with the E drawer)
@@ -2758,20 +3403,19 @@ class LectureViewSet(viewsets.ViewSet):
             entites_existantes, ids_entites_commentees = _annoter_entites_avec_commentaires(
                 ExtractedEntity.objects.filter(job__in=tous_les_jobs_page, masquee=False)
             )
-            html_annote = annoter_html_avec_barres(
-                page.html_readability, page.text_readability,
-                entites_existantes, ids_entites_commentees,
+            html_annote = _annoter_html_memorise(
+                page.html_readability, entites_existantes, ids_entites_commentees,
             )
 
         toutes_les_versions = page.toutes_les_versions
         page_racine = page.page_racine
 
-        return render(request, "front/includes/lecture_principale.html", {
+        return HttpResponse(_rendre_partial("front/includes/lecture_principale.html", {
             "page": page,
             "html_annote": html_annote,
             "versions": toutes_les_versions,
             "page_racine": page_racine,
-        })
+        }, request))
 
 
 class DossierViewSet(viewsets.ViewSet):
@@ -2789,7 +3433,16 @@ class DossierViewSet(viewsets.ViewSet):
             ).order_by("name")
         else:
             tous_les_dossiers = Dossier.objects.none()
-        data = {str(d.pk): d.name for d in tous_les_dossiers}
+        # Seuls pk et name sont lus : tuples bruts, pas d'instances Dossier.
+        # iterator() : les tuples ne sont pas gardes dans le cache du queryset.
+        # / Only pk and name are read: raw tuples, no Dossier instances.
+        # / iterator(): tuples are not kept in the queryset cache.
+        data = {
+            str(pk_dossier): nom_dossier
+            for pk_dossier, nom_dossier in tous_les_dossiers.values_list(
+                "pk", "name",
+            ).iterator(chunk_size=2000)
+        }
         return JsonResponse(data)
 
     def create(self, request):
@@ -3209,23 +3862,50 @@ class PageViewSet(viewsets.ViewSet):
         refus = _exiger_authentification(request)
         if refus:
             return refus
-        page = get_object_or_404(Page, pk=pk)
+        # Seuls dossier_id et le owner_id du dossier source sont lus : pas les
+        # gros TextField de la page, ni de requete supplementaire pour page.dossier.
+        # / Only dossier_id and the source folder owner_id are read: not the page's
+        # / large TextFields, nor an extra query for page.dossier.
+        page = get_object_or_404(
+            Page.objects.select_related("dossier").only("dossier", "dossier__owner"),
+            pk=pk,
+        )
 
         serializer = PageClasserSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         dossier_id = serializer.validated_data["dossier_id"]
-        dossier_destination = get_object_or_404(Dossier, pk=dossier_id) if dossier_id else None
+
+        # Page deja dans ce dossier (dont l'utilisateur est owner) : rien a ecrire
+        # ni a re-rendre, l'arbre affiche est deja juste. Les autres cas passent
+        # par le controle d'ownership habituel.
+        # / Page already in this folder (owned by the user): nothing to write or
+        # / re-render, the displayed tree is already right. Other cases go through
+        # / the usual ownership check.
+        est_deja_classee = (
+            dossier_id is not None
+            and page.dossier_id == dossier_id
+            and page.dossier.owner_id == request.user.pk
+        )
+        if est_deja_classee:
+            return HttpResponse(status=204)
+
+        dossier_destination = (
+            get_object_or_404(Dossier.objects.only("owner"), pk=dossier_id) if dossier_id else None
+        )
 
         # Verifier ownership : l'utilisateur doit etre owner du dossier source OU destination
+        # (comparaison des owner_id, sans charger les utilisateurs)
         # / Check ownership: user must be owner of source OR destination folder
-        est_owner_source = page.dossier and page.dossier.owner == request.user
-        est_owner_destination = dossier_destination and dossier_destination.owner == request.user
+        # / (owner_id comparison, without loading the users)
+        est_owner_source = page.dossier and page.dossier.owner_id == request.user.pk
+        est_owner_destination = dossier_destination and dossier_destination.owner_id == request.user.pk
         if not est_owner_source and not est_owner_destination:
             return _reponse_acces_refuse(request)
 
-        page.dossier = dossier_destination
-        page.save(update_fields=["dossier"])
+        # UPDATE direct de la seule colonne dossier_id (aucun signal sur Page)
+        # / Direct UPDATE of the dossier_id column only (no signal on Page)
+        Page.objects.filter(pk=page.pk).update(dossier=dossier_destination)
 
         return _render_arbre(request)
 
@@ -3248,6 +3928,102 @@ def _calculer_teinte_contributeur(username):
     return int(digest[:8], 16) % 360
 
 
+# Champs dynamiques du formulaire d'extraction : attr_key_N / attr_val_N
+# / Dynamic fields of the extraction form: attr_key_N / attr_val_N
+REGEX_CHAMP_ATTRIBUT_DYNAMIQUE = re.compile(r"^attr_(key|val)_(\d+)$")
+
+
+def _lire_attributs_dynamiques(donnees_formulaire):
+    """
+    Lit les paires attr_key_N / attr_val_N du formulaire.
+    Le formulaire envoie attr_count : on lit alors exactement N index (borne
+    par le nombre de champs envoyes).
+    Sans attr_count (anciens formulaires en cache navigateur), un seul passage
+    sur les champs envoyes (pas de sondage d'index fixes).
+    Les paires dont la cle ou la valeur est vide sont ignorees.
+    / Reads attr_key_N / attr_val_N pairs from form data.
+    / The form sends attr_count: exactly N indices are then read (bounded by
+    / the number of submitted fields).
+    / Without attr_count (old forms cached by the browser), a single pass
+    / over the submitted fields (no probing of fixed indices).
+    / Pairs with an empty key or value are skipped.
+
+    LOCALISATION : front/views.py
+
+    :param donnees_formulaire: request.data (QueryDict ou dict)
+    :return: dict {cle: valeur} dans l'ordre des index
+    """
+    nombre_attributs_declare = str(donnees_formulaire.get("attr_count", "")).strip()
+    if nombre_attributs_declare.isdigit():
+        # attr_count vient du client : il ne peut pas y avoir plus de paires que
+        # de champs envoyes, on ne sonde donc jamais au-dela.
+        # / attr_count comes from the client: there cannot be more pairs than
+        # / submitted fields, so we never probe beyond that.
+        nombre_index_a_lire = min(int(nombre_attributs_declare), len(donnees_formulaire))
+        attributs_entite = {}
+        for index_attribut in range(nombre_index_a_lire):
+            cle = str(donnees_formulaire.get(f"attr_key_{index_attribut}", "")).strip()
+            valeur = str(donnees_formulaire.get(f"attr_val_{index_attribut}", "")).strip()
+            if cle and valeur:
+                attributs_entite[cle] = valeur
+        return attributs_entite
+
+    paires_par_index = {}
+    for nom_champ, valeur_champ in donnees_formulaire.items():
+        correspondance = REGEX_CHAMP_ATTRIBUT_DYNAMIQUE.match(nom_champ)
+        if not correspondance:
+            continue
+        type_champ = correspondance.group(1)
+        index_attribut = int(correspondance.group(2))
+        paire = paires_par_index.setdefault(index_attribut, {"key": "", "val": ""})
+        paire[type_champ] = str(valeur_champ).strip()
+
+    attributs_entite = {}
+    for index_attribut in sorted(paires_par_index):
+        paire = paires_par_index[index_attribut]
+        if paire["key"] and paire["val"]:
+            attributs_entite[paire["key"]] = paire["val"]
+    return attributs_entite
+
+
+# Separateur souple : espace ou espace insecable
+# / Soft separator: space or non-breaking space
+REGEX_ESPACE_SOUPLE = re.compile("[ \xa0]")
+
+
+def _trouver_texte_espaces_souples(texte_source, texte_recherche):
+    """
+    Cherche texte_recherche dans texte_source en considerant l'espace et
+    l'espace insecable comme equivalents. On tente d'abord str.find (cas
+    courant, recherche exacte en C) ; la regex souple ne tourne que si elle
+    peut trouver autre chose, c'est-a-dire si le texte cherche contient un
+    separateur. Aucune copie normalisee du texte source n'est allouee.
+    / Searches texte_recherche in texte_source treating space and non-breaking
+    / space as equivalent. str.find is tried first (common case, exact search
+    / in C); the soft regex only runs when it can find something else, i.e.
+    / when the searched text contains a separator. No normalized copy of the
+    / source text is allocated.
+
+    LOCALISATION : front/views.py
+
+    :return: position du premier caractere, ou -1 si absent
+    """
+    position_exacte = texte_source.find(texte_recherche)
+    if position_exacte != -1:
+        return position_exacte
+    morceaux = REGEX_ESPACE_SOUPLE.split(texte_recherche)
+    if len(morceaux) == 1:
+        return -1
+    morceaux_echappes = []
+    for morceau in morceaux:
+        morceaux_echappes.append(re.escape(morceau))
+    motif_souple = re.compile("[ \xa0]".join(morceaux_echappes))
+    correspondance = motif_souple.search(texte_source)
+    if correspondance is None:
+        return -1
+    return correspondance.start()
+
+
 class ExtractionViewSet(viewsets.ViewSet):
     """
     ViewSet pour les extractions de texte (manuelle et IA).
@@ -3266,45 +4042,64 @@ class ExtractionViewSet(viewsets.ViewSet):
         )
         return job_manuel
 
+    def _get_page_pour_extraction(self, page_id):
+        """
+        Charge une Page avec les seules colonnes lues par les actions d'extraction
+        et par panneau_analyse.html (html_original, transcription_raw, etc. restent en base).
+        / Loads a Page with only the columns read by extraction actions
+        / and panneau_analyse.html (html_original, transcription_raw, etc. stay in DB).
+        """
+        return get_object_or_404(
+            Page.objects.only("title", "url", "html_readability", "text_readability"),
+            pk=page_id,
+        )
+
     def _render_panneau_complet_avec_oob(self, request, page):
         """
         Re-rend le panneau d'analyse + OOB swap du readability-content annote.
         Re-renders analysis panel + OOB swap of annotated readability-content.
         """
-        analyseurs_actifs = AnalyseurSyntaxique.objects.filter(is_active=True, type_analyseur="analyser")
+        analyseurs_actifs = _get_analyseurs_actifs()
 
         # Toutes les entites de tous les jobs completed de la page
         # / All entities from all completed jobs for the page
-        tous_les_jobs_termines = ExtractionJob.objects.filter(
+        # Les jobs sont lus une seule fois : le dernier job du panneau en est deduit
+        # et les entites sont filtrees sur leurs ids (pas de sous-requete sur les jobs).
+        # / Jobs are read once: the panel's latest job is derived from them
+        # / and entities are filtered on their ids (no subquery on jobs).
+        tous_les_jobs_termines = list(ExtractionJob.objects.filter(
             page=page, status="completed",
-        )
+        ).select_related("analyseur_version").defer(*CHAMPS_LOURDS_EXTRACTION_JOB))
+        ids_jobs_termines = [job_termine.pk for job_termine in tous_les_jobs_termines]
 
         # Entites visibles (non masquees) pour l'annotation HTML
         # / Visible entities (not hidden) for HTML annotation
         entites_visibles, ids_entites_commentees = _annoter_entites_avec_commentaires(
             ExtractedEntity.objects.filter(
-                job__in=tous_les_jobs_termines,
+                job_id__in=ids_jobs_termines,
                 masquee=False,
-            ).order_by("start_char")
+            ).order_by("start_char"),
+            avec_fils_commentaires=True,
         )
 
         # Compteur d'entites masquees pour le drawer
         # / Hidden entities count for the drawer
         nombre_masquees = ExtractedEntity.objects.filter(
-            job__in=tous_les_jobs_termines,
+            job_id__in=ids_jobs_termines,
             masquee=True,
         ).count()
 
         # Annoter le HTML / Annotate HTML
-        html_annote = annoter_html_avec_barres(
-            page.html_readability, page.text_readability,
-            entites_visibles, ids_entites_commentees,
+        html_annote = _annoter_html_memorise(
+            page.html_readability, entites_visibles, ids_entites_commentees,
         )
 
         # Dernier job pour le contexte du panneau / Latest job for panel context
-        dernier_job = tous_les_jobs_termines.order_by("-created_at").first()
+        dernier_job = max(
+            tous_les_jobs_termines, key=lambda job_termine: job_termine.created_at, default=None,
+        )
 
-        html_panneau = render_to_string(
+        html_panneau = _rendre_partial(
             "front/includes/panneau_analyse.html",
             {
                 "page": page,
@@ -3317,15 +4112,16 @@ class ExtractionViewSet(viewsets.ViewSet):
             request=request,
         )
 
-        # OOB swap pour le contenu de lecture annote
-        # / OOB swap for annotated reading content
-        html_readability_oob = (
-            '<article id="readability-content" hx-swap-oob="innerHTML:#readability-content">'
-            + (html_annote or page.html_readability)
-            + '</article>'
-        )
-
-        return html_panneau + html_readability_oob
+        # Panneau + OOB swap du contenu de lecture annote, assembles en un seul join
+        # (evite les copies intermediaires sur les longs textes readability)
+        # / Panel + OOB swap of annotated reading content, built in a single join
+        # / (avoids intermediate copies on long readability texts)
+        return "".join((
+            html_panneau,
+            '<article id="readability-content" hx-swap-oob="innerHTML:#readability-content">',
+            html_annote or page.html_readability,
+            '</article>',
+        ))
 
     def _render_readability_avec_panneau_oob(self, request, page):
         """
@@ -3340,38 +4136,45 @@ class ExtractionViewSet(viewsets.ViewSet):
         / Used when main target is #readability-content (e.g. hide/restore
         / called from drawer JS via htmx.ajax).
         """
-        analyseurs_actifs = AnalyseurSyntaxique.objects.filter(is_active=True, type_analyseur="analyser")
+        analyseurs_actifs = _get_analyseurs_actifs()
 
         # Toutes les entites de tous les jobs completed de la page
         # / All entities from all completed jobs for the page
-        tous_les_jobs_termines = ExtractionJob.objects.filter(
+        # Les jobs sont lus une seule fois : le dernier job du panneau en est deduit
+        # et les entites sont filtrees sur leurs ids (pas de sous-requete sur les jobs).
+        # / Jobs are read once: the panel's latest job is derived from them
+        # / and entities are filtered on their ids (no subquery on jobs).
+        tous_les_jobs_termines = list(ExtractionJob.objects.filter(
             page=page, status="completed",
-        )
+        ).select_related("analyseur_version").defer(*CHAMPS_LOURDS_EXTRACTION_JOB))
+        ids_jobs_termines = [job_termine.pk for job_termine in tous_les_jobs_termines]
 
         # Entites visibles (non masquees) pour l'annotation HTML
         # / Visible entities (not hidden) for HTML annotation
         entites_visibles, ids_entites_commentees = _annoter_entites_avec_commentaires(
             ExtractedEntity.objects.filter(
-                job__in=tous_les_jobs_termines,
+                job_id__in=ids_jobs_termines,
                 masquee=False,
-            ).order_by("start_char")
+            ).order_by("start_char"),
+            avec_fils_commentaires=True,
         )
 
         # Compteur d'entites masquees pour le drawer
         # / Hidden entities count for the drawer
         nombre_masquees = ExtractedEntity.objects.filter(
-            job__in=tous_les_jobs_termines,
+            job_id__in=ids_jobs_termines,
             masquee=True,
         ).count()
 
         # Annoter le HTML / Annotate HTML
-        html_annote = annoter_html_avec_barres(
-            page.html_readability, page.text_readability,
-            entites_visibles, ids_entites_commentees,
+        html_annote = _annoter_html_memorise(
+            page.html_readability, entites_visibles, ids_entites_commentees,
         )
 
         # Dernier job pour le contexte du panneau / Latest job for panel context
-        dernier_job = tous_les_jobs_termines.order_by("-created_at").first()
+        dernier_job = max(
+            tous_les_jobs_termines, key=lambda job_termine: job_termine.created_at, default=None,
+        )
 
         # Contenu principal : readability annote
         # / Main content: annotated readability
@@ -3379,7 +4182,7 @@ class ExtractionViewSet(viewsets.ViewSet):
 
         # OOB swap pour le panneau d'extractions
         # / OOB swap for extraction panel
-        html_panneau = render_to_string(
+        html_panneau = _rendre_partial(
             "front/includes/panneau_analyse.html",
             {
                 "page": page,
@@ -3391,13 +4194,12 @@ class ExtractionViewSet(viewsets.ViewSet):
             },
             request=request,
         )
-        html_panneau_oob = (
-            '<div id="panneau-extractions" hx-swap-oob="innerHTML:#panneau-extractions">'
-            + html_panneau
-            + '</div>'
-        )
-
-        return html_readability_principal + html_panneau_oob
+        return "".join((
+            html_readability_principal,
+            '<div id="panneau-extractions" hx-swap-oob="innerHTML:#panneau-extractions">',
+            html_panneau,
+            '</div>',
+        ))
 
     @action(detail=False, methods=["POST"])
     def panneau(self, request):
@@ -3411,7 +4213,7 @@ class ExtractionViewSet(viewsets.ViewSet):
         page_id = request.data.get("page_id")
         if not page_id:
             return HttpResponse("page_id requis.", status=400)
-        page = get_object_or_404(Page, pk=page_id)
+        page = self._get_page_pour_extraction(page_id)
         html_complet = self._render_panneau_complet_avec_oob(request, page)
         return HttpResponse(html_complet)
 
@@ -3424,29 +4226,25 @@ class ExtractionViewSet(viewsets.ViewSet):
         refus = _exiger_authentification(request)
         if refus:
             return refus
-        logger.info(
-            "manuelle: content_type=%s data=%s",
-            request.content_type, dict(request.data),
-        )
         serializer = ExtractionSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         validated_text = serializer.validated_data["text"]
         validated_page_id = serializer.validated_data.get("page_id")
+        # Longueur seulement, jamais le texte selectionne (peut faire plusieurs Ko)
+        # / Length only, never the selected text (can be several KB)
+        logger.debug("manuelle: page=%s text_len=%d", validated_page_id, len(validated_text))
 
         if not validated_page_id:
             return HttpResponse("Aucune page selectionnee.", status=400)
 
-        page = get_object_or_404(Page, pk=validated_page_id)
+        page = self._get_page_pour_extraction(validated_page_id)
 
         # Calculer start_char dans text_readability cote serveur
         # / Compute start_char in text_readability server-side
-        start_char = page.text_readability.find(validated_text)
-        if start_char == -1:
-            # Fallback : recherche soft (nbsp → espace)
-            start_char = page.text_readability.replace('\xa0', ' ').find(
-                validated_text.replace('\xa0', ' ')
-            )
+        # Recherche exacte puis souple (nbsp == espace) sans copier le texte
+        # / Exact then soft search (nbsp == space) without copying the text
+        start_char = _trouver_texte_espaces_souples(page.text_readability, validated_text)
         end_char = start_char + len(validated_text) if start_char != -1 else 0
         if start_char == -1:
             start_char = 0
@@ -3458,7 +4256,7 @@ class ExtractionViewSet(viewsets.ViewSet):
             ("hypostase", ""),
         ]
 
-        html_formulaire = render_to_string(
+        html_formulaire = _rendre_partial(
             "front/includes/extraction_manuelle_form.html",
             {
                 "text": validated_text,
@@ -3483,10 +4281,6 @@ class ExtractionViewSet(viewsets.ViewSet):
         refus = _exiger_authentification(request)
         if refus:
             return refus
-        logger.info(
-            "creer_manuelle: content_type=%s data=%s",
-            request.content_type, {k: str(v)[:80] for k, v in request.data.items()},
-        )
         serializer = ExtractionManuelleSerializer(data=request.data)
         if not serializer.is_valid():
             logger.warning("creer_manuelle: validation echouee — %s", serializer.errors)
@@ -3496,18 +4290,15 @@ class ExtractionViewSet(viewsets.ViewSet):
             )
 
         donnees = serializer.validated_data
-        page = get_object_or_404(Page, pk=donnees["page_id"])
+        logger.debug(
+            "creer_manuelle: page=%s text_len=%d", donnees["page_id"], len(donnees["text"]),
+        )
+        page = self._get_page_pour_extraction(donnees["page_id"])
         job_manuel = self._get_or_create_job_manuel(page)
 
         # Lire les paires cle/valeur dynamiques depuis le formulaire
-        # (meme pattern que modifier)
-        # / Read dynamic key/value pairs from form data (same pattern as modifier)
-        attributs_entite = {}
-        for index_attribut in range(10):
-            cle = request.data.get(f"attr_key_{index_attribut}", "").strip()
-            valeur = request.data.get(f"attr_val_{index_attribut}", "").strip()
-            if cle and valeur:
-                attributs_entite[cle] = valeur
+        # / Read dynamic key/value pairs from form data
+        attributs_entite = _lire_attributs_dynamiques(request.data)
 
         ExtractedEntity.objects.create(
             job=job_manuel,
@@ -3521,10 +4312,7 @@ class ExtractionViewSet(viewsets.ViewSet):
 
         html_complet = self._render_panneau_complet_avec_oob(request, page)
         reponse = HttpResponse(html_complet)
-        reponse["HX-Trigger"] = json.dumps({
-            "ouvrirPanneauDroit": True,
-            "showToast": {"message": "Extraction cr\u00e9\u00e9e"},
-        })
+        reponse["HX-Trigger"] = HX_TRIGGER_EXTRACTION_CREEE
         return reponse
 
     @action(detail=False, methods=["GET"], url_path="carte_mobile")
@@ -3544,11 +4332,27 @@ class ExtractionViewSet(viewsets.ViewSet):
         if not identifiant_entite:
             return HttpResponse("entity_id requis.", status=400)
 
-        entite = get_object_or_404(ExtractedEntity, pk=identifiant_entite)
-
-        # Compter les commentaires pour cette entite
-        # / Count comments for this entity
-        nombre_commentaires = CommentaireExtraction.objects.filter(entity=entite).count()
+        # Job + page + dossier + owner en un seul SELECT (lus par _est_proprietaire_dossier),
+        # avec le nombre de commentaires en sous-requete dans ce meme SELECT.
+        # Le fil affiche par _card_body.html est charge en une requete avec ses auteurs.
+        # / Job + page + folder + owner in a single SELECT (read by _est_proprietaire_dossier),
+        # / with the comment count as a subquery in that same SELECT.
+        # / The thread shown by _card_body.html is loaded in one query with its authors.
+        entite = get_object_or_404(
+            ExtractedEntity.objects.select_related("job__page__dossier__owner").annotate(
+                nombre_commentaires=Coalesce(
+                    Subquery(_SOUS_REQUETE_NOMBRE_COMMENTAIRES, output_field=IntegerField()),
+                    0,
+                ),
+            ).prefetch_related(
+                Prefetch(
+                    "commentaires",
+                    queryset=CommentaireExtraction.objects.select_related("user"),
+                ),
+            ),
+            pk=identifiant_entite,
+        )
+        nombre_commentaires = entite.nombre_commentaires
 
         # Determiner si l'utilisateur est proprietaire du dossier
         # / Determine if user is the folder owner
@@ -3582,7 +4386,12 @@ class ExtractionViewSet(viewsets.ViewSet):
             )
 
         donnees = serializer.validated_data
-        entite = get_object_or_404(ExtractedEntity, pk=donnees["entity_id"])
+        # Page + dossier + owner charges avec l'entite pour _est_proprietaire_dossier
+        # / Page + folder + owner loaded with the entity for _est_proprietaire_dossier
+        entite = get_object_or_404(
+            ExtractedEntity.objects.select_related("job__page__dossier__owner"),
+            pk=donnees["entity_id"],
+        )
 
         # Creer le commentaire (le signal Django met statut_debat a "commente")
         # / Create the comment (Django signal sets statut_debat to "commente")
@@ -3592,9 +4401,21 @@ class ExtractionViewSet(viewsets.ViewSet):
             commentaire=donnees["commentaire"],
         )
 
-        # Refresh entite depuis la DB pour avoir le statut_debat synchronise par le signal
-        # / Refresh entity from DB to get statut_debat synchronized by signal
-        entite.refresh_from_db()
+        # Le signal vient de passer statut_debat a "commente" en base : on reporte
+        # la valeur en memoire au lieu de relire l'entite (refresh_from_db).
+        # Le fil (nouveau commentaire inclus) est charge en une requete avec les auteurs.
+        # / The signal just set statut_debat to "commente" in DB: mirror it in memory
+        # / instead of re-reading the entity (refresh_from_db).
+        # / The thread (new comment included) is loaded in one query with authors.
+        entite.statut_debat = "commente"
+        prefetch_related_objects(
+            [entite],
+            Prefetch(
+                "commentaires",
+                queryset=CommentaireExtraction.objects.select_related("user"),
+            ),
+        )
+        entite.nombre_commentaires = len(entite.commentaires.all())
 
         est_proprietaire = _est_proprietaire_dossier(request.user, entite.job.page)
 
@@ -3618,7 +4439,16 @@ class ExtractionViewSet(viewsets.ViewSet):
         if not entity_id or not page_id:
             return HttpResponse("entity_id et page_id requis.", status=400)
 
-        entite_a_supprimer = get_object_or_404(ExtractedEntity, pk=entity_id)
+        # L'existence de commentaires est calculee dans le meme SELECT que l'entite
+        # / Comment existence is computed in the same SELECT as the entity
+        entite_a_supprimer = get_object_or_404(
+            ExtractedEntity.objects.select_related("job__page__dossier__owner").annotate(
+                possede_commentaires=Exists(
+                    CommentaireExtraction.objects.filter(entity=OuterRef("pk")),
+                ),
+            ),
+            pk=entity_id,
+        )
 
         # Verifier permissions / Check permissions
         if not _peut_supprimer_extraction(request.user, entite_a_supprimer):
@@ -3654,7 +4484,7 @@ class ExtractionViewSet(viewsets.ViewSet):
         if not page_id:
             return HttpResponse("page_id requis.", status=400)
 
-        page = get_object_or_404(Page, pk=page_id)
+        page = self._get_page_pour_extraction(page_id)
 
         # Supprimer les entites IA sans commentaires (pas les jobs entiers pour garder celles avec commentaires)
         # / Delete AI entities without comments (not entire jobs, to keep commented ones)
@@ -3685,10 +4515,7 @@ class ExtractionViewSet(viewsets.ViewSet):
 
         html_complet = self._render_panneau_complet_avec_oob(request, page)
         reponse = HttpResponse(html_complet)
-        reponse["HX-Trigger"] = json.dumps({
-            "ouvrirPanneauDroit": True,
-            "showToast": {"message": "Extractions IA supprim\u00e9es"},
-        })
+        reponse["HX-Trigger"] = HX_TRIGGER_EXTRACTIONS_IA_SUPPRIMEES
         return reponse
 
     @action(detail=False, methods=["GET"], url_path="formulaire_promouvoir")
@@ -3703,7 +4530,7 @@ class ExtractionViewSet(viewsets.ViewSet):
         if not page_id:
             return HttpResponse("page_id requis.", status=400)
 
-        page = get_object_or_404(Page, pk=page_id)
+        page = get_object_or_404(Page.objects.defer(*CHAMPS_LOURDS_PAGE), pk=page_id)
         tous_les_analyseurs_actifs = AnalyseurSyntaxique.objects.filter(is_active=True)
 
         return render(request, "front/includes/modale_promouvoir_entrainement.html", {
@@ -3734,15 +4561,19 @@ class ExtractionViewSet(viewsets.ViewSet):
         page_id = serializer.validated_data["page_id"]
         analyseur_id = serializer.validated_data["analyseur_id"]
 
-        page = get_object_or_404(Page, pk=page_id)
+        page = self._get_page_pour_extraction(page_id)
         analyseur = get_object_or_404(AnalyseurSyntaxique, pk=analyseur_id)
 
         # Recupere toutes les entites IA de la page (jobs completed avec ai_model)
         # / Retrieve all AI entities from the page (completed jobs with ai_model)
+        # Seules les colonnes recopiees dans l'exemple sont chargees
+        # / Only the columns copied into the example are loaded
         toutes_les_entites_ia = ExtractedEntity.objects.filter(
             job__page=page,
             job__status="completed",
             job__ai_model__isnull=False,
+        ).only(
+            "extraction_class", "extraction_text", "attributes", "start_char",
         ).order_by("start_char")
 
         if not toutes_les_entites_ia.exists():
@@ -3786,8 +4617,12 @@ class ExtractionViewSet(viewsets.ViewSet):
                     cles_attributs_reference = cles_depuis_reference
 
         # Cree une ExampleExtraction attendue pour chaque entite IA
+        # Parcours en flux (iterator) : les entites ne restent pas toutes en memoire
         # / Create an expected ExampleExtraction for each AI entity
-        for numero_entite, entite in enumerate(toutes_les_entites_ia):
+        # / Streamed traversal (iterator): entities are not all kept in memory
+        nombre_extractions_promues = 0
+        for numero_entite, entite in enumerate(toutes_les_entites_ia.iterator(chunk_size=500)):
+            nombre_extractions_promues += 1
             nouvelle_extraction_attendue = ExampleExtraction.objects.create(
                 example=nouvel_exemple,
                 extraction_class=entite.extraction_class or "",
@@ -3816,7 +4651,7 @@ class ExtractionViewSet(viewsets.ViewSet):
 
         logger.info(
             "promouvoir_entrainement: exemple pk=%d cree avec %d extractions pour analyseur pk=%d",
-            nouvel_exemple.pk, toutes_les_entites_ia.count(), analyseur.pk,
+            nouvel_exemple.pk, nombre_extractions_promues, analyseur.pk,
         )
 
         # Retourne le panneau mis a jour + toast de succes
@@ -3848,25 +4683,21 @@ class ExtractionViewSet(viewsets.ViewSet):
         serializer = ExtractionSerializer(data=request.data)
         if not serializer.is_valid():
             reponse = HttpResponse(status=400)
-            reponse["HX-Trigger"] = json.dumps({
-                "showToast": {"message": "Texte invalide.", "icon": "error"},
-            })
+            reponse["HX-Trigger"] = HX_TRIGGER_TEXTE_INVALIDE
             return reponse
 
         texte_selectionne = serializer.validated_data["text"]
         identifiant_page = serializer.validated_data.get("page_id")
         if not identifiant_page:
             reponse = HttpResponse(status=400)
-            reponse["HX-Trigger"] = json.dumps({
-                "showToast": {"message": "Page introuvable.", "icon": "error"},
-            })
+            reponse["HX-Trigger"] = HX_TRIGGER_PAGE_INTROUVABLE
             return reponse
 
-        page = get_object_or_404(Page, pk=identifiant_page)
+        page = self._get_page_pour_extraction(identifiant_page)
 
         # Verifier que l'IA est activee et qu'un modele est configure
         # / Check that AI is enabled and a model is configured
-        configuration_ia = Configuration.get_solo()
+        configuration_ia = _get_configuration_ia()
         if not configuration_ia.ai_active or not configuration_ia.ai_model:
             reponse = HttpResponse(status=400)
             reponse["HX-Trigger"] = json.dumps({
@@ -3879,14 +4710,11 @@ class ExtractionViewSet(viewsets.ViewSet):
 
         # Recuperer le premier analyseur actif de type "analyser"
         # / Get the first active analyzer of type "analyser"
-        analyseur = AnalyseurSyntaxique.objects.filter(
-            is_active=True, type_analyseur="analyser",
-        ).first()
+        analyseurs_actifs = _get_analyseurs_actifs()
+        analyseur = analyseurs_actifs[0] if analyseurs_actifs else None
         if not analyseur:
             reponse = HttpResponse(status=400)
-            reponse["HX-Trigger"] = json.dumps({
-                "showToast": {"message": "Aucun analyseur actif.", "icon": "error"},
-            })
+            reponse["HX-Trigger"] = HX_TRIGGER_AUCUN_ANALYSEUR_ACTIF
             return reponse
 
         # Construire le prompt et les exemples / Build prompt and examples
@@ -3928,13 +4756,9 @@ class ExtractionViewSet(viewsets.ViewSet):
         # / Calculate the offset of the selected text in text_readability
         # / so extraction positions are relative to the full page
         texte_page_complet = page.text_readability or ""
-        offset_dans_page = texte_page_complet.find(texte_selectionne)
-        if offset_dans_page == -1:
-            # Fallback : essayer avec normalisation des espaces insecables
-            # / Fallback: try with non-breaking space normalization
-            texte_page_normalise = texte_page_complet.replace("\xa0", " ")
-            texte_selectionne_normalise = texte_selectionne.replace("\xa0", " ")
-            offset_dans_page = texte_page_normalise.find(texte_selectionne_normalise)
+        # Recherche exacte puis espace et espace insecable equivalents, sans copie du texte page
+        # / Exact search then space and non-breaking space equivalent, without copying page text
+        offset_dans_page = _trouver_texte_espaces_souples(texte_page_complet, texte_selectionne)
         if offset_dans_page == -1:
             offset_dans_page = 0
 
@@ -4002,7 +4826,16 @@ class ExtractionViewSet(viewsets.ViewSet):
         if not identifiant_entite or not identifiant_page:
             return HttpResponse("entity_id et page_id requis.", status=400)
 
-        entite_a_masquer = get_object_or_404(ExtractedEntity, pk=identifiant_entite)
+        # L'existence de commentaires est calculee dans le meme SELECT que l'entite
+        # / Comment existence is computed in the same SELECT as the entity
+        entite_a_masquer = get_object_or_404(
+            ExtractedEntity.objects.select_related("job__page__dossier__owner").annotate(
+                possede_commentaires=Exists(
+                    CommentaireExtraction.objects.filter(entity=OuterRef("pk")),
+                ),
+            ),
+            pk=identifiant_entite,
+        )
 
         # Verification ownership : seul le proprietaire du dossier peut masquer
         # / Ownership check: only the folder owner can hide
@@ -4012,10 +4845,7 @@ class ExtractionViewSet(viewsets.ViewSet):
 
         # Garde : ne pas masquer une entite qui a des commentaires
         # / Guard: do not hide an entity that has comments
-        nombre_commentaires_entite = CommentaireExtraction.objects.filter(
-            entity=entite_a_masquer,
-        ).count()
-        if nombre_commentaires_entite > 0:
+        if entite_a_masquer.possede_commentaires:
             return HttpResponse(
                 '<p class="text-sm text-red-500">Impossible de masquer : '
                 'cette extraction a des commentaires.</p>',
@@ -4054,7 +4884,10 @@ class ExtractionViewSet(viewsets.ViewSet):
         if not identifiant_entite or not identifiant_page:
             return HttpResponse("entity_id et page_id requis.", status=400)
 
-        entite_a_restaurer = get_object_or_404(ExtractedEntity, pk=identifiant_entite)
+        entite_a_restaurer = get_object_or_404(
+            ExtractedEntity.objects.select_related("job__page__dossier__owner"),
+            pk=identifiant_entite,
+        )
 
         # Verification ownership : seul le proprietaire du dossier peut restaurer
         # / Ownership check: only the folder owner can restore
@@ -4092,7 +4925,7 @@ class ExtractionViewSet(viewsets.ViewSet):
         if not identifiant_page:
             return HttpResponse("page_id requis.", status=400)
 
-        page = get_object_or_404(Page, pk=identifiant_page)
+        page = get_object_or_404(Page.objects.defer(*CHAMPS_LOURDS_PAGE), pk=identifiant_page)
 
         # Calculer l'etat du consensus via le helper / Compute consensus state via helper
         donnees_consensus = _calculer_consensus(page)
@@ -4124,7 +4957,7 @@ class ExtractionViewSet(viewsets.ViewSet):
         if not identifiant_page:
             return HttpResponse("page_id requis.", status=400)
 
-        page = get_object_or_404(Page, pk=identifiant_page)
+        page = get_object_or_404(Page.objects.defer(*CHAMPS_LOURDS_PAGE), pk=identifiant_page)
 
         # Refonte A.6 : plus de drawer "analyse en cours" specifique. Si un job
         # tourne, on nettoie quand meme les jobs bloques (pour que les vues
@@ -4163,24 +4996,29 @@ class ExtractionViewSet(viewsets.ViewSet):
 
         # Recuperer toutes les entites (masquees et non masquees)
         # / Retrieve all entities (hidden and not hidden)
-        tous_les_jobs_termines = ExtractionJob.objects.filter(
+        # Jobs lus une fois (le bandeau en deduit le dernier) ; les requetes suivantes
+        # filtrent sur leurs ids. Le nombre de commentaires est compte sur le fil
+        # prefetche (boucle plus bas) plutot que par JOIN + GROUP BY.
+        # / Jobs read once (the banner derives the latest one); later queries
+        # / filter on their ids. The comment count is taken from the prefetched
+        # / thread (loop below) rather than a JOIN + GROUP BY.
+        tous_les_jobs_termines = list(ExtractionJob.objects.filter(
             page=page, status="completed",
-        )
+        ).select_related("ai_model").defer(*CHAMPS_LOURDS_EXTRACTION_JOB))
+        ids_jobs_termines = [job_termine.pk for job_termine in tous_les_jobs_termines]
         toutes_les_entites = ExtractedEntity.objects.filter(
-            job__in=tous_les_jobs_termines,
+            job_id__in=ids_jobs_termines,
         ).prefetch_related(
             Prefetch(
                 "commentaires",
                 queryset=CommentaireExtraction.objects.select_related("user"),
             ),
-        ).annotate(
-            nombre_commentaires=Count("commentaires"),
         )
 
         # Construire la liste des contributeurs ayant commente ce document (PHASE-26a)
         # / Build the list of contributors who commented on this document (PHASE-26a)
         commentaires_par_contributeur = CommentaireExtraction.objects.filter(
-            entity__job__in=tous_les_jobs_termines,
+            entity__job_id__in=ids_jobs_termines,
         ).values("user__pk", "user__username", "user__first_name").annotate(
             nombre_commentaires=Count("pk"),
         ).order_by("-nombre_commentaires")
@@ -4189,7 +5027,7 @@ class ExtractionViewSet(viewsets.ViewSet):
         # / Count distinct entities per contributor (PHASE-26a UX)
         entites_distinctes_par_contributeur = dict(
             CommentaireExtraction.objects.filter(
-                entity__job__in=tous_les_jobs_termines,
+                entity__job_id__in=ids_jobs_termines,
             ).values("user__pk").annotate(
                 nombre_entites=Count("entity_id", distinct=True),
             ).values_list("user__pk", "nombre_entites")
@@ -4223,7 +5061,7 @@ class ExtractionViewSet(viewsets.ViewSet):
         if ensemble_contributeurs_actifs:
             ids_entites_des_contributeurs = set(
                 CommentaireExtraction.objects.filter(
-                    entity__job__in=tous_les_jobs_termines,
+                    entity__job_id__in=ids_jobs_termines,
                     user_id__in=ensemble_contributeurs_actifs,
                 ).values_list("entity_id", flat=True).distinct()
             )
@@ -4258,6 +5096,7 @@ class ExtractionViewSet(viewsets.ViewSet):
         entites_visibles = []
         entites_masquees = []
         for entite in toutes_les_entites:
+            entite.nombre_commentaires = len(entite.commentaires.all())
             if entite.masquee:
                 entites_masquees.append(entite)
             else:
@@ -4279,7 +5118,9 @@ class ExtractionViewSet(viewsets.ViewSet):
 
         # Recuperer le dernier job termine pour le bandeau resume du drawer
         # / Get the last completed job for the drawer summary banner
-        dernier_job_termine_pour_bandeau = tous_les_jobs_termines.order_by("-created_at").first()
+        dernier_job_termine_pour_bandeau = max(
+            tous_les_jobs_termines, key=lambda job_termine: job_termine.created_at, default=None,
+        )
 
         reponse = render(request, "front/includes/drawer_vue_liste.html", {
             "page": page,
@@ -4336,12 +5177,16 @@ class ImportViewSet(viewsets.ViewSet):
         fichier_uploade = serializer.validated_data["fichier"]
         nom_fichier = fichier_uploade.name
 
-        # Aiguillage : JSON → transcription pre-traitee, audio → async, document → synchrone
-        # / Routing: JSON → pre-processed transcription, audio → async, document → synchronous
+        # Aiguillage : JSON → transcription pre-traitee, audio → async,
+        # PDF/Office → conversion async, texte/Markdown → synchrone
+        # / Routing: JSON → pre-processed transcription, audio → async,
+        # / PDF/Office → async conversion, text/Markdown → synchronous
         if est_fichier_json(nom_fichier):
             return self._importer_fichier_json(request, serializer)
         elif est_fichier_audio(nom_fichier):
             return self._importer_fichier_audio(request, serializer)
+        elif est_conversion_asynchrone(nom_fichier):
+            return self._importer_fichier_document_async(request, serializer)
         else:
             return self._importer_fichier_document(request, serializer)
 
@@ -4354,7 +5199,6 @@ class ImportViewSet(viewsets.ViewSet):
         The JSON must contain a 'segments' key (list of dicts with speaker/start/end/text).
         Stores the full JSON in transcription_raw and generates diarized HTML.
         """
-        import hashlib
         from front.services.transcription_audio import construire_html_diarise
 
         fichier_uploade = serializer.validated_data["fichier"]
@@ -4394,7 +5238,7 @@ class ImportViewSet(viewsets.ViewSet):
         html_diarise, texte_brut = construire_html_diarise(donnees_json)
 
         # Calculer le hash du contenu / Compute content hash
-        hash_contenu = hashlib.sha256(texte_brut.encode("utf-8")).hexdigest()
+        hash_contenu = calculer_content_hash(texte_brut)
 
         # Determiner le titre final et le dossier
         # / Determine final title and folder
@@ -4437,52 +5281,9 @@ class ImportViewSet(viewsets.ViewSet):
 
         # Rendu du partial de lecture + OOB arbre et panneau (meme pattern que document)
         # / Render reading partial + OOB tree and panel (same pattern as document)
-        analyseurs_actifs = AnalyseurSyntaxique.objects.filter(is_active=True, type_analyseur="analyser")
-        ia_active = _get_ia_active()
-        contexte_partage = {
-            "page": page_importee,
-            "html_annote": None,
-            "analyseurs_actifs": analyseurs_actifs,
-            "job": None,
-            "entities": None,
-            "ia_active": ia_active,
-        }
-
-        html_lecture = render_to_string(
-            "front/includes/lecture_principale.html",
-            contexte_partage,
-            request=request,
-        )
-
-        # OOB swap : arbre de dossiers mis a jour
-        # / OOB swap: updated folder tree
-        # OOB swap : arbre via _render_arbre / OOB swap: tree via _render_arbre
-        reponse_arbre = _render_arbre(request)
-        html_arbre_oob = (
-            '<div id="arbre" hx-swap-oob="innerHTML:#arbre">'
-            + reponse_arbre.content.decode()
-            + '</div>'
-        )
-
-        # OOB swap : panneau d'analyse reinitialise
-        # / OOB swap: reset analysis panel
-        html_panneau_oob = render_to_string(
-            "front/includes/panneau_analyse.html",
-            contexte_partage,
-            request=request,
+        return _reponse_lecture_page_importee(
+            request, page_importee, HX_TRIGGER_TRANSCRIPTION_JSON_IMPORTEE,
         )
-        html_panneau_oob = (
-            '<div id="panneau-extractions" hx-swap-oob="innerHTML:#panneau-extractions">'
-            + html_panneau_oob
-            + '</div>'
-        )
-
-        html_complet = html_lecture + html_arbre_oob + html_panneau_oob
-        reponse = HttpResponse(html_complet)
-        reponse["HX-Trigger"] = json.dumps({
-            "showToast": {"message": "Transcription JSON importée"},
-        })
-        return reponse
 
     def _importer_fichier_audio(self, request, serializer):
         """
@@ -4492,7 +5293,6 @@ class ImportViewSet(viewsets.ViewSet):
         launch Celery task, return polling template.
         """
         import os
-        import uuid
         from django.conf import settings
         from core.models import TranscriptionConfig, TranscriptionJob
 
@@ -4504,12 +5304,10 @@ class ImportViewSet(viewsets.ViewSet):
 
         # Sauvegarder le fichier audio dans AUDIO_TEMP_DIR avec un nom unique
         # / Save audio file to AUDIO_TEMP_DIR with a unique name
-        nom_unique = f"{uuid.uuid4().hex}{extension_fichier}"
+        nom_unique = f"{secrets.token_hex(16)}{extension_fichier}"
         chemin_fichier_audio = str(settings.AUDIO_TEMP_DIR / nom_unique)
 
-        with open(chemin_fichier_audio, "wb") as destination:
-            for morceau in fichier_uploade.chunks():
-                destination.write(morceau)
+        _ecrire_fichier_uploade_sur_disque(fichier_uploade, chemin_fichier_audio)
 
         logger.info(
             "import audio: fichier sauvegarde %s (%s)",
@@ -4531,54 +5329,60 @@ class ImportViewSet(viewsets.ViewSet):
         # / Save the audio file in source_file
         fichier_uploade.seek(0)
 
-        # Creer la Page en status "processing" avec un placeholder HTML
-        # / Create Page in "processing" status with a placeholder HTML
-        page_audio = Page.objects.create(
-            source_type="audio",
-            original_filename=nom_fichier,
-            url=None,
-            title=titre_final,
-            html_original="",
-            html_readability='<p class="text-slate-400 italic">Transcription en cours...</p>',
-            text_readability="",
-            content_hash="",
-            status="processing",
-            dossier=dossier_assigne,
-            source_file=fichier_uploade,
-            owner=request.user,
-        )
-
         # Recuperer la config de transcription active (ou None pour mock)
         # / Get active transcription config (or None for mock)
         config_transcription_active = TranscriptionConfig.objects.filter(
             is_active=True,
         ).first()
 
-        # Creer le TranscriptionJob
-        # / Create the TranscriptionJob
-        job_transcription = TranscriptionJob.objects.create(
-            page=page_audio,
-            transcription_config=config_transcription_active,
-            audio_filename=nom_fichier,
-            status="pending",
-        )
+        # L'identifiant Celery est genere avant l'INSERT : le job est cree avec,
+        # sans UPDATE supplementaire apres la mise en file.
+        # / The Celery id is generated before the INSERT: the job is created
+        # / with it, without an extra UPDATE after queuing.
+        identifiant_tache_celery = generer_identifiant_tache_celery()
+
+        # Page et job dans la meme transaction : pas de Page "processing" orpheline
+        # si la creation du job echoue. La tache n'est mise en file qu'apres le commit.
+        # / Page and job in the same transaction: no orphan "processing" Page if
+        # / job creation fails. The task is only queued after the commit.
+        with transaction.atomic():
+            # Creer la Page en status "processing" avec un placeholder HTML
+            # / Create Page in "processing" status with a placeholder HTML
+            page_audio = Page.objects.create(
+                source_type="audio",
+                original_filename=nom_fichier,
+                url=None,
+                title=titre_final,
+                html_original="",
+                html_readability='<p class="text-slate-400 italic">Transcription en cours...</p>',
+                text_readability="",
+                content_hash="",
+                status="processing",
+                dossier=dossier_assigne,
+                source_file=fichier_uploade,
+                owner=request.user,
+            )
+
+            # Creer le TranscriptionJob / Create the TranscriptionJob
+            job_transcription = TranscriptionJob.objects.create(
+                page=page_audio,
+                transcription_config=config_transcription_active,
+                audio_filename=nom_fichier,
+                status="pending",
+                celery_task_id=identifiant_tache_celery,
+            )
 
         # Lancer la tache Celery en arriere-plan
         # / Launch the Celery task in background
-        from front.tasks import transcrire_audio_task
         # Nombre max de locuteurs et langue depuis la config
         # / Max speakers and language from config
         max_locuteurs_config = config_transcription_active.max_speakers if config_transcription_active else 5
         langue_config = config_transcription_active.language if config_transcription_active else "fr"
-        resultat_tache = transcrire_audio_task.delay(
-            job_transcription.pk, chemin_fichier_audio, max_locuteurs_config, langue_config,
+        resultat_tache = transcrire_audio_task.apply_async(
+            args=(job_transcription.pk, chemin_fichier_audio, max_locuteurs_config, langue_config),
+            task_id=identifiant_tache_celery,
         )
 
-        # Stocker l'ID Celery dans le job
-        # / Store Celery ID in the job
-        job_transcription.celery_task_id = resultat_tache.id
-        job_transcription.save(update_fields=["celery_task_id"])
-
         logger.info(
             "import audio: page pk=%s job pk=%s celery_id=%s",
             page_audio.pk, job_transcription.pk, resultat_tache.id,
@@ -4592,25 +5396,115 @@ class ImportViewSet(viewsets.ViewSet):
         # / We only return the OOB tree swap + a toast indicating transcription
         # / has started. The toolbar "tasks" button will notify the user when
         # / transcription completes.
-        reponse_arbre = _render_arbre(request)
-        html_arbre_oob = (
-            '<div id="arbre" hx-swap-oob="innerHTML:#arbre">'
-            + reponse_arbre.content.decode()
-            + '</div>'
-        )
+        html_arbre_oob = _html_arbre_oob(request)
 
         reponse = HttpResponse(html_arbre_oob)
-        reponse["HX-Trigger"] = json.dumps({
-            "showToast": {"message": "Transcription lanc\u00e9e..."},
-        })
+        reponse["HX-Trigger"] = HX_TRIGGER_TRANSCRIPTION_LANCEE
+        return reponse
+
+    def _importer_fichier_document_async(self, request, serializer):
+        """
+        Pipeline d'import asynchrone pour les documents lents a convertir
+        (PDF, DOCX, PPTX, XLSX) : sauvegarde temp, cree la Page en processing,
+        lance convertir_document_task. Le worker web est libere tout de suite
+        au lieu de parser le document (parfois plusieurs minutes).
+        / Async import pipeline for slow-to-convert documents (PDF, DOCX,
+        / PPTX, XLSX): save temp, create Page as processing, launch
+        / convertir_document_task. The web worker is freed immediately instead
+        / of parsing the document (sometimes several minutes).
+        """
+        fichier_uploade = serializer.validated_data["fichier"]
+        titre_personnalise = serializer.validated_data.get("titre", "").strip()
+        dossier_id = serializer.validated_data.get("dossier_id")
+        nom_fichier = fichier_uploade.name
+        extension_fichier = os.path.splitext(nom_fichier)[1].lower()
+
+        # Sauvegarder le document dans IMPORT_TEMP_DIR (partage avec le worker)
+        # / Save the document to IMPORT_TEMP_DIR (shared with the worker)
+        nom_unique = f"{secrets.token_hex(16)}{extension_fichier}"
+        chemin_fichier_document = str(settings.IMPORT_TEMP_DIR / nom_unique)
+        _ecrire_fichier_uploade_sur_disque(fichier_uploade, chemin_fichier_document)
+
+        # Titre provisoire : titre saisi ou nom du fichier. La tache le remplace
+        # par le premier titre du document si aucun titre n'a ete saisi.
+        # / Provisional title: typed title or file name. The task replaces it
+        # / with the document's first heading if no title was typed.
+        titre_provisoire = titre_personnalise or os.path.splitext(nom_fichier)[0]
+        if dossier_id:
+            dossier_assigne = Dossier.objects.filter(pk=dossier_id).first()
+        else:
+            # Auto-classement dans "Mes imports" si pas de dossier specifie
+            # / Auto-classify in "Mes imports" if no folder specified
+            dossier_assigne = _obtenir_ou_creer_dossier_imports(request.user)
+
+        # Sauvegarder le fichier original dans source_file
+        # / Save original file in source_file
+        fichier_uploade.seek(0)
+
+        # Creer la Page en status "processing" avec un placeholder HTML
+        # / Create Page in "processing" status with a placeholder HTML
+        page_importee = Page.objects.create(
+            source_type="file",
+            original_filename=nom_fichier,
+            url=None,
+            title=titre_provisoire,
+            html_original="",
+            html_readability='<p class="text-slate-400 italic">Conversion en cours...</p>',
+            text_readability="",
+            content_hash="",
+            status="processing",
+            dossier=dossier_assigne,
+            source_file=fichier_uploade,
+            owner=request.user,
+        )
+
+        # Lancer la tache Celery en arriere-plan. Si la mise en file echoue
+        # (broker injoignable), la page passe en erreur au lieu de rester en
+        # "processing" pour toujours, et le fichier temporaire est supprime.
+        # / Launch the Celery task in background. If queuing fails (broker
+        # / unreachable), the page goes to error instead of staying
+        # / "processing" forever, and the temporary file is deleted.
+        try:
+            convertir_document_task.delay(
+                page_importee.pk, chemin_fichier_document, nom_fichier,
+                garder_titre=bool(titre_personnalise),
+            )
+        except Exception as erreur_mise_en_file:
+            logger.error(
+                "import fichier: mise en file impossible page pk=%s — %s",
+                page_importee.pk, erreur_mise_en_file, exc_info=True,
+            )
+            page_importee.status = "error"
+            page_importee.error_message = "La conversion n'a pas pu etre lancee (file de taches indisponible)."
+            page_importee.save(update_fields=["status", "error_message"])
+            try:
+                os.unlink(chemin_fichier_document)
+            except OSError:
+                pass
+            reponse = _reponse_lecture_page_importee(request, page_importee, HX_TRIGGER_CONVERSION_NON_LANCEE)
+            reponse["X-Hypostasia-Page-Url"] = f"/lire/{page_importee.pk}/"
+            return reponse
+
+        logger.info(
+            "import fichier: page pk=%s creee depuis '%s' — conversion Celery lancee",
+            page_importee.pk, nom_fichier,
+        )
+
+        # Zone de lecture de la page en conversion (lecture_principale affiche
+        # l'attente, qui interroge /lire/<pk>/ jusqu'a la fin de la tache)
+        # + OOB arbre et panneau, comme pour un import synchrone.
+        # / Reading zone of the page being converted (lecture_principale shows
+        # / the waiting block, which polls /lire/<pk>/ until the task ends)
+        # / + OOB tree and panel, as for a synchronous import.
+        reponse = _reponse_lecture_page_importee(request, page_importee, HX_TRIGGER_CONVERSION_LANCEE)
+        reponse["X-Hypostasia-Page-Url"] = f"/lire/{page_importee.pk}/"
         return reponse
 
     def _importer_fichier_document(self, request, serializer):
         """
-        Pipeline d'import synchrone pour les documents (PDF, DOCX, etc.).
-        / Synchronous import pipeline for documents (PDF, DOCX, etc.).
+        Pipeline d'import synchrone pour les documents rapides a convertir (TXT, Markdown).
+        / Synchronous import pipeline for fast-to-convert documents (TXT, Markdown).
         """
-        import hashlib
         from front.services.conversion_fichiers import convertir_fichier_en_html
 
         fichier_uploade = serializer.validated_data["fichier"]
@@ -4649,7 +5543,7 @@ class ImportViewSet(viewsets.ViewSet):
 
         # Calculer le hash du contenu pour content_hash
         # / Compute content hash
-        hash_contenu = hashlib.sha256(text_readability.encode("utf-8")).hexdigest()
+        hash_contenu = calculer_content_hash(text_readability)
 
         # Sauvegarder le fichier original dans source_file
         # / Save original file in source_file
@@ -4678,57 +5572,13 @@ class ImportViewSet(viewsets.ViewSet):
 
         # Rendu du partial de lecture + OOB arbre et panneau
         # / Render reading partial + OOB tree and panel
-        analyseurs_actifs = AnalyseurSyntaxique.objects.filter(is_active=True, type_analyseur="analyser")
-        ia_active = _get_ia_active()
-        contexte_partage = {
-            "page": page_importee,
-            "html_annote": None,
-            "analyseurs_actifs": analyseurs_actifs,
-            "job": None,
-            "entities": None,
-            "ia_active": ia_active,
-        }
-
-        html_lecture = render_to_string(
-            "front/includes/lecture_principale.html",
-            contexte_partage,
-            request=request,
-        )
-
-        # OOB swap : arbre de dossiers mis a jour
-        # / OOB swap: updated folder tree
-        # OOB swap : arbre via _render_arbre / OOB swap: tree via _render_arbre
-        reponse_arbre = _render_arbre(request)
-        html_arbre_oob = (
-            '<div id="arbre" hx-swap-oob="innerHTML:#arbre">'
-            + reponse_arbre.content.decode()
-            + '</div>'
-        )
-
-        # OOB swap : panneau d'analyse reinitialise
-        # / OOB swap: reset analysis panel
-        html_panneau_oob = render_to_string(
-            "front/includes/panneau_analyse.html",
-            contexte_partage,
-            request=request,
-        )
-        html_panneau_oob = (
-            '<div id="panneau-extractions" hx-swap-oob="innerHTML:#panneau-extractions">'
-            + html_panneau_oob
-            + '</div>'
-        )
-
-        html_complet = html_lecture + html_arbre_oob + html_panneau_oob
-        reponse = HttpResponse(html_complet)
+        reponse = _reponse_lecture_page_importee(request, page_importee, HX_TRIGGER_FICHIER_IMPORTE)
         # Indique au front l'URL a pusher dans l'historique navigateur.
         # L'import est fait via XMLHttpRequest (pas HTMX direct), donc le JS
         # d'import lit ce header et appelle history.pushState manuellement.
         # / Tells the front the URL to push in browser history. Import goes
         # / via XMLHttpRequest, so the JS reads this header and pushState manually.
         reponse["X-Hypostasia-Page-Url"] = f"/lire/{page_importee.pk}/"
-        reponse["HX-Trigger"] = json.dumps({
-            "showToast": {"message": "Fichier import\u00e9"},
-        })
         return reponse
 
     @action(detail=False, methods=["POST"], url_path="previsualiser_audio")
@@ -4743,7 +5593,6 @@ class ImportViewSet(viewsets.ViewSet):
         if refus:
             return refus
         import os
-        import uuid
         from django.conf import settings
         from core.models import TranscriptionConfig
 
@@ -4762,15 +5611,13 @@ class ImportViewSet(viewsets.ViewSet):
 
         # Sauvegarder le fichier audio dans AUDIO_TEMP_DIR avec un nom unique
         # / Save audio file to AUDIO_TEMP_DIR with a unique name
-        nom_unique = f"{uuid.uuid4().hex}{extension_fichier}"
+        nom_unique = f"{secrets.token_hex(16)}{extension_fichier}"
         chemin_fichier_audio = str(settings.AUDIO_TEMP_DIR / nom_unique)
 
-        with open(chemin_fichier_audio, "wb") as destination:
-            for morceau in fichier_uploade.chunks():
-                destination.write(morceau)
+        _ecrire_fichier_uploade_sur_disque(fichier_uploade, chemin_fichier_audio, deplacer=True)
 
-        # Calculer la duree du fichier audio (mutagen + ffprobe fallback)
-        # / Compute audio file duration (mutagen + ffprobe fallback)
+        # Calculer la duree du fichier audio (ffprobe + mutagen fallback)
+        # / Compute audio file duration (ffprobe + mutagen fallback)
         from front.services.transcription_audio import calculer_duree_audio
         duree_secondes = calculer_duree_audio(chemin_fichier_audio)
 
@@ -4801,8 +5648,9 @@ class ImportViewSet(viewsets.ViewSet):
         secondes_restantes = int(duree_secondes % 60)
         duree_formatee = f"{minutes_duree}:{secondes_restantes:02d}"
 
-        # Taille du fichier en Mo / File size in MB
-        taille_fichier_mo = os.path.getsize(chemin_fichier_audio) / (1024 * 1024)
+        # Taille du fichier en Mo, connue de l'upload (pas de stat sur le disque)
+        # / File size in MB, known from the upload (no stat on disk)
+        taille_fichier_mo = fichier_uploade.size / (1024 * 1024)
 
         # Langue par defaut depuis la config / Default language from config
         langue_defaut = config_transcription.language if config_transcription else ""
@@ -4868,57 +5716,61 @@ class ImportViewSet(viewsets.ViewSet):
             # / Auto-classify in "Mes imports" if no folder specified
             dossier_assigne = _obtenir_ou_creer_dossier_imports(request.user)
 
-        # Sauvegarder le fichier audio dans source_file depuis le fichier temp
-        # / Save the audio file in source_file from the temp file
-        from django.core.files.base import File as DjangoFile
-        fichier_audio_pour_source = open(chemin_fichier_audio, "rb")
-        fichier_django_source = DjangoFile(fichier_audio_pour_source, name=nom_fichier_original)
-
-        # Creer la Page en status "processing"
-        # / Create Page in "processing" status
-        page_audio = Page.objects.create(
-            source_type="audio",
-            original_filename=nom_fichier_original,
-            url=None,
-            title=titre_final,
-            html_original="",
-            html_readability='<p class="text-slate-400 italic">Transcription en cours...</p>',
-            text_readability="",
-            content_hash="",
-            status="processing",
-            dossier=dossier_assigne,
-            source_file=fichier_django_source,
-            owner=request.user,
-        )
-        fichier_audio_pour_source.close()
-
         # Recuperer la config de transcription active (ou None pour mock)
         # / Get active transcription config (or None for mock)
         config_transcription_active = TranscriptionConfig.objects.filter(
             is_active=True,
         ).first()
 
-        # Creer le TranscriptionJob
-        # / Create the TranscriptionJob
-        job_transcription = TranscriptionJob.objects.create(
-            page=page_audio,
-            transcription_config=config_transcription_active,
-            audio_filename=nom_fichier_original,
-            status="pending",
-        )
+        # L'identifiant Celery est genere avant l'INSERT : le job est cree avec,
+        # sans UPDATE supplementaire apres la mise en file.
+        # / The Celery id is generated before the INSERT: the job is created
+        # / with it, without an extra UPDATE after queuing.
+        identifiant_tache_celery = generer_identifiant_tache_celery()
+
+        # Sauvegarder le fichier audio dans source_file depuis le fichier temp.
+        # Page et job dans la meme transaction : pas de Page "processing" orpheline
+        # si la creation du job echoue. La tache n'est mise en file qu'apres le commit.
+        # / Save the audio file in source_file from the temp file.
+        # / Page and job in the same transaction: no orphan "processing" Page if
+        # / job creation fails. The task is only queued after the commit.
+        from django.core.files.base import File as DjangoFile
+        with open(chemin_fichier_audio, "rb") as fichier_audio_pour_source, transaction.atomic():
+            fichier_django_source = DjangoFile(fichier_audio_pour_source, name=nom_fichier_original)
+
+            # Creer la Page en status "processing"
+            # / Create Page in "processing" status
+            page_audio = Page.objects.create(
+                source_type="audio",
+                original_filename=nom_fichier_original,
+                url=None,
+                title=titre_final,
+                html_original="",
+                html_readability='<p class="text-slate-400 italic">Transcription en cours...</p>',
+                text_readability="",
+                content_hash="",
+                status="processing",
+                dossier=dossier_assigne,
+                source_file=fichier_django_source,
+                owner=request.user,
+            )
+
+            # Creer le TranscriptionJob / Create the TranscriptionJob
+            job_transcription = TranscriptionJob.objects.create(
+                page=page_audio,
+                transcription_config=config_transcription_active,
+                audio_filename=nom_fichier_original,
+                status="pending",
+                celery_task_id=identifiant_tache_celery,
+            )
 
         # Lancer la tache Celery en arriere-plan
         # / Launch the Celery task in background
-        from front.tasks import transcrire_audio_task
-        resultat_tache = transcrire_audio_task.delay(
-            job_transcription.pk, chemin_fichier_audio, max_locuteurs, langue_audio,
+        resultat_tache = transcrire_audio_task.apply_async(
+            args=(job_transcription.pk, chemin_fichier_audio, max_locuteurs, langue_audio),
+            task_id=identifiant_tache_celery,
         )
 
-        # Stocker l'ID Celery dans le job
-        # / Store Celery ID in the job
-        job_transcription.celery_task_id = resultat_tache.id
-        job_transcription.save(update_fields=["celery_task_id"])
-
         logger.info(
             "confirmer_audio: page pk=%s job pk=%s celery_id=%s",
             page_audio.pk, job_transcription.pk, resultat_tache.id,
@@ -4932,17 +5784,10 @@ class ImportViewSet(viewsets.ViewSet):
         # / We only return the OOB tree swap + a toast indicating transcription
         # / has started. The toolbar "tasks" button will notify the user when
         # / transcription completes.
-        reponse_arbre = _render_arbre(request)
-        html_arbre_oob = (
-            '<div id="arbre" hx-swap-oob="innerHTML:#arbre">'
-            + reponse_arbre.content.decode()
-            + '</div>'
-        )
+        html_arbre_oob = _html_arbre_oob(request)
 
         reponse = HttpResponse(html_arbre_oob)
-        reponse["HX-Trigger"] = json.dumps({
-            "showToast": {"message": "Transcription lancée..."},
-        })
+        reponse["HX-Trigger"] = HX_TRIGGER_TRANSCRIPTION_LANCEE
         return reponse
 
 
@@ -4955,11 +5800,27 @@ class QuestionnaireViewSet(viewsets.ViewSet):
     def _render_questionnaire(self, request, page):
         """
         Helper — rend le partial du questionnaire pour une page.
+        Le template n'utilise que page.pk : les appelants chargent la Page avec
+        only("pk") pour ne pas lire html_original / html_readability / text_readability.
         / Helper — renders the questionnaire partial for a page.
+        / The template only uses page.pk: callers load the Page with only("pk")
+        / so html_original / html_readability / text_readability are not read.
         """
+        # Auteurs des questions et des reponses charges avec elles (le template
+        # affiche user.first_name / username pour chacune) : 2 requetes au total
+        # au lieu d'une par question et par reponse.
+        # / Question and answer authors loaded with them (the template shows
+        # / user.first_name / username for each): 2 queries in total instead
+        # / of one per question and per answer.
         toutes_les_questions = Question.objects.filter(
             page=page,
-        ).prefetch_related("reponses").order_by("-created_at")
+        ).select_related("user").prefetch_related(
+            Prefetch(
+                "reponses",
+                queryset=ReponseQuestion.objects.select_related("user"),
+                to_attr="liste_reponses",
+            ),
+        ).order_by("-created_at")
 
         return render(request, "front/includes/vue_questionnaire.html", {
             "page": page,
@@ -4975,7 +5836,7 @@ class QuestionnaireViewSet(viewsets.ViewSet):
         if not page_id:
             return HttpResponse("page_id requis.", status=400)
 
-        page = get_object_or_404(Page, pk=page_id)
+        page = get_object_or_404(Page.objects.only("pk"), pk=page_id)
         return self._render_questionnaire(request, page)
 
     @action(detail=False, methods=["POST"], url_path="poser_question")
@@ -4996,7 +5857,7 @@ class QuestionnaireViewSet(viewsets.ViewSet):
             )
 
         donnees = serializer.validated_data
-        page = get_object_or_404(Page, pk=donnees["page_id"])
+        page = get_object_or_404(Page.objects.only("pk"), pk=donnees["page_id"])
 
         # Creer la question / Create the question
         Question.objects.create(
@@ -5006,9 +5867,7 @@ class QuestionnaireViewSet(viewsets.ViewSet):
         )
 
         reponse = self._render_questionnaire(request, page)
-        reponse["HX-Trigger"] = json.dumps({
-            "showToast": {"message": "Question ajout\u00e9e"},
-        })
+        reponse["HX-Trigger"] = HX_TRIGGER_QUESTION_AJOUTEE
         return reponse
 
     @action(detail=False, methods=["POST"])
@@ -5029,7 +5888,10 @@ class QuestionnaireViewSet(viewsets.ViewSet):
             )
 
         donnees = serializer.validated_data
-        question = get_object_or_404(Question, pk=donnees["question_id"])
+        question = get_object_or_404(
+            Question.objects.select_related("page").only("page__id"),
+            pk=donnees["question_id"],
+        )
 
         # Creer la reponse / Create the answer
         ReponseQuestion.objects.create(
@@ -5039,7 +5901,5 @@ class QuestionnaireViewSet(viewsets.ViewSet):
         )
 
         reponse_http = self._render_questionnaire(request, question.page)
-        reponse_http["HX-Trigger"] = json.dumps({
-            "showToast": {"message": "R\u00e9ponse ajout\u00e9e"},
-        })
+        reponse_http["HX-Trigger"] = HX_TRIGGER_REPONSE_AJOUTEE
         return reponse_http
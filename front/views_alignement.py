@@ -310,11 +310,14 @@ class AlignementViewSet(viewsets.ViewSet):
                     status=404,
                 )
 
-            toutes_les_pages_du_dossier = list(
-                Page.objects.filter(dossier=dossier).order_by("id")
-            )
-
-            if len(toutes_les_pages_du_dossier) < 2:
+            # Compter en SQL puis ne charger que les 6 premieres pages : les
+            # suivantes (et leurs gros TextField) ne servent qu'au compte.
+            # / Count in SQL then only load the first 6 pages: the others
+            # / (and their large TextFields) are only needed for the count.
+            pages_du_dossier = Page.objects.filter(dossier=dossier).order_by("id")
+            nombre_pages_du_dossier = pages_du_dossier.count()
+
+            if nombre_pages_du_dossier < 2:
                 return None, None, HttpResponse(
                     '<p class="text-red-600 text-sm p-4">Ce dossier contient moins de 2 pages.</p>',
                     status=400,
@@ -322,12 +325,12 @@ class AlignementViewSet(viewsets.ViewSet):
 
             # Limite a 6 pages max, avertit si tronque
             # / Limit to 6 pages max, warn if truncated
-            if len(toutes_les_pages_du_dossier) > 6:
+            if nombre_pages_du_dossier > 6:
                 avertissement = (
-                    f"Le dossier contient {len(toutes_les_pages_du_dossier)} pages, "
+                    f"Le dossier contient {nombre_pages_du_dossier} pages, "
                     "seules les 6 premières sont affichées."
                 )
-                toutes_les_pages_du_dossier = toutes_les_pages_du_dossier[:6]
+            toutes_les_pages_du_dossier = list(pages_du_dossier[:6])
 
             return toutes_les_pages_du_dossier, avertissement, None
 
@@ -7,8 +7,10 @@ ViewSet pour le bouton 'taches en cours' dans la toolbar (refonte A.6).
 
 LOCALISATION : front/views_taches.py
 """
+from django.db.models import Count, Q
 from django.http import HttpResponse
 from django.shortcuts import get_object_or_404, render
+from django.utils.cache import get_conditional_response, patch_cache_control
 from rest_framework import permissions, viewsets
 from rest_framework.decorators import action
 
@@ -16,6 +18,19 @@ from core.models import TranscriptionJob
 from hypostasis_extractor.models import ExtractionJob
 
 
+# Compteurs calcules en une requete par type de job (ExtractionJob, TranscriptionJob)
+# / Counters computed in one query per job type (ExtractionJob, TranscriptionJob)
+_COMPTEURS_ETAT_BOUTON = {
+    "nombre_en_cours": Count("pk", filter=Q(status__in=["pending", "processing"])),
+    "nombre_non_lues": Count(
+        "pk", filter=Q(status__in=["completed", "failed"], notification_lue=False),
+    ),
+    "nombre_erreurs_non_lues": Count(
+        "pk", filter=Q(status="failed", notification_lue=False),
+    ),
+}
+
+
 def _calculer_etat_bouton(user):
     """
     Calcule l'etat du bouton + les compteurs pour un utilisateur.
@@ -25,27 +40,26 @@ def _calculer_etat_bouton(user):
 
     LOCALISATION : front/views_taches.py
     """
+    # Un seul SELECT agrege par type de job (Count conditionnels) au lieu de
+    # trois requetes (en cours, non lues, erreurs non lues) par type.
+    # / A single aggregated SELECT per job type (conditional Counts) instead of
+    # / three queries (in progress, unread, unread errors) per type.
+    compteurs_extractions = ExtractionJob.objects.filter(page__owner=user).aggregate(
+        **_COMPTEURS_ETAT_BOUTON,
+    )
+    compteurs_transcriptions = TranscriptionJob.objects.filter(page__owner=user).aggregate(
+        **_COMPTEURS_ETAT_BOUTON,
+    )
+
     # Comptage taches en cours / Count tasks in progress
-    nombre_extractions_en_cours = ExtractionJob.objects.filter(
-        page__owner=user, status__in=["pending", "processing"],
-    ).count()
-    nombre_transcriptions_en_cours = TranscriptionJob.objects.filter(
-        page__owner=user, status__in=["pending", "processing"],
-    ).count()
-    nombre_en_cours = nombre_extractions_en_cours + nombre_transcriptions_en_cours
+    nombre_en_cours = (
+        compteurs_extractions["nombre_en_cours"] + compteurs_transcriptions["nombre_en_cours"]
+    )
 
     # Comptage taches terminees non lues / Count finished unread tasks
-    nombre_extractions_non_lues = ExtractionJob.objects.filter(
-        page__owner=user,
-        status__in=["completed", "failed"],
-        notification_lue=False,
-    ).count()
-    nombre_transcriptions_non_lues = TranscriptionJob.objects.filter(
-        page__owner=user,
-        status__in=["completed", "failed"],
-        notification_lue=False,
-    ).count()
-    nombre_non_lues = nombre_extractions_non_lues + nombre_transcriptions_non_lues
+    nombre_non_lues = (
+        compteurs_extractions["nombre_non_lues"] + compteurs_transcriptions["nombre_non_lues"]
+    )
 
     # Etat dominant : priorite erreur > en_cours > succes > neutre
     # On veut voir 'en_cours' pendant qu'une tache tourne, meme s'il y a
@@ -55,11 +69,10 @@ def _calculer_etat_bouton(user):
     # / We want to see 'en_cours' while a task is running, even if there
     # / are unread old notifications (don't mask them but defer to end of
     # / current task).
-    a_des_erreurs_non_lues = ExtractionJob.objects.filter(
-        page__owner=user, status="failed", notification_lue=False,
-    ).exists() or TranscriptionJob.objects.filter(
-        page__owner=user, status="failed", notification_lue=False,
-    ).exists()
+    a_des_erreurs_non_lues = (
+        compteurs_extractions["nombre_erreurs_non_lues"] > 0
+        or compteurs_transcriptions["nombre_erreurs_non_lues"] > 0
+    )
 
     if a_des_erreurs_non_lues:
         etat = "erreur"
@@ -92,9 +105,28 @@ class TachesViewSet(viewsets.ViewSet):
         Renvoie le HTML du bouton avec son etat actuel (compteur, couleur).
         Appele en reaction a un message WS (via JS dans hypostasia.js).
         / Returns button HTML with current state.
+
+        Le HTML ne depend que des compteurs et de l'etat : ils forment l'ETag.
+        Si le navigateur renvoie le meme (If-None-Match), on repond 304 sans
+        rendre le template. / The HTML only depends on the counters and state:
+        they form the ETag. If the browser sends it back, answer 304 without
+        rendering the template.
         """
         contexte = _calculer_etat_bouton(request.user)
-        return render(request, "front/includes/taches_bouton.html", contexte)
+        etag_bouton = (
+            f'"taches-{contexte["etat"]}-{contexte["nombre_en_cours"]}'
+            f'-{contexte["nombre_non_lues"]}"'
+        )
+        reponse_non_modifiee = get_conditional_response(request, etag=etag_bouton)
+        if reponse_non_modifiee is not None:
+            return reponse_non_modifiee
+
+        reponse = render(request, "front/includes/taches_bouton.html", contexte)
+        reponse["ETag"] = etag_bouton
+        # Revalidation a chaque appel, jamais en cache partage (etat par utilisateur)
+        # / Revalidate on every call, never in a shared cache (per-user state)
+        patch_cache_control(reponse, private=True, no_cache=True)
+        return reponse
 
     @action(detail=False, methods=["GET"])
     def dropdown(self, request):
@@ -78,6 +78,9 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    # Memo par requete de la configuration IA et des analyseurs actifs
+    # / Per-request memo of the AI configuration and active analyzers
+    'front.middleware.MemoParRequeteMiddleware',
 ]
 
 ROOT_URLCONF = 'hypostasia.urls'
@@ -114,6 +117,14 @@ DATABASES = {
         "PASSWORD": os.environ.get("POSTGRES_PASSWORD", "hypostasia_dev"),
         "HOST": os.environ.get("POSTGRES_HOST", "localhost"),
         "PORT": os.environ.get("POSTGRES_PORT", "5432"),
+        # Connexions persistantes : les partials HTMX font peu de requetes SQL,
+        # l'ouverture d'une connexion par requete HTTP pesait autant qu'elles.
+        # Le health check ecarte une connexion coupee (redemarrage Postgres).
+        # / Persistent connections: HTMX partials run few SQL queries, opening a
+        # / connection per HTTP request cost as much as the queries themselves.
+        # / The health check discards a dropped connection (Postgres restart).
+        "CONN_MAX_AGE": int(os.environ.get("POSTGRES_CONN_MAX_AGE", "600")),
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
@@ -185,6 +196,28 @@ MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / "media"
 
 
+# =============================================================================
+# Caches — "default" : petites valeurs derivees du contenu (comptes de tokens).
+# "html_annote" : HTML annote de la lecture, cache dedie et borne (par processus)
+# pour qu'une bibliotheque de gros documents ne gonfle pas chaque worker.
+# / Caches — "default": small content-derived values (token counts).
+# / "html_annote": annotated reading HTML, a dedicated bounded cache (per
+# / process) so a library of large documents does not bloat every worker.
+# =============================================================================
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "html_annote": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "html-annote",
+        "TIMEOUT": 600,
+        "OPTIONS": {"MAX_ENTRIES": 32},
+    },
+}
+
+
 # =============================================================================
 # Celery — Redis partout (dev, prod, boitier offline)
 # / Celery — Redis everywhere (dev, prod, offline box)
@@ -254,6 +287,11 @@ SITE_URL = os.environ.get("SITE_URL", "http://localhost:8123")
 AUDIO_TEMP_DIR = BASE_DIR / "tmp" / "audio"
 AUDIO_TEMP_DIR.mkdir(parents=True, exist_ok=True)
 
+# Documents en attente de conversion par le worker Celery
+# / Documents waiting for conversion by the Celery worker
+IMPORT_TEMP_DIR = BASE_DIR / "tmp" / "imports"
+IMPORT_TEMP_DIR.mkdir(parents=True, exist_ok=True)
+
 
 # =============================================================================
 # Logging — verbeux en console + fichier parsable par Claude Code
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.2 on 2026-10-17 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hypostasis_extractor', '0030_a8_alter_statut_debat_choices'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='extractionjob',
+            index=models.Index(fields=['page', 'status', '-created_at'], name='extjob_page_status_created_idx'),
+        ),
+    ]
@@ -103,6 +103,16 @@ class ExtractionJob(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Jobs d'une page par statut, du plus recent au plus ancien : lecture,
+            # panneau et drawer filtrent page_id + status et trient par -created_at.
+            # / A page's jobs by status, newest first: reading view, panel and
+            # / drawer filter on page_id + status and sort by -created_at.
+            models.Index(
+                fields=["page", "status", "-created_at"],
+                name="extjob_page_status_created_idx",
+            ),
+        ]
 
     def __str__(self):
         url_page = (self.page.url or "")[:50] if self.page else "page supprimée"